@@ -0,0 +1,128 @@
+"""
+Batch analysis of saved positions.
+
+Takes directories, files or glob patterns of positions saved in the
+board_position.txt format (see core.save_board_state) and writes one JSON
+line per position: the legal moves of every piece, and per color the
+mobility (number of moves) and the number of those moves that capture.
+Saved positions do not record the side to move or an en passant target, so
+both colors are analysed and en passant is left out. Without --size the
+board size is inferred as the smallest board holding every piece (at least
+MIN_BOARD_SIZE), and the line is marked with "inferred_size": true. Pawn
+start rows and ray lengths depend on the size, so pass --size when the
+positions were saved on a larger board. A size outside
+MIN_BOARD_SIZE..MAX_BOARD_SIZE, given or inferred, gives an error line, and
+pieces that do not fit on the board are left out and counted in "off_board".
+
+Positions are spread over a process pool in chunks of files. Each worker
+imports only the headless core and reads its files itself, and results are
+written as they arrive, in input order.
+
+    python analyze.py positions/                    # every .txt file in the directory
+    python analyze.py 'games/**/*.txt' --workers 4 --output analysis.jsonl
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from core import MAX_BOARD_SIZE, MIN_BOARD_SIZE, legal_targets, load_board_state, new_board
+from parallel import TASKS_PER_WORKER, default_workers
+
+POSITION_PATTERN = "*.txt"  # Files picked up from a directory argument
+
+
+def find_position_files(paths):
+    """Expand directories and glob patterns into a sorted list of position files, without duplicates."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, POSITION_PATTERN))))
+        elif glob.has_magic(path):
+            files.extend(sorted(glob.glob(path, recursive=True)))
+        else:
+            files.append(path)
+    return list(dict.fromkeys(files))
+
+
+def analyze_position(filename, board_size=None, use_bitboard=False):
+    """Analyse one saved position; returns its result document."""
+    if not os.path.exists(filename):
+        # load_board_state reads a missing file as an empty position
+        return {'file': filename, 'error': "FileNotFoundError: no such file"}
+    try:
+        pieces = dict(load_board_state(filename))
+        inferred_size = board_size is None
+        if inferred_size:
+            board_size = max((max(pos) + 1 for pos in pieces), default=MIN_BOARD_SIZE)
+            board_size = max(board_size, MIN_BOARD_SIZE)
+        if not MIN_BOARD_SIZE <= board_size <= MAX_BOARD_SIZE:
+            raise ValueError(f"board size {board_size} outside {MIN_BOARD_SIZE}..{MAX_BOARD_SIZE}")
+        board = new_board(board_size, pieces, use_bitboard)
+        squares = {}
+        mobility = {'White': 0, 'Black': 0}
+        captures = {'White': 0, 'Black': 0}
+        for square in list(board):
+            color = board.color_at(square)
+            targets = legal_targets(board, square, board.en_passant_target)
+            squares[f"{square[0]},{square[1]}"] = [list(move) for move in targets]
+            mobility[color] += len(targets)
+            captures[color] += sum(targets.values())
+    except Exception as e:  # Report broken files without losing the whole run
+        return {'file': filename, 'error': f"{type(e).__name__}: {e}"}
+    return {
+        'file': filename,
+        'size': board_size,
+        'inferred_size': inferred_size,
+        'pieces': len(board),
+        'off_board': len(pieces) - len(board),  # Dropped by new_board
+        'mobility': mobility,
+        'captures': captures,
+        'squares': squares,
+    }
+
+
+def analyze_files(files, board_size=None, use_bitboard=False, workers=None, chunksize=None):
+    """Yield the result of each file in order, analysing them in workers processes."""
+    analyze = partial(analyze_position, board_size=board_size, use_bitboard=use_bitboard)
+    workers = workers or default_workers()
+    if workers == 1 or len(files) < 2:
+        yield from map(analyze, files)
+        return
+    chunksize = chunksize or max(1, len(files) // (workers * TASKS_PER_WORKER))
+    with ProcessPoolExecutor(workers) as pool:
+        yield from pool.map(analyze, files, chunksize=chunksize)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyse saved positions and write JSON lines.")
+    parser.add_argument('paths', nargs='+', help="position files, directories or glob patterns")
+    parser.add_argument('--size', type=int, help="board size (default: smallest holding every piece)")
+    parser.add_argument('--bitboard', action='store_true', help="use the BitBoard backend")
+    parser.add_argument('--workers', type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument('--chunksize', type=int, help="files sent to a worker at a time")
+    parser.add_argument('--output', help="JSONL file to write (default: standard output)")
+    args = parser.parse_args(argv)
+
+    files = find_position_files(args.paths)
+    if not files:
+        print("No position files found", file=sys.stderr)
+        return 1
+    errors = 0
+    out = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        for result in analyze_files(files, args.size, args.bitboard, args.workers, args.chunksize):
+            errors += 'error' in result
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
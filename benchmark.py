@@ -0,0 +1,207 @@
+"""
+Move-generation benchmark for the chess visualizer.
+
+For every piece type in AVAILABLE_PIECES, on a range of board sizes and piece
+densities, this times Piece.get_legal_moves_with_info and the filter that
+matches the piece's movement rules (the same dispatch the GUI uses, see
+movegen.filter_rays). The piece stands on the center square. Timings are the
+best of several warm runs, so the per-piece ray tables are already built.
+
+Results are written as JSON and can be stored as a baseline; later runs are
+compared against it and fail when a case got slower than the threshold.
+
+    python benchmark.py                                # full run
+    python benchmark.py --sizes 8 36 --densities empty --pieces Queen Hook_Mover
+    python benchmark.py --save-baseline                # store this run as the baseline
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from core import new_board
+from movegen import filter_rays
+from pieces import AVAILABLE_PIECES, create_piece, get_piece_rank
+from presets import get_preset
+
+BENCHMARK_SIZES = (8, 12, 36, 100, 300)
+BENCHMARK_DENSITIES = ('empty', 'preset', 'random')
+RANDOM_DENSITY = 0.3
+REPEAT = 3
+RESULTS_FILE = "benchmark_results.json"
+BASELINE_FILE = "benchmark_baseline.json"
+REGRESSION_THRESHOLD = 0.25  # Relative slowdown against the baseline that fails the run
+REGRESSION_NOISE_FLOOR = 20e-6  # Slowdowns smaller than this many seconds are ignored
+
+
+def piece_types():
+    """Every piece type in AVAILABLE_PIECES, in first-seen order."""
+    types = {}
+    for piece_key in AVAILABLE_PIECES:
+        types.setdefault(piece_key.split('_', 1)[1], None)
+    return list(types)
+
+
+def build_board(board_size, density, seed=0, use_bitboard=False):
+    """Create the surrounding position for a board size and density."""
+    if density == 'preset':
+        pieces = get_preset('standard', board_size)['pieces']
+    elif density == 'random':
+        rng = random.Random(seed)
+        piece_keys = list(AVAILABLE_PIECES)
+        pieces = {(row, col): rng.choice(piece_keys)
+                  for row in range(board_size) for col in range(board_size)
+                  if rng.random() < RANDOM_DENSITY}
+    elif density == 'empty':
+        pieces = None
+    else:
+        raise ValueError(f"Unknown density: {density}")
+    return new_board(board_size, pieces, use_bitboard)
+
+
+def best_time(func, repeat):
+    """Best wall time of func over repeat runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_piece(board, piece_type, repeat=REPEAT):
+    """Time move generation and filtering for a white piece on the center square."""
+    board_size = board.board_size
+    square = (board_size // 2, board_size // 2)
+    piece_key = f"White_{piece_type}"
+    rank = get_piece_rank(piece_key)
+    piece = create_piece(piece_type, 'White', rank)
+
+    previous = board.get(square)
+    board[square] = (piece_key, rank)
+    try:
+        def generate():
+            return piece.get_legal_moves_with_info(square, board_size)
+
+        def filter_moves():
+            rays = piece.get_rays(square, board_size)
+            return filter_rays(board, square, 'White', piece_type, rank, rays)
+
+        moves = filter_moves()  # Warm-up, also builds the ray table for this size
+        generate()
+        return {
+            'generate': best_time(generate, repeat),
+            'filter': best_time(filter_moves, repeat),
+            'moves': len(moves),
+        }
+    finally:
+        if previous is None:
+            del board[square]
+        else:
+            board[square] = previous
+
+
+def case_key(piece_type, board_size, density):
+    return f"{piece_type}@{board_size}/{density}"
+
+
+def run_benchmark(sizes=BENCHMARK_SIZES, densities=BENCHMARK_DENSITIES, pieces=None,
+                  repeat=REPEAT, seed=0, use_bitboard=False, progress=None):
+    """Time every piece type on every size and density. Returns the results document."""
+    pieces = pieces or piece_types()
+    results = {}
+    for board_size in sizes:
+        for density in densities:
+            board = build_board(board_size, density, seed, use_bitboard)
+            for piece_type in pieces:
+                try:
+                    timing = time_piece(board, piece_type, repeat)
+                except Exception as e:  # Report broken pieces without losing the whole run
+                    timing = {'error': f"{type(e).__name__}: {e}"}
+                results[case_key(piece_type, board_size, density)] = timing
+            if progress:
+                progress(f"size {board_size:>3} {density:<7} done")
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'backend': 'bitboard' if use_bitboard else 'board',
+            'repeat': repeat,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def total_time(timing):
+    return timing['generate'] + timing['filter']
+
+
+def find_regressions(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """List (case, baseline seconds, current seconds) for cases slower than the baseline by more
+    than threshold, ignoring differences below the noise floor."""
+    regressions = []
+    for key, timing in results['results'].items():
+        before = baseline['results'].get(key)
+        if before is None or 'error' in timing or 'error' in before:
+            continue
+        old, new = total_time(before), total_time(timing)
+        if new > old * (1 + threshold) and new - old > REGRESSION_NOISE_FLOOR:
+            regressions.append((key, old, new))
+    return sorted(regressions, key=lambda item: item[2] / item[1], reverse=True)
+
+
+def print_report(results, slowest=20):
+    timed = [(key, timing) for key, timing in results['results'].items() if 'error' not in timing]
+    timed.sort(key=lambda item: total_time(item[1]), reverse=True)
+    print(f"{'case':<40}{'generate':>12}{'filter':>12}{'moves':>8}")
+    for key, timing in timed[:slowest]:
+        print(f"{key:<40}{timing['generate'] * 1e3:10.3f}ms{timing['filter'] * 1e3:10.3f}ms{timing['moves']:8}")
+    for key, timing in results['results'].items():
+        if 'error' in timing:
+            print(f"{key:<40}  {timing['error']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark move generation for every piece type.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(BENCHMARK_SIZES))
+    parser.add_argument('--densities', nargs='+', choices=BENCHMARK_DENSITIES, default=list(BENCHMARK_DENSITIES))
+    parser.add_argument('--pieces', nargs='+', help="piece types to time (default: all)")
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--seed', type=int, default=0, help="seed for the random density")
+    parser.add_argument('--bitboard', action='store_true', help="use the BitBoard backend")
+    parser.add_argument('--output', default=RESULTS_FILE)
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument('--save-baseline', action='store_true', help="store this run as the baseline")
+    parser.add_argument('--slowest', type=int, default=20, help="number of slowest cases to print")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.sizes, args.densities, args.pieces, args.repeat, args.seed,
+                            args.bitboard, progress=print)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=1)
+    print_report(results, args.slowest)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=1)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to store one")
+        return 0
+    regressions = find_regressions(results, baseline, args.threshold)
+    for key, old, new in regressions:
+        print(f"REGRESSION {key}: {old * 1e3:.3f}ms -> {new * 1e3:.3f}ms ({new / old:.2f}x)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Optional big-integer bitboard backend for the chess visualizer.
+
+Square (row, col) maps to bit row * board_size + col of a Python int, so one
+int holds the occupancy of any N x N board up to MAX_BOARD_SIZE. BitBoard
+extends the array-backed Board, so it still behaves like the board dict, and
+keeps per-color and per-rank occupancy masks in sync so that path checks
+and sliding attacks become a handful of shift/mask operations.
+"""
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from board import Board, PIECE_COLORS, PIECE_RANKS
+
+
+@lru_cache(maxsize=4096)
+def _line_mask(step: int, length: int) -> int:
+    """Bits 0, step, 2*step, ... for length squares (a geometric series in base 2**step)."""
+    if length <= 0:
+        return 0
+    return ((1 << (step * length)) - 1) // ((1 << step) - 1)
+
+
+def _sign(value: int) -> int:
+    return (value > 0) - (value < 0)
+
+
+class BitBoard(Board):
+    def __init__(self, board_size: int, pieces: Dict[Tuple[int, int], Tuple[str, int]] = None):
+        self.occupied = 0
+        self.color_masks = {}  # 'White'/'Black' -> mask
+        self.rank_masks = {}   # numerical rank -> mask
+        super().__init__(board_size, pieces)
+
+    # Keep the masks in sync with the squares array
+    def __setitem__(self, pos, board_entry):
+        if pos in self:
+            del self[pos]
+        super().__setitem__(pos, board_entry)
+        code = self.squares[self._index(pos)]
+        bit = 1 << self._index(pos)
+        color = PIECE_COLORS[code]
+        rank = PIECE_RANKS[code]
+        self.occupied |= bit
+        self.color_masks[color] = self.color_masks.get(color, 0) | bit
+        self.rank_masks[rank] = self.rank_masks.get(rank, 0) | bit
+
+    def __delitem__(self, pos):
+        code = self.code_at(pos)
+        super().__delitem__(pos)
+        clear = ~(1 << self._index(pos))
+        self.occupied &= clear
+        self.color_masks[PIECE_COLORS[code]] &= clear
+        self.rank_masks[PIECE_RANKS[code]] &= clear
+
+    def copy(self) -> 'BitBoard':
+        board = super().copy()
+        board.color_masks = dict(self.color_masks)
+        board.rank_masks = dict(self.rank_masks)
+        return board
+
+    def _ray_mask(self, index: int, step: int, length: int) -> int:
+        """Mask of the length squares after index along step (step may be negative)."""
+        if step > 0:
+            return _line_mask(step, length) << (index + step)
+        return _line_mask(-step, length) << (index + step * length)
+
+    def _between_mask(self, start: Tuple[int, int], end: Tuple[int, int]) -> int:
+        """Mask of the squares strictly between two squares on a shared line."""
+        row_delta = end[0] - start[0]
+        col_delta = end[1] - start[1]
+        distance = max(abs(row_delta), abs(col_delta))
+        step = _sign(row_delta) * self.board_size + _sign(col_delta)
+        return self._ray_mask(self._index(start), step, distance - 1)
+
+    @staticmethod
+    def _on_line(start: Tuple[int, int], end: Tuple[int, int]) -> bool:
+        row_delta = end[0] - start[0]
+        col_delta = end[1] - start[1]
+        return row_delta == 0 or col_delta == 0 or abs(row_delta) == abs(col_delta)
+
+    def is_path_clear(self, start: Tuple[int, int], end: Tuple[int, int]) -> bool:
+        """Check if the path between two squares is clear of pieces."""
+        if not self._on_line(start, end):
+            # Off-line targets have no mask; walk them like the array board does
+            return super().is_path_clear(start, end)
+        return not (self.occupied & self._between_mask(start, end))
+
+    def is_path_clear_for_rank(self, start: Tuple[int, int], end: Tuple[int, int], piece_rank: int) -> bool:
+        """Check if the path is clear of pieces ranked at or above piece_rank."""
+        blockers = 0
+        for rank, mask in self.rank_masks.items():
+            if rank >= piece_rank:
+                blockers |= mask
+        if not self._on_line(start, end):
+            return super().is_path_clear_for_rank(start, end, piece_rank)
+        return not (blockers & self._between_mask(start, end))
+
+    def sliding_targets(self, square: Tuple[int, int], squares: Tuple[Tuple[int, int], ...]) -> int:
+        """Walk a unit-step ray with one mask operation."""
+        index = self._index(square)
+        step = self._index(squares[0]) - index
+        blockers = self.occupied & self._ray_mask(index, step, len(squares))
+        if not blockers:
+            return len(squares)
+        if step > 0:
+            blocker = (blockers & -blockers).bit_length() - 1
+            return (blocker - index) // step - 1
+        blocker = blockers.bit_length() - 1
+        return (index - blocker) // -step - 1
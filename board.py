@@ -0,0 +1,284 @@
+"""
+Array-backed board storage for the chess visualizer.
+
+A Board keeps its squares in a flat array of small integer piece codes
+(0 = empty). Color, type and rank come from per-code lookup tables instead of
+being split out of the piece key on every access. Board also behaves like the
+original board dict of (row, col) -> (piece_key, rank) entries, so presets,
+drawing and save/load keep working unchanged.
+
+Moves are played with make_move and taken back with unmake_move. Each move
+pushes a small UndoRecord onto the board's undo stack, so search and perft
+can walk positions in place instead of copying the board. The board also
+keeps a Zobrist hash of its pieces up to date, see zobrist_hash.
+
+to_bytes and from_bytes encode a position compactly, for sending boards to
+worker processes.
+"""
+import struct
+from bisect import bisect_left, insort
+from array import array
+from collections.abc import MutableMapping
+from itertools import count
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from pieces import AVAILABLE_PIECES, get_piece_rank
+from zobrist import BLACK_TO_MOVE, en_passant_key, piece_key as zobrist_piece_key
+
+EMPTY = 0
+
+# Per-code lookup tables, indexed by piece code (code 0 is the empty square)
+PIECE_ENTRIES = [None]  # (piece_key, rank) board entries
+PIECE_COLORS = [None]
+PIECE_TYPES = [None]
+PIECE_RANKS = [0]
+_PIECE_CODES = {}  # (piece_key, rank) -> code
+
+# Board versions are drawn from one counter, so they never repeat across boards
+_board_versions = count(1)
+
+# to_bytes layout: this header, the board entries used as "piece_key rank" lines,
+# then an (index, entry number) pair per piece in square order
+_BYTES_HEADER = struct.Struct('<H?hhII')  # Size, white to move, en passant row/col, entries length, pieces
+_BYTES_PIECE = struct.Struct('<IH')
+
+
+def piece_code(piece_key: str, rank: Optional[int] = None) -> int:
+    """Get the code for a board entry, registering it on first use."""
+    if rank is None:
+        rank = get_piece_rank(piece_key)
+    entry = (piece_key, rank)
+    code = _PIECE_CODES.get(entry)
+    if code is None:
+        color, _, piece_type = piece_key.partition('_')
+        code = len(PIECE_ENTRIES)
+        PIECE_ENTRIES.append(entry)
+        PIECE_COLORS.append(color)
+        PIECE_TYPES.append(piece_type)
+        PIECE_RANKS.append(rank)
+        _PIECE_CODES[entry] = code
+    return code
+
+
+# Register every known piece with its default rank, so codes are stable across runs
+for _piece_key in AVAILABLE_PIECES:
+    piece_code(_piece_key)
+
+
+class UndoRecord(NamedTuple):
+    start: Tuple[int, int]
+    end: Tuple[int, int]
+    moved: int  # Piece code of the moving piece
+    captured_square: Tuple[int, int]  # Differs from end for en passant
+    captured: int  # Piece code of the captured piece, EMPTY if none
+    en_passant_target: Optional[Tuple[int, int]]  # State before the move
+    is_white_turn: bool
+    position_hash: int  # zobrist_hash before the move, for repetition detection
+
+
+class Board(MutableMapping):
+    def __init__(self, board_size: int, pieces: Dict[Tuple[int, int], Tuple[str, int]] = None):
+        self.board_size = board_size
+        self.squares = array('H', bytes(2 * board_size * board_size))
+        # Occupied squares in square order, so unmake_move restores the iteration order exactly
+        self._positions = []
+        self.version = next(_board_versions)  # Changes on every mutation
+        self.is_white_turn = True
+        self.en_passant_target = None  # Square a pawn skipped with its last two-square move
+        self.undo_stack = []  # UndoRecords of the moves played with make_move
+        self.pieces_hash = 0  # XOR of the Zobrist keys of all pieces
+        if pieces:
+            for pos, board_entry in pieces.items():
+                self[pos] = board_entry
+
+    def _index(self, pos: Tuple[int, int]) -> int:
+        row, col = pos
+        if 0 <= row < self.board_size and 0 <= col < self.board_size:
+            return row * self.board_size + col
+        raise KeyError(pos)
+
+    # Mapping interface
+    def __getitem__(self, pos):
+        code = self.squares[self._index(pos)]
+        if not code:
+            raise KeyError(pos)
+        return PIECE_ENTRIES[code]
+
+    def __setitem__(self, pos, board_entry):
+        index = self._index(pos)
+        old_code = self.squares[index]
+        if old_code:
+            self.pieces_hash ^= zobrist_piece_key(pos, old_code)
+        else:
+            insort(self._positions, pos)
+        code = piece_code(*board_entry)
+        self.squares[index] = code
+        self.pieces_hash ^= zobrist_piece_key(pos, code)
+        self.version = next(_board_versions)
+
+    def __delitem__(self, pos):
+        index = self._index(pos)
+        code = self.squares[index]
+        if not code:
+            raise KeyError(pos)
+        self.squares[index] = EMPTY
+        del self._positions[bisect_left(self._positions, pos)]
+        self.pieces_hash ^= zobrist_piece_key(pos, code)
+        self.version = next(_board_versions)
+
+    def __iter__(self):
+        return iter(self._positions)
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __contains__(self, pos):
+        return self.code_at(pos) != EMPTY
+
+    def get(self, pos, default=None):
+        code = self.code_at(pos)
+        return PIECE_ENTRIES[code] if code else default
+
+    def copy(self) -> 'Board':
+        """Independent copy of the board, with a version of its own."""
+        board = self.__class__.__new__(self.__class__)
+        board.__dict__.update(self.__dict__)
+        board.squares = array('H', self.squares)
+        board._positions = list(self._positions)
+        board.undo_stack = list(self.undo_stack)
+        board.version = next(_board_versions)
+        return board
+
+    def to_bytes(self) -> bytes:
+        """Encode the pieces, the side to move and the en passant target (not the undo stack).
+        Piece codes are replaced by the board entries, as codes differ between processes."""
+        numbers = {}  # Piece code -> entry number, from 1
+        pieces = bytearray()
+        for pos in self._positions:
+            code = self.squares[self._index(pos)]
+            number = numbers.setdefault(code, len(numbers) + 1)
+            pieces += _BYTES_PIECE.pack(self._index(pos), number)
+        entries = '\n'.join(f"{PIECE_ENTRIES[code][0]} {PIECE_ENTRIES[code][1]}" for code in numbers).encode()
+        ep_row, ep_col = self.en_passant_target if self.en_passant_target is not None else (-1, -1)
+        header = _BYTES_HEADER.pack(self.board_size, self.is_white_turn, ep_row, ep_col,
+                                    len(entries), len(self._positions))
+        return header + entries + bytes(pieces)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Board':
+        """Decode a board written by to_bytes."""
+        board_size, is_white_turn, ep_row, ep_col, entries_length, piece_count = _BYTES_HEADER.unpack_from(data)
+        offset = _BYTES_HEADER.size
+        entries = [None]
+        if entries_length:
+            for line in data[offset:offset + entries_length].decode().split('\n'):
+                piece_key, rank = line.rsplit(' ', 1)
+                entries.append((piece_key, int(rank)))
+        offset += entries_length
+
+        board = cls(board_size)
+        for index, number in _BYTES_PIECE.iter_unpack(data[offset:offset + piece_count * _BYTES_PIECE.size]):
+            board[divmod(index, board_size)] = entries[number]
+        board.is_white_turn = is_white_turn
+        board.en_passant_target = (ep_row, ep_col) if ep_row >= 0 else None
+        return board
+
+    def to_dict(self) -> Dict[Tuple[int, int], Tuple[str, int]]:
+        return {pos: PIECE_ENTRIES[self.squares[self._index(pos)]] for pos in self._positions}
+
+    # O(1) lookups through the code tables; off-board and empty squares give code 0
+    def code_at(self, pos: Tuple[int, int]) -> int:
+        row, col = pos
+        if 0 <= row < self.board_size and 0 <= col < self.board_size:
+            return self.squares[row * self.board_size + col]
+        return EMPTY
+
+    def color_at(self, pos: Tuple[int, int]) -> Optional[str]:
+        return PIECE_COLORS[self.code_at(pos)]
+
+    def type_at(self, pos: Tuple[int, int]) -> Optional[str]:
+        return PIECE_TYPES[self.code_at(pos)]
+
+    def rank_at(self, pos: Tuple[int, int]) -> int:
+        return PIECE_RANKS[self.code_at(pos)]
+
+    def is_path_clear(self, start: Tuple[int, int], end: Tuple[int, int]) -> bool:
+        """Check if the path between two squares is clear of pieces."""
+        return self.is_path_clear_for_rank(start, end, 0)
+
+    def is_path_clear_for_rank(self, start: Tuple[int, int], end: Tuple[int, int], piece_rank: int) -> bool:
+        """Check if the path is clear of pieces ranked at or above piece_rank."""
+        start_row, start_col = start
+        end_row, end_col = end
+
+        # Determine direction of movement
+        row_dir = 0 if start_row == end_row else (1 if end_row > start_row else -1)
+        col_dir = 0 if start_col == end_col else (1 if end_col > start_col else -1)
+
+        # Check each square along the path
+        current_row, current_col = start_row + row_dir, start_col + col_dir
+        while (current_row, current_col) != (end_row, end_col):
+            code = self.code_at((current_row, current_col))
+            if code and PIECE_RANKS[code] >= piece_rank:
+                return False
+            current_row += row_dir
+            current_col += col_dir
+        return True
+
+    def sliding_targets(self, square: Tuple[int, int], squares: Tuple[Tuple[int, int], ...]) -> int:
+        """Number of empty squares along a unit-step ray from square before its first piece."""
+        for empty_count, pos in enumerate(squares):
+            if self.code_at(pos):
+                return empty_count
+        return len(squares)
+
+    def zobrist_hash(self) -> int:
+        """64-bit hash of the pieces, the side to move and the en passant target."""
+        position_hash = self.pieces_hash ^ en_passant_key(self.en_passant_target)
+        return position_hash if self.is_white_turn else position_hash ^ BLACK_TO_MOVE
+
+    def repetitions(self) -> int:
+        """How often the current position occurred earlier in the move history."""
+        position_hash = self.zobrist_hash()
+        return sum(record.position_hash == position_hash for record in self.undo_stack)
+
+    def make_move(self, start: Tuple[int, int], end: Tuple[int, int]) -> UndoRecord:
+        """Move the piece on start to end, capturing what stands there (or the pawn passed
+        by en passant), and hand the turn over. The undo record is pushed and returned."""
+        moved = self.code_at(start)
+        if not moved:
+            raise KeyError(start)
+        start_row, start_col = start
+        end_row, end_col = end
+        is_pawn = PIECE_TYPES[moved] == 'Pawn'
+
+        captured_square = end
+        if is_pawn and end == self.en_passant_target and start_col != end_col and not self.code_at(end):
+            # The captured pawn stands beside the start square, on the target column
+            captured_square = (start_row, end_col)
+        captured = self.code_at(captured_square)
+        record = UndoRecord(start, end, moved, captured_square, captured,
+                            self.en_passant_target, self.is_white_turn, self.zobrist_hash())
+
+        if captured:
+            del self[captured_square]
+        del self[start]
+        self[end] = PIECE_ENTRIES[moved]
+        if is_pawn and abs(end_row - start_row) == 2:
+            self.en_passant_target = ((start_row + end_row) // 2, start_col)
+        else:
+            self.en_passant_target = None
+        self.is_white_turn = not self.is_white_turn
+        self.undo_stack.append(record)
+        return record
+
+    def unmake_move(self) -> UndoRecord:
+        """Take back the last move played with make_move and return its undo record."""
+        record = self.undo_stack.pop()
+        del self[record.end]
+        self[record.start] = PIECE_ENTRIES[record.moved]
+        if record.captured:
+            self[record.captured_square] = PIECE_ENTRIES[record.captured]
+        self.en_passant_target = record.en_passant_target
+        self.is_white_turn = record.is_white_turn
+        return record
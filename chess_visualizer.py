@@ -1,231 +1,440 @@
+import argparse
+import time
+
 import pygame
-import os
-from pieces import create_piece, AVAILABLE_PIECES, ROYAL_PIECES, HOOK_MOVERS, JUMP_MOVERS, LIMITED_JUMPING_MOVERS
-from special_piece_moves import jump_moves_filter, royal_moves_filter, hook_moves_filter, limited_jumping_moves_filter
+try:
+    import numpy
+except ImportError:  # NumPy only speeds up building the board background
+    numpy = None
+from pieces import get_piece_rank
+from board import EMPTY, PIECE_COLORS
+from core import (MIN_BOARD_SIZE, MAX_BOARD_SIZE, new_board, get_legal_moves, board_state,
+                  save_board_state, load_board_state)
+from engine import AnalysisEngine
+from image_cache import PieceImageCache
+from profiler import FrameProfiler
 from presets import get_preset
-from menus import SettingsBar, PiecePanel, PresetMenu, WINDOW_SIZE, PANEL_WIDTH, SETTINGS_BAR_HEIGHT, save_board_state, load_board_state
-
-# Initialize Pygame
-pygame.init()
+from menus import SettingsBar, PiecePanel, PresetMenu, WINDOW_SIZE, PANEL_WIDTH, SETTINGS_BAR_HEIGHT
 
 # Constants
 DEFAULT_BOARD_SIZE = 8
-MIN_BOARD_SIZE = 4
-MAX_BOARD_SIZE = 300
+DRAG_FPS = 60  # Frame rate cap while a piece is being dragged
+ANALYSIS_FPS = 10  # Rate at which new engine results are picked up while analysing
+MAX_SQUARE_SIZE = WINDOW_SIZE // MIN_BOARD_SIZE  # Deepest zoom of the board viewport
+ZOOM_STEP = 1.25  # Square size factor per mouse wheel notch
+LOD_SQUARE_SIZE = 5  # Below this square size the board is drawn as a pixel map, see draw_pixel_map
+MINIMAP_SIZE = 160
+MINIMAP_MARGIN = 10
+BOARD_AREA = pygame.Rect(0, SETTINGS_BAR_HEIGHT, WINDOW_SIZE, WINDOW_SIZE)
 WHITE = (255, 255, 255)
 BLACK = (128, 128, 128)
 HIGHLIGHT_COLOR = (124, 252, 0, 128)  # Light green with alpha
 SELECTED_COLOR = (255, 255, 0, 128)    # Yellow with alpha
 CAPTURE_COLOR = (255, 0, 0, 128)       # Red with alpha for capture squares
 PANEL_COLOR = (180, 180, 180)
+PIXEL_PIECE_COLORS = {'White': (230, 180, 40), 'Black': (20, 20, 20)}  # Pieces in the pixel map and minimap
+MINIMAP_VIEW_COLOR = (255, 0, 0)
+MINIMAP_BORDER_COLOR = (0, 0, 0)
 
 
 class ChessVisualizer:
-    def __init__(self):
+    def __init__(self, use_bitboard=False, drag_fps=DRAG_FPS, dirty_rendering=False):
+        # Pygame starts with the window, not at import, so the module stays cheap to import
+        pygame.init()
+        self.use_bitboard = use_bitboard  # Store the board as big-integer bitboards
+        self.drag_fps = drag_fps
+        self.dirty_rendering = dirty_rendering  # Push only changed regions to the display
+        self.profiler = FrameProfiler()  # Per-stage frame timings, toggled with F3 and dumped with F4
+        self.engine = AnalysisEngine()  # Background search of the current position, toggled with A
+        self.analysing = False
+        self._analysis_text = None  # Analysis line shown in the settings bar
         self.board_size = DEFAULT_BOARD_SIZE
-        self.square_size = WINDOW_SIZE // self.board_size
+        self.square_size = WINDOW_SIZE // self.board_size  # On-screen square size, grows when zoomed in
+        self.view_x = 0  # Viewport offset into the board in pixels, see zoom and pan
+        self.view_y = 0
+        self._pan_anchor = None  # Last mouse position while panning with the middle button
+        self._minimap_panning = False
         self.screen = pygame.display.set_mode((WINDOW_SIZE + PANEL_WIDTH,
                                                WINDOW_SIZE + SETTINGS_BAR_HEIGHT))
         pygame.display.set_caption("Chess Move Visualizer")
+        self.image_cache = PieceImageCache()  # Decoded and scaled piece images, see load_piece_images
         self.piece_images = self.load_piece_images()
         self.settings_bar = SettingsBar(self.board_size)
         self.piece_panel = PiecePanel(self.piece_images, self.square_size)
         self.preset_menu = PresetMenu(WINDOW_SIZE + PANEL_WIDTH,
                                       WINDOW_SIZE + SETTINGS_BAR_HEIGHT)
         self.selected_square = None
-        self.board = {}  # Dictionary to store piece positions
         self.dragging_piece = None
         self.drag_start_pos = None
-        self.is_white_turn = True  # Track whose turn it is
-        self.en_passant_target = None  # Track the square that can be captured en passant
+        self._legal_moves_key = None  # (square, board size, position hash) of the cached moves
+        self._legal_moves = []
+        self.square_colors = (WHITE, BLACK)  # Light and dark square colors
+        self._board_surface = None  # Pre-rendered checkerboard, see draw_board
+        self._board_surface_key = None
+        self._minimap_surface = None  # One pixel per square overview, see draw_minimap
+        self._minimap_key = None
+        self._pixel_map = None  # Board and pieces at one pixel per square, see draw_pixel_map
+        self._pixel_map_key = None
+        self._pixel_colors = None  # NumPy RGB table indexed by piece code
+        self._highlights = {}  # Highlight colors per square for the current selection
+        self._highlights_key = None  # Legal moves key the highlights were built from
+        self._highlight_overlay = None  # All highlights of the selection on one surface
+        self._highlight_overlay_key = None
+        self._highlight_tiles = {}  # Pre-filled highlight tiles per color, for one square size
+        self._highlight_tiles_size = None
+        # State of the last rendered frame, see render
+        self._dirty_squares = set()  # Board squares whose pieces changed since the last frame
+        self._drawn = None  # (board, background, settings, panel) of the last frame
+        self._drawn_highlights = {}
+        self._drawn_overlay = True  # Preset menu or dragged piece on screen
 
         # Initialize board with tuples
         preset_pieces = get_preset('standard', self.board_size)['pieces']
-        self.board = {}
-        for pos, piece_key in preset_pieces.items():
-            rank = self._get_piece_rank(piece_key)
-            self.board[pos] = (piece_key, rank)
+        self.board = self._new_board(preset_pieces)
+
+    # Whose turn it is and the en passant target live on the board, next to its undo stack
+    @property
+    def is_white_turn(self):
+        return self.board.is_white_turn
+
+    @is_white_turn.setter
+    def is_white_turn(self, value):
+        self.board.is_white_turn = value
+
+    @property
+    def en_passant_target(self):
+        return self.board.en_passant_target
+
+    @en_passant_target.setter
+    def en_passant_target(self, value):
+        self.board.en_passant_target = value
+
+    def undo_move(self):
+        """Take back the last move played on the board."""
+        if not self.board.undo_stack:
+            return
+        record = self.board.unmake_move()
+        self._mark_dirty(record.start, record.end, record.captured_square)
+        self.selected_square = None
+        self.settings_bar.update_turn_text(self.is_white_turn)
+
+    def toggle_analysis(self):
+        self.analysing = not self.analysing
+        if not self.analysing:
+            self.engine.stop(wait=False)
+        self._update_analysis()
+
+    def _update_analysis(self):
+        """Restart the engine when the position changed and show its latest result."""
+        if self.analysing:
+            if self.engine.position_hash != self.board.zobrist_hash():
+                self.engine.start(self.board)
+            text = self.engine.summary()
+        else:
+            text = None
+        if text != self._analysis_text:
+            self._analysis_text = text
+            self.settings_bar.update_analysis_text(text)
+
+    def _new_board(self, pieces=None):
+        """Create a board in the configured backend from a {(row, col): piece_key} mapping.
+        Pieces that fall outside the current board size are dropped."""
+        return new_board(self.board_size, pieces, self.use_bitboard)
 
     def load_piece_images(self):
-        pieces = {}
-
-        # First load all images at their original size
-        original_images = {}
-        for file_name, value in AVAILABLE_PIECES.items():
-            image_path = os.path.join("pieces", f"{file_name}.png")
-            if os.path.exists(image_path):
-                original_images[file_name] = pygame.image.load(image_path)
-
-        # Then scale them to the board size
-        for piece_key, image in original_images.items():
-            pieces[piece_key] = pygame.transform.smoothscale(image,
-                                                             (self.square_size,
-                                                              self.square_size))
-
-        return pieces
+        # Images are decoded once and kept scaled per square size by the cache
+        return self.image_cache.get_images(self.square_size)
 
     def draw_board(self):
+        self.screen.blit(self._get_board_surface(), (0, SETTINGS_BAR_HEIGHT))
+
+    def _get_board_surface(self):
+        # Rebuild the cached background only when its size, palette or viewport changed
+        key = (self.board_size, self.square_size, self.square_colors, self.view_x, self.view_y)
+        if self._board_surface is None or self._board_surface_key != key:
+            self._board_surface = self._render_board_surface()
+            self._board_surface_key = key
+        return self._board_surface
+
+    def _render_board_surface(self):
+        """Render the visible part of the checkerboard into a surface covering the board area."""
         # Fill the entire board area with panel color first
-        pygame.draw.rect(self.screen,
-                         PANEL_COLOR,
-                         (0,
-                          SETTINGS_BAR_HEIGHT,
-                          WINDOW_SIZE,
-                          WINDOW_SIZE))
-
-        # Draw only the squares within the actual board size
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                x = col * self.square_size
-                y = row * self.square_size + SETTINGS_BAR_HEIGHT
-                color = WHITE if (row + col) % 2 == 0 else BLACK
-                pygame.draw.rect(self.screen,
-                                 color,
-                                 (x,
-                                  y,
-                                  self.square_size,
-                                  self.square_size))
+        surface = pygame.Surface((WINDOW_SIZE, WINDOW_SIZE))
+        surface.fill(PANEL_COLOR)
+
+        # Paint one pixel per visible square, then scale it up to the square size
+        first_row, first_col, last_row, last_col = self._visible_range()
+        rows, cols = last_row - first_row, last_col - first_col
+        parity = (first_row + first_col) % 2
+        light, dark = self.square_colors
+        checker = pygame.Surface((cols, rows))
+        if numpy is not None:
+            xs, ys = numpy.indices((cols, rows))
+            is_dark = ((xs + ys + parity) % 2 == 1)[..., None]
+            pygame.surfarray.blit_array(checker, numpy.where(is_dark, dark, light))
+        else:
+            checker.fill(light)
+            for row in range(rows):
+                for col in range((row + parity + 1) % 2, cols, 2):
+                    checker.set_at((col, row), dark)
+
+        surface.blit(pygame.transform.scale(checker, (cols * self.square_size, rows * self.square_size)),
+                     (first_col * self.square_size - self.view_x, first_row * self.square_size - self.view_y))
+        return surface
+
+    def _visible_range(self):
+        """First and one-past-last rows and columns that intersect the viewport."""
+        first_row = self.view_y // self.square_size
+        first_col = self.view_x // self.square_size
+        last_row = min(self.board_size, (self.view_y + WINDOW_SIZE - 1) // self.square_size + 1)
+        last_col = min(self.board_size, (self.view_x + WINDOW_SIZE - 1) // self.square_size + 1)
+        return first_row, first_col, last_row, last_col
+
+    def _square_rect(self, square):
+        """Screen rect of a square under the current viewport."""
+        row, col = square
+        return pygame.Rect(col * self.square_size - self.view_x,
+                           row * self.square_size - self.view_y + SETTINGS_BAR_HEIGHT,
+                           self.square_size, self.square_size)
+
+    def _is_zoomed(self):
+        return self.square_size != WINDOW_SIZE // self.board_size
+
+    def _reset_view(self):
+        """Fit the whole board in the window again."""
+        self.square_size = WINDOW_SIZE // self.board_size
+        self.view_x = self.view_y = 0
+
+    def _clamp_view(self):
+        limit = max(0, self.board_size * self.square_size - WINDOW_SIZE)
+        self.view_x = max(0, min(limit, self.view_x))
+        self.view_y = max(0, min(limit, self.view_y))
+
+    def zoom(self, steps, anchor):
+        """Zoom the viewport by steps wheel notches (positive zooms in),
+        keeping the board point under the anchor screen position in place."""
+        size = self.square_size
+        for _ in range(abs(steps)):
+            if steps > 0:
+                size = max(size + 1, int(size * ZOOM_STEP))
+            else:
+                size = min(size - 1, int(size / ZOOM_STEP))
+        size = max(WINDOW_SIZE // self.board_size, min(MAX_SQUARE_SIZE, size))
+        if size == self.square_size:
+            return
+        x, y = anchor[0], anchor[1] - SETTINGS_BAR_HEIGHT
+        self.view_x = (self.view_x + x) * size // self.square_size - x
+        self.view_y = (self.view_y + y) * size // self.square_size - y
+        self.square_size = size
+        self.piece_images = self.load_piece_images()
+        self._clamp_view()
+
+    def pan(self, dx, dy):
+        """Move the board by (dx, dy) screen pixels under the viewport."""
+        self.view_x -= dx
+        self.view_y -= dy
+        self._clamp_view()
+
+    def _minimap_rect(self):
+        return pygame.Rect(WINDOW_SIZE - MINIMAP_SIZE - MINIMAP_MARGIN,
+                           SETTINGS_BAR_HEIGHT + WINDOW_SIZE - MINIMAP_SIZE - MINIMAP_MARGIN,
+                           MINIMAP_SIZE, MINIMAP_SIZE)
+
+    def _get_minimap_surface(self):
+        """Overview of the board with one pixel per square, rebuilt only when the board changed."""
+        key = (self.board, self.board.version, self.square_colors)
+        if self._minimap_surface is None or self._minimap_key != key:
+            # Squares are a flat color; a checker pattern would only alias at this scale
+            pixels = self._render_pixel_map(0, 0, self.board_size, self.board_size, checker=False)
+            self._minimap_surface = pygame.transform.scale(pixels, (MINIMAP_SIZE, MINIMAP_SIZE))
+            self._minimap_key = key
+        return self._minimap_surface
+
+    def _is_lod(self):
+        """Squares are too small for sprites to be worth drawing."""
+        return self.square_size < LOD_SQUARE_SIZE
+
+    def draw_pixel_map(self):
+        """Draw the visible board with one flat color per square: the checker color, or the
+        color of the piece standing on it. Rebuilt only when the board or viewport changed."""
+        key = (self.board, self.board.version, self.square_size, self.square_colors, self.view_x, self.view_y)
+        if self._pixel_map is None or self._pixel_map_key != key:
+            first_row, first_col, last_row, last_col = self._visible_range()
+            pixels = self._render_pixel_map(first_row, first_col, last_row, last_col)
+            surface = pygame.Surface((WINDOW_SIZE, WINDOW_SIZE))
+            surface.fill(PANEL_COLOR)
+            surface.blit(pygame.transform.scale(pixels, ((last_col - first_col) * self.square_size,
+                                                         (last_row - first_row) * self.square_size)),
+                         (first_col * self.square_size - self.view_x, first_row * self.square_size - self.view_y))
+            self._pixel_map = surface
+            self._pixel_map_key = key
+        self.screen.blit(self._pixel_map, (0, SETTINGS_BAR_HEIGHT))
+
+    def _render_pixel_map(self, first_row, first_col, last_row, last_col, checker=True):
+        """Render a range of squares at one pixel per square. Without a checker pattern,
+        empty squares take the dark square color."""
+        rows, cols = last_row - first_row, last_col - first_col
+        parity = (first_row + first_col) % 2
+        light, dark = self.square_colors
+        surface = pygame.Surface((cols, rows))
+        if numpy is not None:
+            codes = numpy.frombuffer(self.board.squares, dtype=numpy.uint16)
+            codes = codes.reshape(self.board_size, self.board_size)[first_row:last_row, first_col:last_col]
+            if checker:
+                ys, xs = numpy.indices((rows, cols))
+                background = numpy.where(((ys + xs + parity) % 2 == 1)[..., None], dark, light)
+            else:
+                background = numpy.full((rows, cols, 3), dark)
+            pixels = numpy.where((codes != EMPTY)[..., None], self._get_pixel_colors()[codes], background)
+            # surfarray is indexed [x][y], the board array [row][col]
+            pygame.surfarray.blit_array(surface, pixels.transpose(1, 0, 2))
+            return surface
+
+        surface.fill(dark)
+        if checker:
+            for row in range(rows):
+                for col in range((row + parity) % 2, cols, 2):
+                    surface.set_at((col, row), light)
+        for row, col in self.board:
+            if first_row <= row < last_row and first_col <= col < last_col:
+                surface.set_at((col - first_col, row - first_row),
+                               PIXEL_PIECE_COLORS.get(self.board.color_at((row, col)), dark))
+        return surface
+
+    def _get_pixel_colors(self):
+        """RGB per piece code, extended as new piece codes get registered."""
+        if self._pixel_colors is None or len(self._pixel_colors) != len(PIECE_COLORS):
+            self._pixel_colors = numpy.array([PIXEL_PIECE_COLORS.get(color, (0, 0, 0)) for color in PIECE_COLORS],
+                                             dtype=numpy.uint8)
+        return self._pixel_colors
+
+    def draw_minimap(self):
+        """Draw the board overview and the viewport outline while zoomed in."""
+        rect = self._minimap_rect()
+        self.screen.blit(self._get_minimap_surface(), rect)
+        scale = MINIMAP_SIZE / (self.board_size * self.square_size)
+        view = pygame.Rect(rect.x + int(self.view_x * scale), rect.y + int(self.view_y * scale),
+                           max(1, int(WINDOW_SIZE * scale)), max(1, int(WINDOW_SIZE * scale)))
+        pygame.draw.rect(self.screen, MINIMAP_VIEW_COLOR, view.clip(rect), 1)
+        pygame.draw.rect(self.screen, MINIMAP_BORDER_COLOR, rect, 1)
+        return rect
+
+    def _center_view_on_minimap(self, pos):
+        """Center the viewport on the board point under a minimap position."""
+        rect = self._minimap_rect()
+        scale = self.board_size * self.square_size / MINIMAP_SIZE
+        self.view_x = int((pos[0] - rect.x) * scale) - WINDOW_SIZE // 2
+        self.view_y = int((pos[1] - rect.y) * scale) - WINDOW_SIZE // 2
+        self._clamp_view()
 
     def draw_pieces(self):
-        for pos, board_entry in self.board.items():
-            row, col = pos
+        for pos in self._visible_pieces():
             # Handle tuple format (piece_key, rank)
-            piece_key, _ = board_entry
-                
+            piece_key, _ = self.board[pos]
+
             if piece_key in self.piece_images:
-                x = col * self.square_size
-                y = row * self.square_size + SETTINGS_BAR_HEIGHT
                 self.screen.blit(self.piece_images[piece_key],
-                                 (x, y))
+                                 self._square_rect(pos))
+
+    def _visible_pieces(self):
+        """Positions of the pieces inside the viewport, walking whichever is
+        smaller: the pieces on the board or the visible squares."""
+        first_row, first_col, last_row, last_col = self._visible_range()
+        if len(self.board) <= (last_row - first_row) * (last_col - first_col):
+            return [(row, col) for row, col in self.board
+                    if first_row <= row < last_row and first_col <= col < last_col]
+        return [(row, col) for row in range(first_row, last_row)
+                for col in range(first_col, last_col) if (row, col) in self.board]
+
+    def _draw_square(self, square, highlight_colors):
+        """Redraw one square from the cached background, its highlights and its piece.
+        Returns the screen rect that was drawn."""
+        rect = self._square_rect(square).clip(BOARD_AREA)
+        self.screen.set_clip(rect)
+        self.screen.blit(self._get_board_surface(), rect, rect.move(0, -SETTINGS_BAR_HEIGHT))
+        for color in highlight_colors:
+            self.highlight_square(square, color)
+        board_entry = self.board.get(square)
+        if board_entry is not None and board_entry[0] in self.piece_images:
+            self.screen.blit(self.piece_images[board_entry[0]], self._square_rect(square))
+        self.screen.set_clip(None)
+        return rect
 
     def get_square_from_pos(self, pos):
         x, y = pos
         if y < SETTINGS_BAR_HEIGHT or x >= WINDOW_SIZE:
             return None
         y -= SETTINGS_BAR_HEIGHT
-        col = x // self.square_size
-        row = y // self.square_size
+        col = (x + self.view_x) // self.square_size
+        row = (y + self.view_y) // self.square_size
         if 0 <= row < self.board_size and 0 <= col < self.board_size:
             return (row, col)
         return None
 
     def highlight_square(self, square, color):
         if square is not None:
-            row, col = square
-            x = col * self.square_size
-            y = row * self.square_size + SETTINGS_BAR_HEIGHT
-            s = pygame.Surface((self.square_size,
-                                self.square_size),
-                               pygame.SRCALPHA)
-            pygame.draw.rect(s, color, s.get_rect())
-            self.screen.blit(s, (x, y))
-
-    def _is_path_clear(self, start, end):
-        """Check if the path between two squares is clear of pieces."""
-        start_row, start_col = start
-        end_row, end_col = end
-
-        # Determine direction of movement
-        row_dir = 0 if start_row == end_row else (1 if end_row > start_row else -1)
-        col_dir = 0 if start_col == end_col else (1 if end_col > start_col else -1)
-
-        # Check each square along the path
-        current_row, current_col = start_row + row_dir, start_col + col_dir
-        while (current_row, current_col) != (end_row, end_col):
-            if (current_row, current_col) in self.board:
-                return False
-            current_row += row_dir
-            current_col += col_dir
-        return True
+            self.screen.blit(self._get_highlight_tile(color), self._square_rect(square))
+
+    def _get_highlight_tile(self, color):
+        """Get a square-sized tile filled with a highlight color, reused across frames."""
+        if self._highlight_tiles_size != self.square_size:
+            self._highlight_tiles = {}
+            self._highlight_tiles_size = self.square_size
+        tile = self._highlight_tiles.get(color)
+        if tile is None:
+            tile = pygame.Surface((self.square_size, self.square_size), pygame.SRCALPHA)
+            tile.fill(color)
+            self._highlight_tiles[color] = tile
+        return tile
+
+    def _get_highlight_overlay(self):
+        """Get one surface with every visible highlight of the current selection, rebuilt
+        only when the selection, board or viewport changed."""
+        highlights = self._get_highlights()
+        if not highlights:
+            return None
+        key = (self._highlights_key, self.square_size, self.view_x, self.view_y)
+        if self._highlight_overlay_key != key:
+            overlay = pygame.Surface((WINDOW_SIZE, WINDOW_SIZE), pygame.SRCALPHA)
+            first_row, first_col, last_row, last_col = self._visible_range()
+            for (row, col), colors in highlights.items():
+                if not (first_row <= row < last_row and first_col <= col < last_col):
+                    continue
+                pos = (col * self.square_size - self.view_x, row * self.square_size - self.view_y)
+                # The first color is written straight into the transparent overlay;
+                # any further colors blend over it like stacked tiles would
+                overlay.fill(colors[0], (pos, (self.square_size, self.square_size)))
+                for color in colors[1:]:
+                    overlay.blit(self._get_highlight_tile(color), pos)
+            self._highlight_overlay = overlay
+            self._highlight_overlay_key = key
+        return self._highlight_overlay
 
     def get_legal_moves(self, square):
-        board_result = self.board.get(square)
-        if not board_result:
-            return []
-        start_row, start_col = square
-
-        # Handle tuple format (piece_key, rank)
-        piece_key, rank = board_result
-        # Extract color and piece type from the key (format: "White_Knight")
-        color, piece_type = piece_key.split('_', 1)
-
-        # Create piece and get all possible moves with jump information
-        piece = create_piece(piece_type, color, int(rank))
-        moves_with_info = piece.get_legal_moves_with_info(square, self.board_size)
-
-        # Filter moves based on piece blocking and capture opportunities
-        filtered_moves = []
-        if piece_type in JUMP_MOVERS:
-            filtered_jumping_moves = jump_moves_filter(self.board, square, color, moves_with_info)
-            filtered_moves.extend(filtered_jumping_moves)
-        elif piece_type in ROYAL_PIECES:
-            filtered_royal_moves = royal_moves_filter(self.board, square, color, rank, moves_with_info)
-            filtered_moves.extend(filtered_royal_moves)
-        elif piece_type in HOOK_MOVERS:
-            filtered_hook_moves = hook_moves_filter(self.board, self.board_size, square, color, moves_with_info)
-            filtered_moves.extend(filtered_hook_moves)
-        elif piece_type in LIMITED_JUMPING_MOVERS:
-            filtered_limited_jumping_moves = limited_jumping_moves_filter(self.board, square, color, moves_with_info)
-            filtered_moves.extend(filtered_limited_jumping_moves)
-        else: # Non-jump movers
-            for move, can_jump in moves_with_info:
-                target_board_result = self.board.get(move)
-                if target_board_result:
-                    target_piece_key, _ = target_board_result
-                    target_color = target_piece_key.split('_')[0]
-                else:
-                    target_color = None
-
-                # For pawns, handle forward and diagonal moves differently
-                if piece_type == 'Pawn':
-                    # Get the direction of movement
-                    start_row, start_col = square
-                    end_row, end_col = move
-                    is_diagonal = start_col != end_col
-
-                    if is_diagonal:
-                        # Diagonal moves are only valid for captures
-                        if target_board_result and target_color != color:
-                            filtered_moves.append((move, CAPTURE_COLOR))
-                        # Check for en passant
-                        elif self.en_passant_target == move:
-                            filtered_moves.append((move, CAPTURE_COLOR))
-                    else:
-                        # Forward moves are only valid for empty squares
-                        if target_board_result is None:
-                            # For two-square moves, check if the middle square is empty
-                            if abs(end_row - start_row) == 2:
-                                intermediate_row = (start_row + end_row) // 2
-                                if (intermediate_row, start_col) not in self.board:
-                                    filtered_moves.append((move, HIGHLIGHT_COLOR))
-                            else:
-                                filtered_moves.append((move, HIGHLIGHT_COLOR))
-                else:
-                    # For normal pieces, use standard move filtering
-                    if target_board_result is None:
-                        # Empty square, check if path is clear or if piece can jump
-                        if can_jump or self._is_path_clear(square, move):
-                            filtered_moves.append((move, HIGHLIGHT_COLOR))
+        return get_legal_moves(self.board, square)
 
-                    elif target_color != color:  # Different color piece
-                        if can_jump or self._is_path_clear(square, move):
-                            filtered_moves.append((move, CAPTURE_COLOR))
-
-        return filtered_moves
+    def get_cached_legal_moves(self, square):
+        """Get legal moves for a square, recomputing only when the square or the position
+        (pieces, en passant target and turn, all covered by the Zobrist hash) changed."""
+        key = (square, self.board_size, self.board.zobrist_hash())
+        if key != self._legal_moves_key:
+            self._legal_moves = self.get_legal_moves(square)
+            self._legal_moves_key = key
+        return self._legal_moves
 
     def resize_board(self, new_size):
         if MIN_BOARD_SIZE <= new_size <= MAX_BOARD_SIZE:
             self.board_size = new_size
-            self.square_size = WINDOW_SIZE // self.board_size
+            self._reset_view()
             self.settings_bar.update_size_text(self.board_size)
             self.piece_images = self.load_piece_images()
             self.piece_panel = PiecePanel(self.piece_images, self.square_size)
             # Initialize board with tuples
             preset_pieces = get_preset('standard', self.board_size)['pieces']
-            self.board = {}
-            for pos, piece_key in preset_pieces.items():
-                rank = self._get_piece_rank(piece_key)
-                self.board[pos] = (piece_key, rank)
+            is_white_turn = self.is_white_turn  # Resizing keeps whose turn it is
+            self.board = self._new_board(preset_pieces)
+            self.is_white_turn = is_white_turn
+            self.settings_bar.update_turn_text(self.is_white_turn)
             # Clear selected square when resizing
             self.selected_square = None
             self.dragging_piece = None
@@ -234,60 +443,147 @@ class ChessVisualizer:
         preset = get_preset(preset_name, self.board_size)
         if preset:
             self.board_size = preset['size']
-            self.square_size = WINDOW_SIZE // self.board_size
+            self._reset_view()
             self.settings_bar.update_size_text(self.board_size)
             self.piece_images = self.load_piece_images()
             self.piece_panel = PiecePanel(self.piece_images, self.square_size)
-            self.board = {}  # Clear the board
             self.selected_square = None
             self.dragging_piece = None
             self.en_passant_target = None
 
             # Initialize board with tuples
             preset_pieces = preset['pieces']
-            for pos, piece_key in preset_pieces.items():
-                rank = self._get_piece_rank(piece_key)
-                self.board[pos] = (piece_key, rank)
+            self.board = self._new_board(preset_pieces)
 
             self.is_white_turn = True
             self.settings_bar.update_turn_text(self.is_white_turn)
 
-    def _get_piece_color(self, board_entry):
-        """Extract piece color from board entry (tuple format)."""
-        piece_key, _ = board_entry
-        return piece_key.split('_')[0]
-    
-    def _get_piece_type(self, board_entry):
-        """Extract piece type from board entry (tuple format)."""
-        piece_key, _ = board_entry
-        return piece_key.split('_')[1]
-
     def _get_piece_rank(self, piece_key):
         """Get the rank for a piece key from AVAILABLE_PIECES."""
-        if piece_key in AVAILABLE_PIECES:
-            piece_info = AVAILABLE_PIECES[piece_key]
-            # Convert PieceRank enum to numerical rank
-            rank_enum = piece_info[2]
-            if rank_enum.value == 1:  # KING
-                return 10
-            elif rank_enum.value == 2:  # GREAT_GENERAL
-                return 9
-            elif rank_enum.value == 3:  # VICE_GENERAL
-                return 8
-            elif rank_enum.value == 4:  # GENERAL
-                return 7
-            else:  # OTHER
-                return 1
-        return 1  # Default rank
+        return get_piece_rank(piece_key)
 
     def _is_valid_position(self, pos):
         row, col = pos
         return 0 <= row < self.board_size and 0 <= col < self.board_size
 
+    def _mark_dirty(self, *squares):
+        """Flag squares whose pieces changed so the next frame redraws them."""
+        self._dirty_squares.update(squares)
+
+    def _get_highlights(self):
+        """Map each highlighted square to its highlight colors, in drawing order.
+        The map is rebuilt only when the cached legal moves change."""
+        if self.selected_square is None:
+            return {}
+        legal_moves = self.get_cached_legal_moves(self.selected_square)
+        if self._highlights_key != self._legal_moves_key:
+            highlights = {self.selected_square: [SELECTED_COLOR]}
+            for move, color in legal_moves:
+                highlights.setdefault(move, []).append(color)
+            self._highlights = highlights
+            self._highlights_key = self._legal_moves_key
+        return self._highlights
+
+    def _draw_frame(self):
+        """Draw the whole window."""
+        with self.profiler.stage('draw_board'):
+            if self._is_lod():
+                self.draw_pixel_map()
+            else:
+                self.draw_board()
+        with self.profiler.stage('highlight'):
+            overlay = self._get_highlight_overlay()
+            if overlay is not None:
+                self.screen.blit(overlay, (0, SETTINGS_BAR_HEIGHT))
+
+        with self.profiler.stage('draw_pieces'):
+            if not self._is_lod():
+                # Squares cut by the viewport edge must not spill into the piece panel
+                self.screen.set_clip(BOARD_AREA)
+                self.draw_pieces()
+                self.screen.set_clip(None)
+        with self.profiler.stage('menus'):
+            if self._is_zoomed():
+                self.draw_minimap()
+            self.settings_bar.draw(self.screen)
+            self.piece_panel.draw(self.screen)
+            self.preset_menu.draw(self.screen)
+
+        # Draw the dragging piece if any
+        if self.dragging_piece:
+            mouse_pos = pygame.mouse.get_pos()
+            self.screen.blit(self.piece_images[self.dragging_piece],
+                             (mouse_pos[0] - self.square_size//2,
+                             mouse_pos[1] - self.square_size//2))
+
+    def render(self):
+        """Draw the next frame.
+
+        With dirty_rendering, only the squares whose pieces or highlights changed, and the
+        settings bar or piece panel when their contents changed, are redrawn and pushed with
+        pygame.display.update. A new board, background or viewport, the preset menu and
+        dragging (in this frame or the last) fall back to a full redraw and flip, as does
+        the pixel map, which is cheap to draw whole, and the profiler overlay."""
+        with self.profiler.stage('legal_moves'):
+            highlights = self._get_highlights()
+        drawn = (self.board, self._get_board_surface(),
+                 (self.is_white_turn, self.board_size, self._analysis_text),
+                 (self.piece_panel, self.piece_panel.current_page))
+        overlay = self.preset_menu.visible or self.dragging_piece is not None
+
+        if (not self.dirty_rendering or self._drawn is None or overlay or self._drawn_overlay
+                or drawn[:2] != self._drawn[:2] or self._is_lod() or self.profiler.enabled):
+            self._draw_frame()
+            if self.profiler.enabled:
+                self.profiler.draw(self.screen)
+            with self.profiler.stage('flip'):
+                pygame.display.flip()
+        else:
+            squares = set(self._dirty_squares)
+            if highlights is not self._drawn_highlights:
+                for square in highlights.keys() | self._drawn_highlights.keys():
+                    if highlights.get(square) != self._drawn_highlights.get(square):
+                        squares.add(square)
+            rects = [self._draw_square(square, highlights.get(square, ()))
+                     for square in squares if self._is_valid_position(square)]
+            if rects and self._is_zoomed():
+                # Redrawn squares may cover the minimap, and moves change its pixels
+                rects.append(self.draw_minimap())
+            if drawn[2] != self._drawn[2]:
+                self.settings_bar.draw(self.screen)
+                rects.append(self.settings_bar.rect)
+            if drawn[3] != self._drawn[3]:
+                self.piece_panel.draw(self.screen)
+                rects.append(pygame.Rect(self.piece_panel.x, self.piece_panel.y,
+                                         self.piece_panel.width, self.piece_panel.height))
+            if rects:
+                pygame.display.update(rects)
+
+        self._dirty_squares.clear()
+        self._drawn = drawn
+        self._drawn_highlights = highlights
+        self._drawn_overlay = overlay
+
+    def _next_events(self, clock):
+        """Block until input arrives while idle; while dragging, poll at the target frame rate,
+        and while analysing, often enough to show new engine results."""
+        if self.dragging_piece:
+            clock.tick(self.drag_fps)
+            return pygame.event.get()
+        if self.analysing:
+            clock.tick(ANALYSIS_FPS)
+            return pygame.event.get()
+        return [pygame.event.wait()] + pygame.event.get()
+
     def run(self):
         running = True
+        clock = pygame.time.Clock()
         while running:
-            for event in pygame.event.get():
+            events = self._next_events(clock)
+            # Frames are timed from when input arrives, not while waiting for it
+            self.profiler.start_frame()
+            events_start = time.perf_counter()
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
 
@@ -295,10 +591,7 @@ class ChessVisualizer:
                     if event.key == pygame.K_r:
                         # Reset to standard preset with tuples
                         preset_pieces = get_preset('standard', self.board_size)['pieces']
-                        self.board = {}
-                        for pos, piece_key in preset_pieces.items():
-                            rank = self._get_piece_rank(piece_key)
-                            self.board[pos] = (piece_key, rank)
+                        self.board = self._new_board(preset_pieces)
                         self.selected_square = None
                         self.dragging_piece = None
                         self.is_white_turn = True
@@ -306,12 +599,30 @@ class ChessVisualizer:
                         self.en_passant_target = None
                     elif event.key == pygame.K_q:
                         running = False
+                    elif event.key == pygame.K_u:
+                        self.undo_move()
+                    elif event.key == pygame.K_a:
+                        self.toggle_analysis()
                     elif event.key == pygame.K_ESCAPE:
                         self.preset_menu.visible = False
+                    elif event.key == pygame.K_F3:
+                        self.profiler.toggle()
+                    elif event.key == pygame.K_F4:
+                        self.profiler.dump()
 
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     pos = pygame.mouse.get_pos()
 
+                    # Mouse wheel zooms and the middle button pans the board viewport
+                    if event.button in (4, 5):
+                        if BOARD_AREA.collidepoint(pos) and not self.preset_menu.visible:
+                            self.zoom(1 if event.button == 4 else -1, pos)
+                        continue
+                    if event.button == 2:
+                        if BOARD_AREA.collidepoint(pos) and not self.preset_menu.visible:
+                            self._pan_anchor = pos
+                        continue
+
                     # Check if click is in settings bar
                     if pos[1] < SETTINGS_BAR_HEIGHT:
                         action = self.settings_bar.handle_click(pos)
@@ -327,12 +638,14 @@ class ChessVisualizer:
                             self.preset_menu.visible = True
                         elif action == "save_position":
                             # Save the board state as a list of ((row, col), piece_key) tuples
-                            board_state = [((row, col), piece_key) for (row, col), (piece_key, _) in self.board.items()]
-                            save_board_state(board_state)
+                            save_board_state(board_state(self.board))
                         elif action == "load_position":
                             # Load the board state and update self.board
                             loaded_state = load_board_state()
-                            self.board = {(row, col): (piece_key, self._get_piece_rank(piece_key)) for (row, col), piece_key in loaded_state}
+                            is_white_turn = self.is_white_turn  # Saved positions do not record the turn
+                            self.board = self._new_board(dict(loaded_state))
+                            self.is_white_turn = is_white_turn
+                            self.settings_bar.update_turn_text(self.is_white_turn)
                         continue
 
                     # Check if click is in preset menu
@@ -351,12 +664,20 @@ class ChessVisualizer:
                             self.drag_start_pos = pos
                         continue
 
+                    # Check if click is in the minimap
+                    if self._is_zoomed() and self._minimap_rect().collidepoint(pos):
+                        self._center_view_on_minimap(pos)
+                        self._minimap_panning = True
+                        continue
+
                     # Handle board clicks
                     square = self.get_square_from_pos(pos)
                     if square is not None:
                         # Handle right-click to remove pieces
                         if event.button == 3:  # Right mouse button
                             self.board.pop(square, None)
+                            self.board.undo_stack.clear()  # Edits break the recorded history
+                            self._mark_dirty(square)
                             if self.selected_square == square:
                                 self.selected_square = None
                             continue
@@ -365,6 +686,8 @@ class ChessVisualizer:
                             # Place the dragged piece on the board with rank
                             rank = self._get_piece_rank(self.dragging_piece)
                             self.board[square] = (self.dragging_piece, rank)
+                            self.board.undo_stack.clear()
+                            self._mark_dirty(square)
                             self.dragging_piece = None
                             self.en_passant_target = None  # Clear en passant target on piece placement
                         else:
@@ -372,15 +695,15 @@ class ChessVisualizer:
                             if self.selected_square is None:
                                 if square in self.board:
                                     # Only select pieces of the current turn's color
-                                    piece_color = self._get_piece_color(self.board[square])
+                                    piece_color = self.board.color_at(square)
                                     if piece_color == ('White' if self.is_white_turn else 'Black'):
                                         self.selected_square = square
                             else:
                                 # If clicking the same square or a square with a piece of the same color, just deselect
                                 if square == self.selected_square or (
                                     square in self.board and
-                                    self._get_piece_color(self.board[square]) ==
-                                    self._get_piece_color(self.board[self.selected_square])
+                                    self.board.color_at(square) ==
+                                    self.board.color_at(self.selected_square)
                                 ):
                                     self.selected_square = None
                                 else:
@@ -389,32 +712,27 @@ class ChessVisualizer:
                                         self.selected_square = None
                                         continue
                                     
-                                    # Move piece to new position
-                                    piece = self.board.pop(self.selected_square)
-                                    start_row, start_col = self.selected_square
-                                    end_row, end_col = square
-
-                                    # Check if this was a two-square pawn move
-                                    piece_type = self._get_piece_type(piece)
-                                    if piece_type == 'Pawn' and abs(end_row - start_row) == 2:
-                                        # Set the en passant target square
-                                        self.en_passant_target = ((start_row + end_row) // 2, start_col)
-                                    else:
-                                        self.en_passant_target = None
-
-                                    # Handle en passant capture
-                                    if piece_type == 'Pawn' and square == self.en_passant_target:
-                                        # Remove the captured pawn
-                                        piece_color = self._get_piece_color(piece)
-                                        captured_row = start_row if piece_color == 'White' else end_row
-                                        self.board.pop((captured_row, end_col), None)
-
-                                    self.board[square] = piece
+                                    # Move piece to new position; the board handles
+                                    # en passant and hands the turn over
+                                    record = self.board.make_move(self.selected_square, square)
+                                    self._mark_dirty(record.start, record.end, record.captured_square)
                                     self.selected_square = None
-                                    self.is_white_turn = not self.is_white_turn
                                     self.settings_bar.update_turn_text(self.is_white_turn)
 
+                elif event.type == pygame.MOUSEMOTION:
+                    if self._pan_anchor is not None:
+                        self.pan(event.pos[0] - self._pan_anchor[0], event.pos[1] - self._pan_anchor[1])
+                        self._pan_anchor = event.pos
+                    elif self._minimap_panning:
+                        self._center_view_on_minimap(event.pos)
+
                 elif event.type == pygame.MOUSEBUTTONUP:
+                    if event.button in (4, 5):
+                        continue
+                    if event.button == 2:
+                        self._pan_anchor = None
+                        continue
+                    self._minimap_panning = False
                     if self.dragging_piece:
                         pos = pygame.mouse.get_pos()
                         square = self.get_square_from_pos(pos)
@@ -422,34 +740,24 @@ class ChessVisualizer:
                             # store the piece key with rank
                             rank = self._get_piece_rank(self.dragging_piece)
                             self.board[square] = (self.dragging_piece, rank)
+                            self.board.undo_stack.clear()
+                            self._mark_dirty(square)
                         self.dragging_piece = None
 
-            # Draw everything
-            self.draw_board()
-
-            if self.selected_square is not None:
-                self.highlight_square(self.selected_square, SELECTED_COLOR)
-                legal_moves = self.get_legal_moves(self.selected_square)
-                for move, color in legal_moves:
-                    self.highlight_square(move, color)
-
-            self.draw_pieces()
-            self.settings_bar.draw(self.screen)
-            self.piece_panel.draw(self.screen)
-            self.preset_menu.draw(self.screen)
-
-            # Draw the dragging piece if any
-            if self.dragging_piece:
-                mouse_pos = pygame.mouse.get_pos()
-                self.screen.blit(self.piece_images[self.dragging_piece],
-                                 (mouse_pos[0] - self.square_size//2,
-                                 mouse_pos[1] - self.square_size//2))
+            self._update_analysis()
+            self.profiler.record('events', time.perf_counter() - events_start)
 
-            pygame.display.flip()
+            self.render()
+            self.profiler.end_frame()
 
+        self.engine.stop()
         pygame.quit()
 
 
 if __name__ == "__main__":
-    visualizer = ChessVisualizer()
+    parser = argparse.ArgumentParser(description="Visualize the moves of chess and shogi variant pieces.")
+    parser.add_argument('--dirty', action='store_true',
+                        help="redraw and push only the changed parts of the window (see render)")
+    args = parser.parse_args()
+    visualizer = ChessVisualizer(dirty_rendering=args.dirty)
     visualizer.run()
@@ -0,0 +1,75 @@
+"""
+Headless core of the chess visualizer: the board model, legal moves and
+saving and loading positions.
+
+Nothing here imports pygame, so scripts, batch tools and worker processes can
+use the move logic without a display and without paying for pygame at import
+(see chess_visualizer.py for the GUI on top of it). Keep it that way: check
+with `python -X importtime -c "import core"` that pygame does not show up.
+
+Positions are saved as one "row,col,piece_key" line per piece, the
+board_position.txt format of the GUI's Save/Load buttons.
+"""
+from typing import Dict, List, Optional, Tuple
+
+# Board, BitBoard, generate_moves and legal_targets are part of the core API as well
+from bitboard import BitBoard
+from board import Board
+from movegen import generate_legal_moves, generate_moves, legal_targets
+from pieces import get_piece_rank
+
+POSITION_FILE = "board_position.txt"
+MIN_BOARD_SIZE = 4
+MAX_BOARD_SIZE = 300
+
+
+def new_board(board_size: int, pieces: Optional[Dict[Tuple[int, int], str]] = None,
+              use_bitboard: bool = False) -> Board:
+    """Create a board from a {(row, col): piece_key} mapping, ranking each piece by its
+    default rank. Pieces that fall outside the board are dropped."""
+    board = BitBoard(board_size) if use_bitboard else Board(board_size)
+    for pos, piece_key in (pieces or {}).items():
+        if 0 <= pos[0] < board_size and 0 <= pos[1] < board_size:
+            board[pos] = (piece_key, get_piece_rank(piece_key))
+    return board
+
+
+def get_legal_moves(board, square: Tuple[int, int]) -> List:
+    """Get the (move, highlight color) list for the piece on a square, in the board's own
+    en passant state."""
+    return generate_legal_moves(board, square, board.en_passant_target)
+
+
+def board_state(board) -> List[Tuple[Tuple[int, int], str]]:
+    """The ((row, col), piece_key) list that save_board_state writes."""
+    return [(pos, piece_key) for pos, (piece_key, _) in board.items()]
+
+
+def save_board_state(board_state, filename=POSITION_FILE):
+    """
+    board_state: list of ((row, col), piece_name) tuples
+    """
+    with open(filename, "w") as f:
+        for (row, col), piece_name in board_state:
+            f.write(f"{row},{col},{piece_name}\n")
+
+
+def load_board_state(filename=POSITION_FILE):
+    """
+    Returns: list of ((row, col), piece_name) tuples
+    """
+    board_state = []
+    try:
+        with open(filename, "r") as f:
+            for line in f:
+                row, col, piece_name = line.strip().split(",", 2)
+                board_state.append(((int(row), int(col)), piece_name))
+    except FileNotFoundError:
+        # If the file does not exist, just return an empty list
+        return []
+    return board_state
+
+
+def load_board(filename: str, board_size: int, use_bitboard: bool = False) -> Board:
+    """Load a saved position onto a board of board_size; a missing file gives an empty board."""
+    return new_board(board_size, dict(load_board_state(filename)), use_bitboard)
@@ -0,0 +1,290 @@
+"""
+Alpha-beta analysis engine for variant positions.
+
+Searcher runs an iterative deepening negamax alpha-beta search over the
+project's own move generation (movegen), so every piece in pieces.py is
+covered, with a transposition table keyed on the board's Zobrist hash. The
+evaluation is plain material: the sum of piece ranks (see get_piece_rank) for
+the side to move minus the opponent's. Like the GUI, moves are pseudo-legal,
+so a king is simply a valuable piece that can be captured.
+
+AnalysisEngine runs a Searcher on a copy of the board in a background
+thread, so the visualizer keeps rendering while it thinks, and can be
+stopped at any time without waiting for the search to wind down. The latest
+completed depth is published in info.
+
+parallel_search splits the root moves over worker processes instead (see
+parallel.py); with --workers the CLI runs it and reports the speedup over a
+single core.
+
+    python engine.py standard --depth 4
+    python engine.py large_multiqueen --depth 3 --workers 4
+"""
+import argparse
+import sys
+import threading
+import time
+from typing import List, NamedTuple, Optional, Tuple
+
+from board import PIECE_COLORS, PIECE_RANKS
+from movegen import generate_moves
+from parallel import split_root_moves
+from zobrist import EXACT, LOWER_BOUND, UPPER_BOUND, TranspositionTable
+
+DEFAULT_MAX_DEPTH = 64  # Analysis keeps deepening until stopped
+ENGINE_TT_SIZE = 1 << 18
+ROOT_MOVE_TT_SIZE = 1 << 16  # Table of each root move search in parallel_search
+INFINITY = float('inf')
+
+Move = Tuple[Tuple[int, int], Tuple[int, int]]
+
+
+class SearchCancelled(Exception):
+    pass
+
+
+class AnalysisInfo(NamedTuple):
+    depth: int
+    score: float  # From the point of view of the side to move
+    best_line: List[Move]
+    nodes: int
+    elapsed: float
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def evaluate(board) -> float:
+    """Material balance by piece rank, from the point of view of the side to move."""
+    score = 0
+    for pos in board:
+        code = board.code_at(pos)
+        score += PIECE_RANKS[code] if PIECE_COLORS[code] == 'White' else -PIECE_RANKS[code]
+    return score if board.is_white_turn else -score
+
+
+def format_move(move: Move) -> str:
+    (start_row, start_col), (end_row, end_col) = move
+    return f"{start_row},{start_col}-{end_row},{end_col}"
+
+
+class Searcher:
+    def __init__(self, board, tt: Optional[TranspositionTable] = None, stop_event: Optional[threading.Event] = None):
+        self.board = board  # Searched in place with make/unmake; unchanged when the search returns
+        self.tt = tt if tt is not None else TranspositionTable(ENGINE_TT_SIZE)
+        self.stop_event = stop_event
+        self._check = self._check_stop if stop_event is not None else None  # See generate_moves
+        self.nodes = 0
+
+    def iterative_deepening(self, max_depth: int, on_depth=None) -> Optional[AnalysisInfo]:
+        """Search depth 1, 2, ... max_depth, calling on_depth with each completed AnalysisInfo.
+        Returns the deepest completed result, also when cancelled midway."""
+        self.tt.new_search()
+        self.nodes = 0
+        start = time.perf_counter()
+        info = None
+        for depth in range(1, max_depth + 1):
+            try:
+                score = self.negamax(depth, -INFINITY, INFINITY)
+            except SearchCancelled:
+                break
+            info = AnalysisInfo(depth, score, self.principal_variation(depth), self.nodes,
+                                time.perf_counter() - start)
+            if on_depth:
+                on_depth(info)
+            if not info.best_line:
+                break  # No moves, deeper searches find nothing new
+        return info
+
+    def _check_stop(self):
+        if self.stop_event.is_set():
+            raise SearchCancelled()
+
+    def negamax(self, depth: int, alpha: float, beta: float) -> float:
+        self.nodes += 1
+        # Checked on every node and, through generate_moves, between pieces: one node
+        # generates the moves of every piece, which takes seconds on a large, full board
+        if self._check is not None:
+            self._check()
+
+        board = self.board
+        key = board.zobrist_hash()
+        entry = self.tt.probe(key)
+        if entry is not None and entry.depth >= depth:
+            if entry.bound == EXACT:
+                return entry.value
+            if entry.bound == LOWER_BOUND and entry.value >= beta:
+                return entry.value
+            if entry.bound == UPPER_BOUND and entry.value <= alpha:
+                return entry.value
+        if depth == 0:
+            return evaluate(board)
+
+        moves = generate_moves(board, self._check)
+        if not moves:
+            return evaluate(board)
+        self._order_moves(moves, entry.best_move if entry is not None else None)
+
+        original_alpha = alpha
+        best_score = -INFINITY
+        best_move = None
+        for move in moves:
+            board.make_move(*move)
+            try:
+                score = -self.negamax(depth - 1, -beta, -alpha)
+            finally:
+                board.unmake_move()
+            if score > best_score:
+                best_score, best_move = score, move
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if best_score <= original_alpha:
+            bound = UPPER_BOUND
+        elif best_score >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self.tt.store(key, depth, best_score, bound, best_move)
+        return best_score
+
+    def _order_moves(self, moves: List[Move], hash_move: Optional[Move]):
+        """Hash move first, then captures of the highest-ranked pieces."""
+        board = self.board
+
+        def order(move):
+            if move == hash_move:
+                return -INFINITY
+            return -PIECE_RANKS[board.code_at(move[1])]
+        moves.sort(key=order)
+
+    def principal_variation(self, depth: int) -> List[Move]:
+        """Follow the best moves stored in the transposition table from the root."""
+        line = []
+        seen = set()
+        try:
+            while len(line) < depth:
+                key = self.board.zobrist_hash()
+                entry = self.tt.probe(key)
+                if entry is None or entry.best_move is None or key in seen:
+                    break
+                seen.add(key)
+                self.board.make_move(*entry.best_move)
+                line.append(entry.best_move)
+        finally:
+            for _ in line:
+                self.board.unmake_move()
+        return line
+
+
+def _search_below(board, depth):
+    """Search a position after a root move; returns its score, nodes and best line."""
+    searcher = Searcher(board, TranspositionTable(ROOT_MOVE_TT_SIZE))
+    score = searcher.negamax(depth, -INFINITY, INFINITY)
+    return score, searcher.nodes, searcher.principal_variation(depth)
+
+
+def parallel_search(board, depth: int, workers: Optional[int] = None) -> AnalysisInfo:
+    """Search depth plies with the root moves split over worker processes. Each root move
+    is searched with a full window and a table of its own, so no bounds are shared between
+    workers: more nodes than Searcher, but the result does not depend on the worker count."""
+    start = time.perf_counter()
+    results = split_root_moves(board, _search_below, (depth - 1,), workers)
+    nodes = 1
+    best_score, best_line = -INFINITY, []
+    for move, (score, move_nodes, line) in results.items():
+        nodes += move_nodes
+        if -score > best_score:  # Ties keep the first move in generation order
+            best_score, best_line = -score, [move] + line
+    if not results:
+        best_score = evaluate(board)
+    return AnalysisInfo(depth, best_score, best_line, nodes, time.perf_counter() - start)
+
+
+class AnalysisEngine:
+    """Analyses a position on a worker thread until stopped or max_depth is reached."""
+
+    def __init__(self, max_depth: int = DEFAULT_MAX_DEPTH, tt_size: int = ENGINE_TT_SIZE):
+        self.max_depth = max_depth
+        self.tt_size = tt_size  # Every search gets a table of its own, see start
+        self.info = None  # Latest completed AnalysisInfo
+        self.position_hash = None  # zobrist_hash of the position being analysed
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, board):
+        """Start analysing a snapshot of board, stopping any analysis in progress."""
+        # The old search is not joined, so the caller never blocks on it. It stops at its
+        # next node, drops its results (see publish) and has its own table to write to.
+        self.stop(wait=False)
+        self.position_hash = board.zobrist_hash()
+        stop_event = self._stop_event = threading.Event()
+        searcher = Searcher(board.copy(), TranspositionTable(self.tt_size), stop_event)
+
+        def publish(info):
+            if not stop_event.is_set():  # A search stopped without waiting may still finish a depth
+                self.info = info
+        self._thread = threading.Thread(target=searcher.iterative_deepening,
+                                        args=(self.max_depth, publish), daemon=True)
+        self._thread.start()
+
+    def stop(self, wait: bool = True):
+        """Stop the analysis and forget its position, so the next start always searches anew."""
+        self._stop_event.set()
+        if wait and self._thread is not None:
+            self._thread.join()
+        self._thread = None
+        self.position_hash = None
+        self.info = None
+
+    def summary(self) -> str:
+        """One-line report of the latest depth, for the settings bar."""
+        info = self.info
+        if info is None:
+            return "Analysing..."
+        line = " ".join(format_move(move) for move in info.best_line[:3])
+        return f"Depth {info.depth}  {info.score:+g}  {line}  {info.nodes_per_second / 1000:.0f}k n/s"
+
+
+def main(argv=None):
+    from perft import preset_board
+    from presets import get_all_presets
+
+    parser = argparse.ArgumentParser(description="Analyse a preset position with alpha-beta search.")
+    parser.add_argument('preset', choices=sorted(get_all_presets()))
+    parser.add_argument('--depth', type=int, default=4)
+    parser.add_argument('--size', type=int, help="board size for presets that scale (standard)")
+    parser.add_argument('--black', action='store_true', help="black to move")
+    parser.add_argument('--workers', type=int, default=1, help="processes to split the root moves over")
+    args = parser.parse_args(argv)
+
+    board = preset_board(args.preset, args.size)
+    board.is_white_turn = not args.black
+
+    def report(info, label=""):
+        print(f"{label}depth {info.depth}  score {info.score:+g}  nodes {info.nodes}  "
+              f"{info.nodes_per_second:,.0f} n/s  pv {' '.join(format_move(move) for move in info.best_line)}")
+
+    if args.workers > 1 and args.depth > 0:
+        info = parallel_search(board, args.depth, args.workers)
+        report(info, f"{args.workers} workers: ")
+        single_core = parallel_search(board, args.depth, 1)
+        report(single_core, "single core: ")
+        if single_core[:3] != info[:3]:
+            print("MISMATCH: the single-core result differs")
+            return 1
+        print(f"{info.elapsed:.3f}s vs {single_core.elapsed:.3f}s, speedup {single_core.elapsed / info.elapsed:.2f}x")
+        return 0
+
+    Searcher(board).iterative_deepening(args.depth, on_depth=report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
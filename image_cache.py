@@ -0,0 +1,159 @@
+"""
+Piece image cache for the chess visualizer.
+
+The PNGs in pieces/ are decoded once and converted to the display's pixel
+format. Sprites scaled to a square size are kept in a small LRU keyed on that
+size, so growing or shrinking the board back to a size that was already shown
+does not touch the disk or rescale anything. New sizes are scaled from a
+lazily built mipmap chain (each level half the size of the one before it),
+so tiny squares on very large boards come from one cheap scale of a small
+level instead of a smoothscale of the full-size image.
+
+Every image set, the originals as well as each scaled size, lives in one
+packed atlas surface; the images handed out are subsurfaces of it. The
+original atlas and its key -> rect index are also written to disk, so a cold
+start loads one PNG instead of decoding every piece image separately.
+"""
+import json
+import math
+import os
+from collections import OrderedDict
+
+import pygame
+
+from pieces import AVAILABLE_PIECES
+
+IMAGE_DIR = "pieces"
+IMAGE_CACHE_MAX_SIZES = 16  # Number of square sizes kept scaled at once
+ATLAS_CACHE_DIR = ".atlas_cache"
+ATLAS_CACHE_NAME = "pieces_atlas"
+
+
+def pack_atlas(images):
+    """Pack images onto a grid of equal cells in one surface.
+    Returns the atlas and a piece_key -> Rect index."""
+    if not images:
+        return pygame.Surface((1, 1), pygame.SRCALPHA), {}
+    cell_width = max(image.get_width() for image in images.values())
+    cell_height = max(image.get_height() for image in images.values())
+    columns = math.ceil(math.sqrt(len(images)))
+    rows = math.ceil(len(images) / columns)
+    atlas = pygame.Surface((columns * cell_width, rows * cell_height), pygame.SRCALPHA)
+    index = {}
+    for i, (piece_key, image) in enumerate(images.items()):
+        pos = ((i % columns) * cell_width, (i // columns) * cell_height)
+        # The atlas starts fully transparent, so a max blend copies the pixels unchanged
+        atlas.blit(image, pos, special_flags=pygame.BLEND_RGBA_MAX)
+        index[piece_key] = pygame.Rect(pos, image.get_size())
+    return atlas, index
+
+
+def atlas_images(atlas, index):
+    """Get each packed image as a subsurface of the atlas."""
+    return {piece_key: atlas.subsurface(rect) for piece_key, rect in index.items()}
+
+
+class PieceImageCache:
+    def __init__(self, image_dir=IMAGE_DIR, max_sizes=IMAGE_CACHE_MAX_SIZES, cache_dir=ATLAS_CACHE_DIR):
+        self.image_dir = image_dir
+        self.max_sizes = max_sizes
+        self.cache_dir = cache_dir  # Where the original atlas is kept on disk; None disables it
+        self._originals = None  # piece_key -> decoded full-size image
+        self._mipmaps = {}  # piece_key -> [full-size image, half size, quarter size, ...]
+        self._scaled = OrderedDict()  # square_size -> {piece_key: image}, least recently used first
+
+    def get_originals(self):
+        """Decode every available piece image once, from the disk atlas when it is current."""
+        if self._originals is None:
+            image_paths = {}
+            for file_name in AVAILABLE_PIECES:
+                image_path = os.path.join(self.image_dir, f"{file_name}.png")
+                if os.path.exists(image_path):
+                    image_paths[file_name] = image_path
+            source = [[file_name, os.stat(path).st_mtime_ns, os.stat(path).st_size]
+                      for file_name, path in image_paths.items()]
+
+            cached = self._load_atlas(source)
+            if cached is None:
+                atlas, index = pack_atlas({file_name: pygame.image.load(path)
+                                           for file_name, path in image_paths.items()})
+                self._save_atlas(atlas, index, source)
+            else:
+                atlas, index = cached
+            # Match the display format once a window exists, so blits need no conversion
+            if pygame.display.get_surface() is not None:
+                atlas = atlas.convert_alpha()
+            self._originals = atlas_images(atlas, index)
+        return self._originals
+
+    def _atlas_paths(self):
+        base = os.path.join(self.cache_dir, ATLAS_CACHE_NAME)
+        return base + ".png", base + ".json"
+
+    def _load_atlas(self, source):
+        """Load the disk atlas if it was built from the same source files, else None."""
+        if self.cache_dir is None:
+            return None
+        image_path, index_path = self._atlas_paths()
+        try:
+            with open(index_path) as f:
+                cached = json.load(f)
+            if cached["source"] != source:
+                return None
+            index = {piece_key: pygame.Rect(rect) for piece_key, rect in cached["rects"].items()}
+            return pygame.image.load(image_path), index
+        except (OSError, ValueError, KeyError, TypeError, pygame.error):
+            return None
+
+    def _save_atlas(self, atlas, index, source):
+        """Write the atlas to disk; a cache that cannot be written is simply skipped."""
+        if self.cache_dir is None:
+            return
+        image_path, index_path = self._atlas_paths()
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            pygame.image.save(atlas, image_path)
+            with open(index_path, 'w') as f:
+                json.dump({'source': source,
+                           'rects': {piece_key: list(rect) for piece_key, rect in index.items()}}, f)
+        except (OSError, pygame.error):
+            pass
+
+    def get_images(self, square_size):
+        """Get every piece image scaled to square_size."""
+        images = self._scaled.get(square_size)
+        if images is not None:
+            self._scaled.move_to_end(square_size)
+            return images
+
+        images = atlas_images(*pack_atlas({
+            piece_key: pygame.transform.smoothscale(self.get_mipmap_level(piece_key, square_size),
+                                                    (square_size, square_size))
+            for piece_key in self.get_originals()}))
+        self._scaled[square_size] = images
+        while len(self._scaled) > self.max_sizes:
+            self._scaled.popitem(last=False)
+        return images
+
+    def get_mipmap_level(self, piece_key, square_size):
+        """Get the smallest mipmap level of a piece image that is still at least square_size,
+        halving further down the chain only as far as the first request that needs it."""
+        levels = self._mipmaps.get(piece_key)
+        if levels is None:
+            levels = self._mipmaps[piece_key] = [self.get_originals()[piece_key]]
+        for level in levels:
+            if min(level.get_size()) // 2 < square_size:
+                return level
+        while True:
+            width, height = levels[-1].get_size()
+            if min(width, height) // 2 < square_size:
+                return levels[-1]
+            levels.append(pygame.transform.smoothscale(levels[-1], (width // 2, height // 2)))
+
+    def clear(self):
+        self._originals = None
+        self._mipmaps.clear()
+        self._scaled.clear()
+
+    def __len__(self):
+        return len(self._scaled)
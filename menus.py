@@ -1,5 +1,7 @@
 import pygame
 from presets import get_all_presets
+# Saving and loading positions lives in the headless core; kept importable from here
+from core import save_board_state, load_board_state
 
 # Constants
 WINDOW_SIZE = 800
@@ -9,8 +11,30 @@ SETTINGS_BAR_COLOR = (200, 200, 200)
 BUTTON_COLOR = (100, 100, 100)
 BUTTON_HOVER_COLOR = (150, 150, 150)
 TEXT_COLOR = (0, 0, 0)
+ANALYSIS_FONT_SIZE = 18
 PANEL_COLOR = (180, 180, 180)
 
+# Fonts and rendered text are shared by every menu, see render_text
+_fonts = {}
+_text_cache = {}
+
+
+def get_font(size):
+    """Get the default font at a size, created once."""
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.Font(None, size)
+    return font
+
+
+def render_text(text, size=24, color=TEXT_COLOR):
+    """Render a label once and reuse the surface for every later request."""
+    key = (text, size, color)
+    surface = _text_cache.get(key)
+    if surface is None:
+        surface = _text_cache[key] = get_font(size).render(text, True, color)
+    return surface
+
 
 class SettingsBar:
     def __init__(self, board_size):
@@ -20,7 +44,8 @@ class SettingsBar:
                                 0,
                                 self.width,
                                 self.height)
-        self.font = pygame.font.Font(None, 24)
+        self.font = get_font(24)
+        self._layer = None  # Pre-composited bar, rebuilt when a label changes
 
         # Create buttons
         button_width = 100
@@ -32,51 +57,47 @@ class SettingsBar:
                                         button_y,
                                         button_width,
                                         button_height)
-        self.decrease_text = self.font.render("- Board",
-                                              True,
-                                              TEXT_COLOR)
+        self.decrease_text = render_text("- Board")
 
         # Increase size button
         self.increase_btn = pygame.Rect(120,
                                         button_y,
                                         button_width,
                                         button_height)
-        self.increase_text = self.font.render("+ Board",
-                                              True,
-                                              TEXT_COLOR)
+        self.increase_text = render_text("+ Board")
 
         # Save/Load buttons
         self.save_btn = pygame.Rect(240, button_y, button_width, button_height)
-        self.save_text = self.font.render("Save Pos", True, TEXT_COLOR)
+        self.save_text = render_text("Save Pos")
         self.load_btn = pygame.Rect(350, button_y, button_width, button_height)
-        self.load_text = self.font.render("Load Pos", True, TEXT_COLOR)
+        self.load_text = render_text("Load Pos")
 
         # Turn toggle button
         self.turn_btn = pygame.Rect(self.width - button_width - 10,
                                     button_y,
                                     button_width,
                                     button_height)
-        self.turn_text = self.font.render("White's Turn",
-                                          True,
-                                          TEXT_COLOR)
+        self.turn_text = render_text("White's Turn")
 
         # Preset button
         self.preset_btn = pygame.Rect(self.width - 2 * button_width - 20,
                                       button_y,
                                       button_width,
                                       button_height)
-        self.preset_text = self.font.render("Presets",
-                                            True,
-                                            TEXT_COLOR)
+        self.preset_text = render_text("Presets")
 
-        # Size text
-        self.size_text = self.font.render(f"Board Size: {board_size}x{board_size}",
-                                          True,
-                                          TEXT_COLOR)
-        self.size_text_rect = self.size_text.get_rect(centerx=self.width//2,
-                                                      centery=self.height//2)
+        # Size text, with the engine analysis line below it while analysis runs
+        self.analysis_text = None
+        self.update_size_text(board_size)
 
     def draw(self, screen):
+        if self._layer is None:
+            self._layer = pygame.Surface(self.rect.size)
+            self._draw_layer(self._layer)
+        screen.blit(self._layer, self.rect)
+
+    def _draw_layer(self, screen):
+        # The bar sits at the window origin, so it draws with screen coordinates
         # Draw settings bar background
         pygame.draw.rect(screen, SETTINGS_BAR_COLOR, self.rect)
 
@@ -110,6 +131,8 @@ class SettingsBar:
 
         # Draw size text
         screen.blit(self.size_text, self.size_text_rect)
+        if self.analysis_text is not None:
+            screen.blit(self.analysis_text, self.analysis_text_rect)
 
     def handle_click(self, pos):
         if self.decrease_btn.collidepoint(pos):
@@ -127,16 +150,29 @@ class SettingsBar:
         return None
 
     def update_size_text(self, board_size):
-        self.size_text = self.font.render(f"Board Size: {board_size}x{board_size}",
-                                          True,
-                                          TEXT_COLOR)
-        self.size_text_rect = self.size_text.get_rect(centerx=self.width//2,
-                                                      centery=self.height//2)
+        self.size_text = render_text(f"Board Size: {board_size}x{board_size}")
+        self._place_center_text()
+
+    def update_analysis_text(self, text):
+        """Show a line of engine analysis under the size text, or hide it with None."""
+        # Not cached with render_text: every search depth produces a new line
+        self.analysis_text = None if text is None else get_font(ANALYSIS_FONT_SIZE).render(text, True, TEXT_COLOR)
+        self._place_center_text()
+
+    def _place_center_text(self):
+        if self.analysis_text is None:
+            self.size_text_rect = self.size_text.get_rect(centerx=self.width//2,
+                                                          centery=self.height//2)
+        else:
+            self.size_text_rect = self.size_text.get_rect(centerx=self.width//2,
+                                                          bottom=self.height//2 + 2)
+            self.analysis_text_rect = self.analysis_text.get_rect(centerx=self.width//2,
+                                                                  top=self.height//2 + 4)
+        self._layer = None
 
     def update_turn_text(self, is_white_turn):
-        self.turn_text = self.font.render("White's Turn" if is_white_turn else "Black's Turn",
-                                          True,
-                                          TEXT_COLOR)
+        self.turn_text = render_text("White's Turn" if is_white_turn else "Black's Turn")
+        self._layer = None
 
 
 class PiecePanel:
@@ -181,20 +217,36 @@ class PiecePanel:
         self.white_x = self.x + (self.width // 4) - (self.square_size // 2)
         self.black_x = self.x + (3 * self.width // 4) - (self.square_size // 2)
 
+        self._page_layers = {}  # page -> pre-composited panel surface
+
     def draw(self, screen):
+        # Each page is composited once into its own layer
+        layer = self._page_layers.get(self.current_page)
+        if layer is None:
+            layer = pygame.Surface((self.width, self.height))
+            self._draw_page(layer, self.current_page, (0, 0))
+            self._page_layers[self.current_page] = layer
+        screen.blit(layer, (self.x, self.y))
+
+    def _draw_page(self, screen, page, origin):
+        """Draw a page of the panel with its top-left corner at origin."""
+        x, y = origin
+        white_x = self.white_x - self.x + x
+        black_x = self.black_x - self.x + x
+
         # Draw panel background
-        pygame.draw.rect(screen, PANEL_COLOR, (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(screen, PANEL_COLOR, (x, y, self.width, self.height))
 
         # Draw navigation buttons
         prev_button_rect = pygame.Rect(
-            self.x + self.button_margin,
-            self.y + self.button_margin,
+            x + self.button_margin,
+            y + self.button_margin,
             self.button_width,
             self.button_height
         )
         next_button_rect = pygame.Rect(
-            self.x + self.width - self.button_width - self.button_margin,
-            self.y + self.button_margin,
+            x + self.width - self.button_width - self.button_margin,
+            y + self.button_margin,
             self.button_width,
             self.button_height
         )
@@ -204,16 +256,9 @@ class PiecePanel:
         pygame.draw.rect(screen, (200, 200, 200), next_button_rect)
 
         # Draw button text
-        font = pygame.font.Font(None, 24)
-        prev_text = font.render("Prev",
-                                True,
-                                (0, 0, 0))
-        next_text = font.render("Next",
-                                True,
-                                (0, 0, 0))
-        page_text = font.render(f"Page {self.current_page + 1}/{self.total_pages}",
-                                True,
-                                (0, 0, 0))
+        prev_text = render_text("Prev")
+        next_text = render_text("Next")
+        page_text = render_text(f"Page {page + 1}/{self.total_pages}")
 
         screen.blit(prev_text,
                     (prev_button_rect.centerx - prev_text.get_width()//2,
@@ -222,32 +267,32 @@ class PiecePanel:
                     (next_button_rect.centerx - next_text.get_width()//2,
                      next_button_rect.centery - next_text.get_height()//2))
         screen.blit(page_text,
-                    (self.x + self.width//2 - page_text.get_width()//2,
-                     self.y + self.button_margin + self.button_height//2 - page_text.get_height()//2))
+                    (x + self.width//2 - page_text.get_width()//2,
+                     y + self.button_margin + self.button_height//2 - page_text.get_height()//2))
 
         # Draw column headers
-        white_header = font.render("White", True, (0, 0, 0))
-        black_header = font.render("Black", True, (0, 0, 0))
-        header_y = self.y + 2 * (self.button_height + self.button_margin)
+        white_header = render_text("White")
+        black_header = render_text("Black")
+        header_y = y + 2 * (self.button_height + self.button_margin)
 
         screen.blit(white_header,
-                    (self.white_x + (self.square_size - white_header.get_width())//2,
+                    (white_x + (self.square_size - white_header.get_width())//2,
                      header_y))
         screen.blit(black_header,
-                    (self.black_x + (self.square_size - black_header.get_width())//2,
+                    (black_x + (self.square_size - black_header.get_width())//2,
                      header_y))
 
-        # Draw pieces for current page
-        start_idx = self.current_page * self.pieces_per_page
+        # Draw pieces for the page
+        start_idx = page * self.pieces_per_page
         end_idx = min(start_idx + self.pieces_per_page, len(self.piece_pairs))
 
         for i, (white_key, black_key) in enumerate(self.piece_pairs[start_idx:end_idx]):
             piece_y = header_y + 30 + (i * self.piece_spacing)
 
             # Draw white piece
-            screen.blit(self.piece_images[white_key], (self.white_x, piece_y))
+            screen.blit(self.piece_images[white_key], (white_x, piece_y))
             # Draw black piece
-            screen.blit(self.piece_images[black_key], (self.black_x, piece_y))
+            screen.blit(self.piece_images[black_key], (black_x, piece_y))
 
     def handle_click(self, pos):
         x, y = pos
@@ -312,9 +357,11 @@ class PresetMenu:
         self.x = (screen_width - self.width) // 2
         self.y = (screen_height - self.height) // 2
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        self.font = pygame.font.Font(None, 24)
-        self.title_font = pygame.font.Font(None, 32)
+        self.font = get_font(24)
+        self.title_font = get_font(32)
         self.visible = False
+        self._dim = None  # Semi-transparent full-screen background, reused while the size holds
+        self._layer = None  # Pre-composited menu box, rebuilt when the buttons change
         self.presets = get_all_presets()
         self.buttons = []
         self.close_button = pygame.Rect(self.x + self.width - 30,
@@ -327,42 +374,55 @@ class PresetMenu:
         self.buttons = []
         y_offset = self.y + 50
         for preset_name, preset in self.presets.items():
-            text = self.font.render(preset['name'], True, TEXT_COLOR)
+            text = render_text(preset['name'])
             button_rect = pygame.Rect(self.x + 10,
                                       y_offset, self.width - 20,
                                       30)
             self.buttons.append((button_rect, preset_name, text))
             y_offset += 40
+        self._layer = None
 
     def draw(self, screen):
         if not self.visible:
             return
 
         # Draw semi-transparent background
-        s = pygame.Surface((screen.get_width(), screen.get_height()),
-                           pygame.SRCALPHA)
-        s.fill((0, 0, 0, 128))
-        screen.blit(s, (0, 0))
+        if self._dim is None or self._dim.get_size() != screen.get_size():
+            self._dim = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+            self._dim.fill((0, 0, 0, 128))
+        screen.blit(self._dim, (0, 0))
+
+        if self._layer is None:
+            self._layer = pygame.Surface(self.rect.size)
+            self._draw_layer(self._layer, (0, 0))
+        screen.blit(self._layer, self.rect)
+
+    def _draw_layer(self, screen, origin):
+        """Draw the menu box with its top-left corner at origin."""
+        dx, dy = origin[0] - self.x, origin[1] - self.y
+        rect = self.rect.move(dx, dy)
 
         # Draw menu background
-        pygame.draw.rect(screen, SETTINGS_BAR_COLOR, self.rect)
-        pygame.draw.rect(screen, TEXT_COLOR, self.rect, 2)
+        pygame.draw.rect(screen, SETTINGS_BAR_COLOR, rect)
+        pygame.draw.rect(screen, TEXT_COLOR, rect, 2)
 
         # Draw title
-        title = self.title_font.render("Select Preset", True, TEXT_COLOR)
+        title = render_text("Select Preset", 32)
         screen.blit(title,
-                    (self.x + (self.width - title.get_width()) // 2,
-                     self.y + 10))
+                    (rect.x + (self.width - title.get_width()) // 2,
+                     rect.y + 10))
 
         # Draw close button
-        pygame.draw.rect(screen, BUTTON_COLOR, self.close_button)
-        close_text = self.font.render("X", True, TEXT_COLOR)
+        close_button = self.close_button.move(dx, dy)
+        pygame.draw.rect(screen, BUTTON_COLOR, close_button)
+        close_text = render_text("X")
         screen.blit(close_text,
-                    (self.close_button.centerx - close_text.get_width() // 2,
-                     self.close_button.centery - close_text.get_height() // 2))
+                    (close_button.centerx - close_text.get_width() // 2,
+                     close_button.centery - close_text.get_height() // 2))
 
         # Draw buttons
         for button_rect, _, text in self.buttons:
+            button_rect = button_rect.move(dx, dy)
             pygame.draw.rect(screen, BUTTON_COLOR, button_rect)
             screen.blit(text, (button_rect.centerx - text.get_width() // 2,
                                button_rect.centery - text.get_height() // 2))
@@ -380,27 +440,3 @@ class PresetMenu:
             if button_rect.collidepoint(pos):
                 return preset_name
         return None
-
-
-def save_board_state(board_state, filename="board_position.txt"):
-    """
-    board_state: list of ((row, col), piece_name) tuples
-    """
-    with open(filename, "w") as f:
-        for (row, col), piece_name in board_state:
-            f.write(f"{row},{col},{piece_name}\n")
-
-def load_board_state(filename="board_position.txt"):
-    """
-    Returns: list of ((row, col), piece_name) tuples
-    """
-    board_state = []
-    try:
-        with open(filename, "r") as f:
-            for line in f:
-                row, col, piece_name = line.strip().split(",", 2)
-                board_state.append(((int(row), int(col)), piece_name))
-    except FileNotFoundError:
-        # If the file does not exist, just return an empty list
-        return []
-    return board_state
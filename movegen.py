@@ -0,0 +1,74 @@
+"""
+Legal move generation for the chess visualizer, independent of pygame.
+
+generate_legal_moves looks a piece up on a Board, takes its precomputed rays
+and runs them through the filter for its movement rules. It returns the same
+(move, highlight color) list the visualizer draws, so scripts, benchmarks and
+search can share the exact move logic of the GUI. legal_targets reduces that
+list to one entry per target square, and generate_moves lists every
+(start, end) move of the side to move.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from board import PIECE_COLORS, PIECE_TYPES, PIECE_RANKS
+from pieces import create_piece, ROYAL_PIECES, HOOK_MOVERS, JUMP_MOVERS, LIMITED_JUMPING_MOVERS
+from special_piece_moves import (jump_moves_filter, royal_moves_filter, hook_moves_filter,
+                                 limited_jumping_moves_filter, pawn_moves_filter, ray_moves_filter,
+                                 CAPTURE_COLOR)
+
+
+def filter_rays(board, square: Tuple[int, int], color: str, piece_type: str, rank: int, rays,
+                en_passant_target: Optional[Tuple[int, int]] = None) -> List:
+    """Apply the filter matching a piece type to its rays."""
+    if piece_type in JUMP_MOVERS:
+        return jump_moves_filter(board, square, color, rays)
+    elif piece_type in ROYAL_PIECES:
+        return royal_moves_filter(board, square, color, rank, rays)
+    elif piece_type in HOOK_MOVERS:
+        return hook_moves_filter(board, board.board_size, square, color, rays)
+    elif piece_type in LIMITED_JUMPING_MOVERS:
+        return limited_jumping_moves_filter(board, square, color, rays)
+    elif piece_type == 'Pawn':
+        return pawn_moves_filter(board, square, color, rays, en_passant_target)
+    # Non-jump movers walk each ray once, stopping at the first blocker
+    return ray_moves_filter(board, square, color, rays)
+
+
+def generate_legal_moves(board, square: Tuple[int, int],
+                         en_passant_target: Optional[Tuple[int, int]] = None) -> List:
+    """Get the (move, highlight color) list for the piece on a square."""
+    code = board.code_at(square)
+    if not code:
+        return []
+
+    # Look up color, piece type and rank from the piece code tables
+    color, piece_type, rank = PIECE_COLORS[code], PIECE_TYPES[code], PIECE_RANKS[code]
+
+    # Create piece and get its precomputed rays with jump information
+    piece = create_piece(piece_type, color, int(rank))
+    rays = piece.get_rays(square, board.board_size)
+    return filter_rays(board, square, color, piece_type, rank, rays, en_passant_target)
+
+
+def legal_targets(board, square: Tuple[int, int],
+                  en_passant_target: Optional[Tuple[int, int]] = None) -> Dict[Tuple[int, int], bool]:
+    """Map each square the piece on a square can move to, in move order, to whether it captures."""
+    # Filters may reach a square along more than one ray; each target is one move
+    targets = {}
+    for move, highlight in generate_legal_moves(board, square, en_passant_target):
+        targets[move] = targets.get(move, False) or highlight == CAPTURE_COLOR
+    return targets
+
+
+def generate_moves(board, check=None):
+    """List every (start, end) move for the side to move. check, if given, is called before
+    each piece; a search passes one that raises to cancel midway through a large board."""
+    color = 'White' if board.is_white_turn else 'Black'
+    moves = []
+    for square in list(board):
+        if board.color_at(square) == color:
+            if check is not None:
+                check()
+            for end in legal_targets(board, square, board.en_passant_target):
+                moves.append((square, end))
+    return moves
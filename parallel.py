@@ -0,0 +1,60 @@
+"""
+Root splitting over a process pool, for perft and search.
+
+The root moves of a position are spread over worker processes. Each worker
+decodes the board once, from the compact Board.to_bytes encoding sent by its
+initializer, and then only receives root moves, which it plays on that board
+before running the task below them and takes back afterwards. Results come back in root move
+order whatever order the workers finish in, so a run gives the same result
+for any worker count. With one worker the tasks run in this process, which
+is the single-core baseline the speedup is measured against.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from bitboard import BitBoard
+from board import Board
+from movegen import generate_moves
+
+TASKS_PER_WORKER = 4  # Root moves are sent in chunks, about this many per worker
+
+_worker_board = None  # Board decoded by each worker process, see _init_worker
+
+
+def _init_worker(data, use_bitboard):
+    global _worker_board
+    _worker_board = (BitBoard if use_bitboard else Board).from_bytes(data)
+
+
+def _run_root_move(task, args, move):
+    return _run_below(_worker_board, task, args, move)
+
+
+def _run_below(board, task, args, move):
+    board.make_move(*move)
+    try:
+        return task(board, *args)
+    finally:
+        board.unmake_move()
+
+
+def default_workers():
+    return os.cpu_count() or 1
+
+
+def split_root_moves(board, task, args=(), workers=None, moves=None):
+    """Run task(board, *args) on the position after each root move, in workers processes.
+    task must be a module-level function so it can be sent to the workers. Returns
+    {move: result} in the order of moves (default: generate_moves(board))."""
+    if moves is None:
+        moves = generate_moves(board)
+    workers = workers or default_workers()
+    if workers == 1 or len(moves) < 2:
+        return {move: _run_below(board, task, args, move) for move in moves}
+
+    chunksize = max(1, len(moves) // (workers * TASKS_PER_WORKER))
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(board.to_bytes(), isinstance(board, BitBoard))) as pool:
+        results = pool.map(partial(_run_root_move, task, args), moves, chunksize=chunksize)
+        return dict(zip(moves, results))
@@ -0,0 +1,114 @@
+"""
+Perft node counter for variant positions.
+
+perft walks the move tree of a position to a fixed depth and counts the leaf
+nodes, using the same move generation as the visualizer (movegen). Moves are
+pseudo-legal, as in the GUI: there is no check detection, and capturing a
+king does not end the game. Divide mode prints the count below each root
+move, which narrows down where two move generators disagree.
+
+With --workers the root moves are split over that many processes (see
+parallel.py), and the run is repeated on a single core to report the speedup.
+
+    python perft.py standard 3
+    python perft.py shogi_standard 2 --divide
+    python perft.py standard 3 --size 10 --bitboard
+    python perft.py large_multiqueen 3 --workers 4
+"""
+import argparse
+import sys
+import time
+
+from core import generate_moves, new_board
+from parallel import split_root_moves
+from presets import get_all_presets, get_preset
+
+
+def preset_board(preset_name, board_size=None, use_bitboard=False):
+    """Create a board from a preset; board_size only applies to presets that scale."""
+    preset = get_preset(preset_name, board_size)
+    if preset is None:
+        raise ValueError(f"Unknown preset: {preset_name}")
+    return new_board(preset['size'], preset['pieces'], use_bitboard)
+
+
+def perft(board, depth):
+    """Count the leaf nodes of the move tree depth plies deep. Moves are made and
+    unmade in place, so the board is unchanged afterwards."""
+    if depth == 0:
+        return 1
+    moves = generate_moves(board)
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for start, end in moves:
+        board.make_move(start, end)
+        nodes += perft(board, depth - 1)
+        board.unmake_move()
+    return nodes
+
+
+def divide(board, depth):
+    """Map each root move to the node count below it."""
+    counts = {}
+    for start, end in generate_moves(board):
+        board.make_move(start, end)
+        counts[(start, end)] = perft(board, depth - 1)
+        board.unmake_move()
+    return counts
+
+
+def parallel_divide(board, depth, workers=None):
+    """divide with the root moves split over worker processes; the same counts in the same order."""
+    return split_root_moves(board, perft, (depth - 1,), workers)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count move-tree nodes from a preset position.")
+    parser.add_argument('preset', choices=sorted(get_all_presets()))
+    parser.add_argument('depth', type=int)
+    parser.add_argument('--size', type=int, help="board size for presets that scale (standard)")
+    parser.add_argument('--black', action='store_true', help="black to move")
+    parser.add_argument('--divide', action='store_true', help="print the node count per root move")
+    parser.add_argument('--bitboard', action='store_true', help="use the BitBoard backend")
+    parser.add_argument('--workers', type=int, default=1, help="processes to split the root moves over")
+    args = parser.parse_args(argv)
+
+    board = preset_board(args.preset, args.size, args.bitboard)
+    board.is_white_turn = not args.black
+    start = time.perf_counter()
+    if args.workers > 1 and args.depth > 0:
+        counts = parallel_divide(board, args.depth, args.workers)
+        elapsed = time.perf_counter() - start
+        if args.divide:
+            for (move_start, move_end), count in counts.items():
+                print(f"{move_start} -> {move_end}: {count}")
+        nodes = sum(counts.values())
+        print(f"{args.preset} {board.board_size}x{board.board_size} depth {args.depth}: {nodes} nodes "
+              f"in {elapsed:.3f}s on {args.workers} workers")
+
+        start = time.perf_counter()
+        single_core = divide(board, args.depth)
+        single_elapsed = time.perf_counter() - start
+        if single_core != counts:
+            print("MISMATCH: the single-core counts differ")
+            return 1
+        print(f"single core: {single_elapsed:.3f}s, speedup {single_elapsed / elapsed:.2f}x")
+        return 0
+
+    if args.divide:
+        counts = divide(board, args.depth)
+        for (move_start, move_end), count in counts.items():
+            print(f"{move_start} -> {move_end}: {count}")
+        nodes = sum(counts.values())
+    else:
+        nodes = perft(board, args.depth)
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.preset} {board.board_size}x{board.board_size} depth {args.depth}: {nodes} nodes "
+          f"in {elapsed:.3f}s ({nodes / elapsed if elapsed > 0 else 0:,.0f} nodes/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
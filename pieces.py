@@ -1,2157 +1,2229 @@
-from enum import Enum
-from typing import Tuple, List
-
-
-class MovementPattern:
-    """Base class for movement patterns that can be combined to create piece movements."""
-
-    @staticmethod
-    def _is_valid_position(pos: Tuple[int, int], board_size: int) -> bool:
-        """Check if a position is valid on the board."""
-        row, col = pos
-        return 0 <= row < board_size and 0 <= col < board_size
-
-    @staticmethod
-    def get_moves(pos: Tuple[int, int], patterns: List[Tuple[int, int]], board_size: int, direction: int, max_steps: int = None) -> List[Tuple[int, int]]:
-        moves = []
-        row, col = pos
-        for row_dir, col_dir in patterns:
-            dr = row_dir * direction
-            dc = col_dir * direction
-            current_row, current_col = row + dr, col + dc
-            steps = 0
-            while (max_steps is None or steps < max_steps) and MovementPattern._is_valid_position((current_row, current_col), board_size):
-                moves.append((current_row, current_col))
-                current_row += dr
-                current_col += dc
-                steps += 1
-        return moves
-
-# Define common movement patterns
-MOVEMENT_PATTERNS = {
-    'ORTHOGONAL': [(-1, 0), (1, 0), (0, -1), (0, 1)],  # Up, down, left, right
-    'DIAGONAL': [(-1, -1), (-1, 1), (1, -1), (1, 1)],  # All diagonals
-    'KING': [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)],  # King moves
-    'KNIGHT': [(-2, -1), (-2, 1), (2, -1), (2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2)],  # L-shape
-    'SHOGI_KNIGHT': [(-2, -1), (-2, 1)],  # L-shape Forward
-    'FORWARD': [(-1, 0)],  # Forward only
-    'FORWARD_AND_BACKWARD': [(-1, 0), (1, 0)],  # Forward and backward
-    'FORWARD_DIAGONAL': [(-1, -1), (-1, 1)],  # Forward diagonals
-    'FORWARD_LEFT_DIAGONAL': [(-1, -1)],  # Forward left diagonal
-    'FORWARD_RIGHT_DIAGONAL': [(-1, 1)],  # Forward right diagonal
-    'BACKWARD': [(1, 0)],  # Backward only
-    'BACKWARD_DIAGONAL': [(1, -1), (1, 1)],  # Backward diagonals
-    'BACKWARD_LEFT_DIAGONAL': [(1, -1)],  # Backward left diagonal
-    'BACKWARD_RIGHT_DIAGONAL': [(1, 1)],  # Backward right diagonal
-    'SIDE': [(0, -1), (0, 1)],  # Left and right only
-    'LEFT_SIDE': [(0, -1)],  # Left side only
-    'RIGHT_SIDE': [(0, 1)],  # Right side only
-    'FORWARD_AND_SIDE': [(-1, 0), (0, -1), (0, 1)],  # Forward and sides
-    'BACKWARD_AND_SIDE': [(1, 0), (0, -1), (0, 1)],  # Backward and sides
-    'FORWARD_AND_DIAGONAL': [(-1, 0), (-1, -1), (-1, 1)],  # Forward and forward diagonals
-    'BACKWARD_AND_DIAGONAL': [(1, 0), (1, -1), (1, 1)],  # Backward and backward diagonals
-
-    'ROARING_DOG': [(-3, -3), (-3, 0), (-3, 3), (-3, 0), (0, -3), (3, 0)],  # Roaring Dog moves
-    'FLYING_CAT': [(0, -3), (-3, -3), (-3, 0), (-3, 3), (0, 3)],  # Flying Cat moves
-    'FLYING_DRAGON': [(-2, -2), (-2, 2), (2, 2), (2, -2)],  # Flying Dragon moves
-    'FREE_EAGLE': [(-2, -2), (-3, -3), (-4, -4),
-                   (-2, 0), (-3, 0),
-                   (-2, 2), (-3, 3), (-4, 4),
-                   (0, 2), (0, 3),
-                   (2, 2), (3, 3),
-                   (2, 0), (3, 0),
-                   (2, -2), (3, -3),
-                   (0, -2), (0, -3)],  # Free Eagle moves
-    'GREAT_MASTER': [(-3, -3), (-3, 0), (-3, 3)],  # Great Master moves
-    'GREAT_STAG': [(-2, -2), (-2, 2)],  # Great Stag moves
-    'GREAT_TURTLE': [(-3, 0), (3, 0)],  # Great Turtle moves
-    'HORNED_FALCON': [(-2, 0)],  # Horned Falcon moves
-    'RUNNING_HORSE': [(2, -2), (2, 2)],  # Running Horse moves
-    'KIRIN': [(0, -2), (0, 2)],  # Kirin moves
-    'DREAM_EATER': [(0, -3), (0, 3)],  # Dream Eater moves
-    'GREAT_FALCON': [(-2, 0), (2, 0)],  # Great Falcon moves
-    'LION_DOG': [(-3, -3), (-3, 0), (-3, 3), (0, 3), (3, 3), (3, 0), (3, -3), (0, -3)],  # Lion Dog moves
-    'HEAVENLY_TETRARCH': [(-2, -2), (-2, 0), (-2, 2), (0, 2), (2, 2), (2, 0), (2, -2), (0, -2)],  # Heavenly Tetrarch moves
-    'LEFT_MOUNTAIN_EAGLE': [(-2, -2), (2, -2)],  # Left Mountain Eagle moves
-    'RIGHT_MOUNTAIN_EAGLE': [(-2, 2), (2, 2)],  # Right Mountain Eagle moves
-    'CENTER_MASTER': [(-2, -2), (-2, 0), (-2, 2), (2, 0)],  # Center Master moves
-    'PHOENIX_MASTER': [(-3, -3), (-3, 3)],  # Phoenix Master moves
-    'WOODEN_DOVE': [(-3, -3), (-4, -4), (-5, -5),
-                    (-3, 3), (-4, 4), (-5, 5),
-                    (3, -3), (4, -4), (5, -5),
-                    (3, 3), (4, 4), (5, 5)],  # Wooden Dove moves
-    'VICE_GENERAL': [(-2, 0), (2, 0), (-2, 0), (2, 0)],  # Vice General moves
-    'SPIRIT_TURTLE': [(-3, 0), (3, 0), (-3, 0), (3, 0)],  # Spirit Turtle moves
-    'HEAVENLY_HORSE': [(-2, -1), (-2, 1), (2, -1), (2, 1)],  # Heavenly Horse moves
-}
-
-class PieceColor(Enum):
-    WHITE = 'White'
-    BLACK = 'Black'
-
-class PieceRank(Enum):
-    KING = 1
-    GREAT_GENERAL = 2
-    VICE_GENERAL = 3
-    GENERAL = 4
-    OTHER = 5
-
-class PieceType(Enum):
-    PAWN = 'Pawn'
-    KNIGHT = 'Knight'
-    BISHOP = 'Bishop'
-    ROOK = 'Rook'
-    QUEEN = 'Queen'
-    KING = 'King'
-    GOLD_GENERAL = 'Gold_General'
-    SILVER_GENERAL = 'Silver_General'
-    SHOGI_KNIGHT = 'Shogi_Knight'
-    LANCE = 'Lance'
-    SHOGI_PAWN = 'Shogi_Pawn'
-    DRAGON = 'Dragon'
-    HORSE = 'Horse'
-    ANGRY_BOAR = 'Angry_Boar'
-    RUNNING_BEAR = 'Running_Bear'
-    BLIND_BEAR = 'Blind_Bear'
-    BEAST_CADET = 'Beast_Cadet'
-    BUDDHIST_DEVIL = 'Buddhist_Devil'
-    BEAR_SOLDIER = 'Bear_Soldier'
-    BISHOP_GENERAL = 'Bishop_General'
-    BLIND_DOG = 'Blind_Dog'
-    BLUE_DRAGON = 'Blue_Dragon'
-    BLIND_MONKEY = 'Blind_Monkey'
-    BURNING_SOLDIER = 'Burning_Soldier'
-    BEAST_OFFICER = 'Beast_Officer'
-    BOAR_SOLDIER = 'Boar_Soldier'
-    BLIND_TIGER = 'Blind_Tiger'
-    COPPER_GENERAL = 'Copper_General'
-    CAPRICORN = 'Capricorn'
-    CHINESE_ROOSTER = 'Chinese_Rooster'
-    CERAMIC_DOVE = 'Ceramic_Dove'
-    CLOUD_EAGLE = 'Cloud_Eagle'
-    CHICKEN_GENERAL = 'Chicken_General'
-    CHARIOT_SOLDIER = 'Chariot_Soldier'
-    STONE_CHARIOT = 'Stone_Chariot'
-    FLYING_ROOSTER = 'Flying_Rooster'
-    CLOUD_DRAGON = 'Cloud_Dragon'
-    CLIMBING_MONKEY = 'Climbing_Monkey'
-    CENTER_STANDARD = 'Center_Standard'
-    CAPTIVE_OFFICER = 'Captive_Officer'
-    PRINCE = 'Prince'
-    COPPER_CHARIOT = 'Copper_Chariot'
-    CAT_SWORD = 'Cat_Sword'
-    CAPTIVE_CADET = 'Captive_Cadet'
-    DOG = 'Dog'
-    DRUNKEN_ELEPHANT = 'Drunken_Elephant'
-    ROARING_DOG = 'Roaring_Dog'
-    DRAGON_HORSE = 'Dragon_Horse'
-    DRAGON_KING = 'Dragon_King'
-    DONKEY = 'Donkey'
-    FIRE_DEMON = 'Fire_Demon'
-    DARK_SPIRIT = 'Dark_Spirit'
-    DEVA = 'Deva'
-    EARTH_GENERAL = 'Earth_General'
-    ENCHANTED_BADGER = 'Enchanted_Badger'
-    EARTH_CHARIOT = 'Earth_Chariot'
-    EARTH_DRAGON = 'Earth_Dragon'
-    FIERCE_EAGLE = 'Fierce_Eagle'
-    SOARING_EAGLE = 'Soaring_Eagle'
-    EASTERN_BARBARIAN = 'Eastern_Barbarian'
-    EVIL_WOLF = 'Evil_Wolf'
-    FIRE_GENERAL = 'Fire_General'
-    FLYING_CAT = 'Flying_Cat'
-    FLYING_DRAGON = 'Flying_Dragon'
-    FREE_EAGLE = 'Free_Eagle'
-    FRAGRANT_ELEPHANT = 'Fragrant_Elephant'
-    FLYING_HORSE = 'Flying_Horse'
-    FIRE_DRAGON = 'Fire_Dragon'
-    FEROCIOUS_LEOPARD = 'Ferocious_Leopard'
-    FOREST_DEMON = 'Forest_Demon'
-    FREE_PUP = 'Free_Pup'
-    FREE_DEMON = 'Free_Demon'
-    FLYING_SWALLOW = 'Flying_Swallow'
-    FREE_DREAM_EATER = 'Free_Dream_Eater'
-    FLYING_GOOSE = 'Flying_Goose'
-    GO_BETWEEN = 'Go_Between'
-    GOLD_CHARIOT = 'Gold_Chariot'
-    GREAT_DRAGON = 'Great_Dragon'
-    GREAT_STANDARD = 'Great_Standard'
-    GREAT_GENERAL = 'Great_General'
-    GOLDEN_DEER = 'Golden_Deer'
-    GREAT_MASTER = 'Great_Master'
-    WOOD_GENERAL = 'Wood_General'
-    GOLDEN_BIRD = 'Golden_Bird'
-    GREAT_DOVE = 'Great_Dove'
-    GREAT_STAG = 'Great_Stag'
-    GREAT_TURTLE = 'Great_Turtle'
-    GUARDIAN_OF_THE_GODS = 'Guardian_Of_The_Gods'
-    HORSE_GENERAL = 'Horse_General'
-    HOWLING_DOG = 'Howling_Dog'
-    RAMS_HEAD_SOLDIER = 'Rams_Head_Soldier'
-    HORNFED_FALCON = 'Horned_Falcon'
-    HOOK_MOVER = 'Hook_Mover'
-    HORSEMAN = 'Horseman'
-    RUNNING_HORSE = 'Running_Horse'
-    HORSE_SOLDIER = 'Horse_Soldier'
-    IRON_GENERAL = 'Iron_General'
-    SHOGI_KING = 'Sogi_King'
-    KIRIN_MASTER = 'Kirin_Master'
-    KIRIN = 'Kirin'
-    LONGBOW_SOLDIER = 'Longbow_Soldier'
-    LEFT_CHARIOT = 'Left_Chariot'
-    LION_DOG = 'Lion_Dog'
-    LEFT_DRAGON = 'Left_Dragon'
-    LEFT_GENERAL = 'Left_General'
-    LIBERATED_HORSE = 'Liberated_Horse'
-    LION_HAWK = 'Lion_Hawk'
-    LITTLE_TURTLE = 'Little_Turtle'
-    LION = 'Lion'
-    LONG_NOSED_GOBLIN = 'Long_Nosed_Goblin'
-    LEOPARD_SOLDIER = 'Leopard_Soldier'
-    LITTLE_STANDARD = 'Little_Standard'
-    LEFT_TIGER = 'Left_Tiger'
-    MOUNTAIN_GENERAL = 'Mountain_General'
-    MOUNTAIN_FALCON = 'Mountain_Falcon'
-    SIDE_MONKEY = 'Side_Monkey'
-    LEFT_MOUNTAIN_EAGLE = 'Left_Mountain_Eagle'
-    RIGHT_MOUNTAIN_EAGLE = 'Right_Mountain_Eagle'
-    MOUNTAIN_STAG = 'Mountain_Stag'
-    CENTER_MASTER = 'Center_Master'
-    NORTHERN_BARBARIAN = 'Northern_Barbarian'
-    NEIGHBORING_KING = 'Neighboring_King'
-    VIOLENT_WOLF = 'Violent_Wolf'
-    OX_GENERAL = 'Ox_General'
-    OXCART = 'Oxcart'
-    OLD_KITE = 'Old_Kite'
-    OLD_MONKEY = 'Old_Monkey'
-    OLD_RAT = 'Old_Rat'
-    OX_SOLDIER = 'Ox_Soldier'
-    SWOOPING_OWL = 'Swooping_Owl'
-    FLYING_OX = 'Flying_Ox'
-    PEACOCK = 'Peacock'
-    PUP_GENERAL = 'Pup_General'
-    PHOENIX = 'Phoenix'
-    PIG_GENERAL = 'Pig_General'
-    PHOENIX_MASTER = 'Phoenix_Master'
-    PRANCING_STAG = 'Prancing_Stag'
-    POISONOUS_SNAKE = 'Poisonous_Snake'
-    RAIN_DRAGON = 'Rain_Dragon'
-    RUSHING_BIRD = 'Rushing_Bird'
-    RIGHT_CHARIOT = 'Right_Chariot'
-    RECLINING_DRAGON = 'Reclining_Dragon'
-    RIVER_GENERAL = 'River_General'
-    RIGHT_GENERAL = 'Right_General'
-    RUNNING_CHARIOT = 'Running_Chariot'
-    RIGHT_DRAGON = 'Right_Dragon'
-    ROC_MASTER = 'Roc_Master'
-    RUNNING_STAG = 'Running_Stag'
-    ROOK_GENERAL = 'Rook_General'
-    RUNNING_PUP = 'Running_Pup'
-    RUNNING_RABBIT = 'Running_Rabbit'
-    REAR_STANDARD = 'Rear_Standard'
-    RUNNING_TIGER = 'Running_Tiger'
-    RUNNING_SERPENT = 'Running_Serpent'
-    REVERSE_CHARIOT = 'Reverse_Chariot'
-    RUNNING_WOLF = 'Running_Wolf'
-    SIDE_BOAR = 'Side_Boar'
-    CROSSBOW_SOLDIER = 'Crossbow_Soldier'
-    FRONT_STANDARD = 'Front_Standard'
-    SWORD_SOLDIER = 'Sword_Soldier'
-    SIDE_FLYER = 'Side_Flyer'
-    STONE_GENERAL = 'Stone_General'
-    SIDE_DRAGON = 'Side_Dragon'
-    SIDE_SOLDIER = 'Side_Soldier'
-    SIDE_MOVER = 'Side_Mover'
-    COILED_SERPENT = 'Coiled_Serpent'
-    SOLDIER = 'Soldier'
-    SPEAR_SOLDIER = 'Spear_Soldier'
-    SQUARE_MOVER = 'Square_Mover'
-    SILVER_RABBIT = 'Silver_Rabbit'
-    SIDE_SERPENT = 'Side_Serpent'
-    STRUTTING_CROW = 'Strutting_Crow'
-    SOUTHERN_BARBARIAN = 'Southern_Barbarian'
-    SILVER_CHARIOT = 'Silver_Chariot'
-    SWALLOWS_WINGS = 'Swallows_Wings'
-    SIDE_OX = 'Side_Ox'
-    TILE_GENERAL = 'Tile_General'
-    TILE_CHARIOT = 'Tile_Chariot'
-    TURTLE_DOVE = 'Turtle_Dove'
-    TREACHEROUS_FOX = 'Treacherous_Fox'
-    SAVAGE_TIGER = 'Savage_Tiger'
-    TURTLE_SNAKE = 'Turtle_Snake'
-    RIGHT_TIGER = 'Right_Tiger'
-    VIOLENT_BEAR = 'Violent_Bear'
-    VIOLENT_DRAGON = 'Violent_Dragon'
-    VERTICAL_BEAR = 'Vertical_Bear'
-    VICE_GENERAL = 'Vice_General'
-    VERTICAL_HORSE = 'Vertical_Horse'
-    VERMILION_SPARROW = 'Vermilion_Sparrow'
-    VERTICAL_LEOPARD = 'Vertical_Leopard'
-    VERTICAL_MOVER = 'Vertical_Mover'
-    VIOLENT_OX = 'Violent_Ox'
-    VERTICAL_PUP = 'Vertical_Pup'
-    VERTICAL_SOLDIER = 'Vertical_Soldier'
-    VIOLENT_STAG = 'Violent_Stag'
-    VERTICAL_TIGER = 'Vertical_Tiger'
-    VERTICAL_WOLF = 'Vertical_Wolf'
-    WHALE = 'Whale'
-    WATER_DRAGON = 'Water_Dragon'
-    WATER_BUFFALO = 'Water_Buffalo'
-    WOOD_CHARIOT = 'Wood_Chariot'
-    WIND_DRAGON = 'Wind_Dragon'
-    WHITE_ELEPHANT = 'White_Elephant'
-    SIDE_WOLF = 'Side_Wolf'
-    WATER_GENERAL = 'Water_General'
-    WHITE_HORSE = 'White_Horse'
-    WOODLAND_DEMON = 'Woodland_Demon'
-    WIND_GENERAL = 'Wind_General'
-    WOODEN_DOVE = 'Wooden_Dove'
-    WRESTLER = 'Wrestler'
-    WESTERN_BARBARIAN = 'Western_Barbarian'
-    WHITE_TIGER = 'White_Tiger'
-    YAKSHA = 'Yaksha'
-    RIGHT_ARMY = 'Right_Army'
-    LEFT_ARMY = 'Left_Army'
-    FREE_FIRE = 'Free_Fire'
-    GREAT_WHALE = 'Great_Whale'
-    DIVINE_TIGER = 'Divine_Tiger'
-    DIVINE_TURTLE = 'Divine_Turtle'
-    ELEPHANT_KING = 'Elephant_King'
-    CAPTIVE_BIRD = 'Captive_Bird'
-    THUNDER_RUNNER = 'Thunder_Runner'
-    FREE_LEOPARD = 'Free_Leopard'
-    FREE_SERPENT = 'Free_Serpent'
-    FREE_TIGER = 'Free_Tiger'
-    FREE_BEAR = 'Free_Bear'
-    HEAVENLY_TETRARCH = 'Heavenly_Tetrarch'
-    PLAYFUL_COCKATOO = 'Playful_Cockatoo'
-    RUNNING_DRAGON = 'Running_Dragon'
-    FREE_STAG = 'Free_Stag'
-    FREE_WOLF = 'Free_Wolf'
-    RAIN_DEMON = 'Rain_Demon'
-    FLYING_CROCODILE = 'Flying_Crocodile'
-    BEAST_BIRD = 'Beast_Bird'
-    FREE_DRAGON = 'Free_Dragon'
-    FREE_DOG = 'Free_Dog'
-    GOOSE_WING = 'Goose_Wing'
-    FREE_PIG = 'Free_Pig'
-    FREE_CHICKEN = 'Free_Chicken'
-    FREE_HORSE = 'Free_Horse'
-    FREE_OX = 'Free_Ox'
-    FREE_BOAR = 'Free_Boar'
-    FURIOUS_FIEND = 'Furious_Fiend'
-    FREE_BIRD = 'Free_Bird'
-    RIGHT_PHOENIX = 'Right_Phoenix'
-    WALKING_HERON = 'Walking_Heron'
-    STRONG_EAGLE = 'Strong_Eagle'
-    COPPER_ELEPHANT = 'Copper_Elephant'
-    BURNING_CHARIOT = 'Burning_Chariot'
-    TIGER_SOLDIER = 'Tiger_Soldier'
-    ANCIENT_DRAGON = 'Ancient_Dragon'
-    BUDDHIST_SPIRIT = 'Buddhist_Spirit'
-    TEACHING_KING = 'Teaching_King'
-    WIND_SNAPPING_TURTLE = 'Wind_Snapping_Turtle'
-    GREAT_HORSE = 'Great_Horse'
-    LEFT_DOG = 'Left_Dog'
-    RIGHT_DOG = 'Right_Dog'
-    GREAT_DREAM_EATER = 'Great_Dream_Eater'
-    FLYING_FALCON = 'Flying_Falcon'
-    TREASURE_TURTLE = 'Treasure_Turtle'
-    SPIRIT_TURTLE = 'Spirit_Turtle'
-    RUNNING_TILE = 'Running_Tile'
-    GREAT_BEAR = 'Great_Bear'
-    VENOMOUS_WOLF = 'Venomous_Wolf'
-    HEAVENLY_HORSE = 'Heavenly_Horse'
-    RAIDING_FALCON = 'Raiding_Falcon'
-    MOUNTAIN_WITCH = 'Mountain_Witch'
-    WIZARD_STORK = 'Wizard_Stork'
-    RUSHING_BOAR = 'Rushing_Boar'
-    BEARS_EYES = 'Bears_Eyes'
-    MOUNTIAN_CRANE = 'Mountain_Crane'
-    YOUNG_BIRD = 'Young_Bird'
-    DIVINE_SPARROW = 'Divine_Sparrow'
-    DIVINE_DRAGON = 'Divine_Dragon'
-    CAVALIER = 'Cavalier'
-    GLIDING_SPARROW = 'Gliding_Sparrow'
-    FLYING_STAG = 'Flying_Stag'
-    PLODDING_OX = 'Plooding_Ox'
-    BIRD_OF_PARADISE = 'Bird_of_Paradise'
-    STRONG_CHARIOT = 'Strong_Chariot'
-    COILED_DRAGON = 'Coiled_Dragon'
-    HEAVENLY_TETRARCH_KING = 'Heavenly_Tetrarch_King'
-    VIOLENT_WIND = 'Violent_Wind'
-    CHINESE_RIVER = 'Chinese_River'
-    PEACEFUL_MOUNTAIN = 'Peaceful_Mountain'
-    RUNNING_OX = 'Running_Ox'
-    RUNNING_BOAR = 'Running_Boar'
-    RUNNING_LEOPARD = 'Running_Leopard'
-    STRONG_BEAR = 'Strong_Bear'
-    RIGHT_IRON_CHARIOT = 'Right_Iron_Chariot'
-    LEFT_IRON_CHARIOT = 'Left_Iron_Chariot'
-    FIRE_OX = 'Fire_Ox'
-    LONGBOW_GENERAL = 'Longbow_General'
-    LEOPARD_KING = 'Leopard_King'
-    BURNING_GENERAL = 'Burning_General'
-    SWORD_GENERAL = 'Sword_General'
-    GREAT_FALCON = 'Great_Falcon'
-    GREAT_EAGLE = 'Great_Eagle'
-    SPEAR_GENERAL = 'Spear_General'
-    GREAT_LEOPARD = 'Great_Leopard'
-    GREAT_TIGER = 'Great_Tiger'
-    CROSSBOW_GENERAL = 'Crossbow_General'
-    GREAT_ELEPHANT = 'Great_Elephant'
-    MULTI_GENERAL = 'Multi_General'
-
-class PieceKey:
-    def __init__(self, color, piece_type, rank):
-        self.color = color  # 'White' or 'Black'
-        self.piece_type = piece_type  # 'Pawn', 'Knight', etc
-        self.rank = rank  # 'King', 'Great_General', etc
-
-    @classmethod
-    def from_string(cls, key_str):
-        # For backward compatibility, assume rank 1 if not specified
-        parts = key_str.split('_', 2)
-        if len(parts) >= 3:
-            return cls(parts[0], parts[1], int(parts[2]))
-        else:
-            return cls(parts[0], parts[1], 1)
-
-    def __str__(self):
-        return f"{self.color}{self.piece_type}{self.rank}"
-
-
-class Piece:
-    def __init__(self, piece_type: str, color: str, rank: int = 1):
-        self.piece_type = piece_type
-        self.color = color
-        self.rank = rank  # Numerical rank (1-10, 1=lowest, 10=highest)
-        self.symbol = color + '_' + piece_type  # Keep image filename without rank
-        self.direction = 1 if color == 'White' else -1
-
-    def get_legal_moves_with_info(self, pos: Tuple[int, int], board_size: int) -> List[Tuple[Tuple[int, int], bool]]:
-        """Get all legal moves for this piece from the given position with jump information.
-        Returns a list of tuples: (position, can_jump_over_pieces)"""
-        # Map piece types to their movement patterns with jump info
-        movement_patterns = {
-            # Standard chess pieces
-            'Pawn': lambda p, b: [(move, False) for move in self._get_pawn_moves(p, b)],
-            'Knight': lambda p, b: [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KNIGHT'], b, self.direction, max_steps=1)],
-            'Bishop': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)],
-            'Rook': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)],
-            'Queen': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction)],
-            'King': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction, max_steps=1)],
-            
-            # Shogi pieces
-            'Gold_General': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL']+MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=1)],
-            'Silver_General': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=1)],
-            'Shogi_Knight': lambda p, b: [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SHOGI_KNIGHT'], b, self.direction, max_steps=1)],
-            'Lance': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)],
-            'Shogi_Pawn': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=1)],
-            'Dragon_General': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction, max_steps=1)],
-            'Horse_General': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=1)],
-            
-            # Taikyoku pieces
-            'Angry_Boar': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_SIDE'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=2)]
-            ),
-            'Running_Bear': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)]
-            ),
-            'Blind_Bear': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'] + MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Beast_Cadet': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_SIDE']+MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=2)]
-            ),
-            'Buddhist_Devil': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_AND_SIDE'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=3)]
-            ),
-            'Bear_Soldier': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)]
-            ),
-            'Bishop_General': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)],
-            'Blind_Dog': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_AND_SIDE']+MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=1)],
-            'Blue_Dragon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'] + MOVEMENT_PATTERNS['BACKWARD']+MOVEMENT_PATTERNS['FORWARD_RIGHT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Blind_Monkey': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE']+MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=1)],
-            'Burning_Soldier': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=5)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=7)]
-            ),
-            'Beast_Officer': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Boar_Soldier': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL'], b, self.direction)]
-            ),
-            'Blind_Tiger': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD']+MOVEMENT_PATTERNS['SIDE']+MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=1)],
-            'Copper_General': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)],
-            'Capricorn': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction, max_steps=1)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)]
-             ),
-            'Chinese_Rooster': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_AND_SIDE']+MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=1)],
-            'Ceramic_Dove': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)]
-            ),
-            'Cloud_Eagle': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Chicken_General': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKEARD_DIAGONAL'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=4)]
-            ),
-            'Chariot_Soldier': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD']+MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Stone_Chariot': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Flying_Rooster': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)],
-            'Cloud_Dragon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'] + MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Climbing_Monkey': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)],
-            'Center_Standard': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=3)]
-            ),
-            'Captive_Officer': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_SIDE'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=3)]
-            ),
-            'Prince': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction, max_steps=1)],
-            'Copper_Chariot': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=3)]
-            ),
-            'Cat_Sword': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=1)],
-            'Captive_Cadet': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_SIDE']+MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=3)],
-            'Dog': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL'], b, self.direction, max_steps=1)],
-            'Drunken_Elephant': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_SIDE']+MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=1)],
-            'Roaring_Dog': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'] + MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=3)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ROARING_DOG'], b, self.direction)]
-                ),
-            'Dragon_Horse': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Dragon_King': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Donkey': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction, max_steps=2)],
-            'Fire_Demon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=2)]
-            ),
-            'Dark_Spirit': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL']+MOVEMENT_PATTERNS['FORWARD_RIGHT_DIAGONAL'], b, self.direction, max_steps=1)],
-            'Deva': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL']+MOVEMENT_PATTERNS['FORWARD_LEFT_DIAGONAL'], b, self.direction, max_steps=1)],
-            'Earth_General': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)],
-            'Enchanted_Badger': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction, max_steps=2)],
-            'Earth_Chariot': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Earth_Dragon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction)]
-            ), #This piece is different in Japanese
-            'Fierce_Eagle': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Soaring_Eagle': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=2)]
-            ),
-            'Eastern_Barbarian': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE']+MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Evil_Wolf': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_SIDE']+MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=1)],
-            'Fire_General': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=3)]
-            ),
-            'Flying_Cat': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL'], b, self.direction, max_steps=1)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FLYING_CAT'], b, self.direction, max_steps=1)]
-            ),
-            'Flying_Dragon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction, max_steps=1)]
-            ),
-            'Free_Eagle': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FREE_EAGLE'], b, self.direction, max_steps=1)]
-            ),
-            'Fragrant_Elephant': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction, max_steps=2)],
-            'Flying_Horse': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=2)],
-            'Fire_Dragon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=4)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=2)]
-            ),
-            'Ferocious_Leopard': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction, max_steps=1)],
-            'Forest_Demon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_SIDE'], b, self.direction, max_steps=3)]
-            ),
-            'Free_Pup': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL'] + MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Free_Demon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL']+ MOVEMENT_PATTERNS['RIGHT_SIDE'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=5)]
-            ), # Free Demon is different in Japanese
-            'Flying_Swallow': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['Backward'], b, self.direction, max_steps=1)]
-            ),
-            'Free_Dream_Eater': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL']+MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=5)]
-            ),
-            'Flying_Goose': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)],
-            'Go_Between': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)],
-            'Gold_Chariot': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Great_Dragon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=3)]
-            ),
-            'Great_Standard': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL']+MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=3)]
-            ),
-            'Great_General': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction)],
-            'Golden_Deer': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=2)]
-            ),
-            'Great_Master': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=5)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['GREAT_MASTER'], b, self.direction, max_steps=1)]
-            ),
-            'Wood_General': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=2)],
-            'Golden_Bird': lambda p, b: (
-                [(move, ('limited_jumping', 3)) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=3)]
-            ),
-            'Great_Dove': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction, max_steps=3)]
-            ),
-            'Great_Stag': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=2)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['GREAT_STAG'], b, self.direction, max_steps=1)]
-            ),
-            'Great_Turtle': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL']+MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=3)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['GREAT_TURTLE'], b, self.direction, max_steps=1)]
-            ),
-            'Guardian_Of_The_Gods': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction, max_steps=3)],
-            'Horse_General': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Howling_Dog': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)],
-            ),
-            'Rams_Head_Soldier': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)],
-            ),
-            'Horned_Falcon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['HORNED_FALCON'], b, self.direction, max_steps=1)]
-            ),
-            'Hook_Mover': lambda p, b: [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)],
-            'Horseman': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)],
-            ),
-            'Running_Horse': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['RUNNING_HORSE'], b, self.direction, max_steps=1)]
-            ),
-            'Horse_Soldier': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=3)],
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)],
-            ),
-            'Iron_General': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL'], b, self.direction, max_steps=1)],
-            'Shogi_King': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction, max_steps=2)],
-            'Kirin_Master': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL']+MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=3)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['GREAT_TURTLE'], b, self.direction, max_steps=1)]
-            ),
-            'Kirin': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=1)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KIRIN'], b, self.direction, max_steps=1)]
-            ),
-            'Longbow_Soldier': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Left_Chariot': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['FORWARD_LEFT_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_RIGHT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['LEFT_SIDE'], b, self.direction, max_steps=1)],
-            ),
-            'Lion_Dog': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['LION_DOG'], b, self.direction, max_steps=1)]
-            ),
-            'Left_Dragon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['RIGHT_SIDE'] + MOVEMENT_PATTERNS['FORWARD_RIGHT_DIAGONAL']+ MOVEMENT_PATTERNS['BACKWARD_RIGHT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['LEFT_SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Left_General': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction, max_steps=1)],
-            'Liberated_Horse': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Lion_Hawk': lambda p, b: (
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction, max_steps=2)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KNIGHT'], b, self.direction, max_steps=1)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FLYING_DRAGON'], b, self.direction, max_steps=1)]
-            ),
-            'Little_Turtle': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL']+MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KIRIN'], b, self.direction, max_steps=1)]
-            ),
-            'Lion': lambda p, b: (
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction, max_steps=2)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KNIGHT'], b, self.direction, max_steps=1)]
-            ),
-            'Long_Nosed_Goblin': lambda p, b: [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)],
-            'Leopard_Soldier': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Little_Standard': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Left_Tiger': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['RIGHT_SIDE']+MOVEMENT_PATTERNS['FORWARD_RIGHT_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_RIGHT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_LEFT_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_LEFT_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Mountain_General': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Mountain_Falcon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD']+MOVEMENT_PATTERNS['SIDE'], b, self.direction)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['HORNED_FALCON'], b, self.direction, max_steps=1)]
-            ),
-            'Side_Monkey': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Left_Mountain_Eagle': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL']+MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_LEFT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_RIGHT_DIAGONAL'], b, self.direction, max_steps=2)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['LEFT_MOUNTAIN_EAGLE'], b, self.direction, max_steps=1)]
-            ),
-            'Right_Mountain_Eagle': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL']+MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_RIGHT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_LEFT_DIAGONAL'], b, self.direction, max_steps=2)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['RIGHT_MOUNTAIN_EAGLE'], b, self.direction, max_steps=1)]
-            ),
-            'Mountain_Stag': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=4)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Center_Master': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=3)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['CENTER_MASTER'], b, self.direction, max_steps=1)]
-            ),
-            'Northern_Barbarian': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Neighboring_King': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL']+MOVEMENT_PATTERNS['FORWARD_AND_SIDE'], b, self.direction, max_steps=1)],
-            'Violent_Wolf': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD']+MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)],
-            'Ox_General': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=3)]
-            ),
-            'Oxcart': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)],
-            'Old_Kite': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Old_Monkey': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction, max_steps=1)],
-            'Old_Rat': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction, max_steps=1)],
-            'Ox_Soldier': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=3)]
-            ),
-            'Swooping_Owl': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=1)],
-            'Flying_Ox': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction)],
-            'Peacock': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps = 2)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction)]
-            ),
-            'Pup_General': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=4)]
-            ),
-            'Phoenix': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction, max_steps=1)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FLYING_DRAGON'], b, self.direction, max_steps=1)]
-            ),
-            'Pig_General': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=4)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=2)]
-            ),
-            'Phoenix_Master': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL']+MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=3)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['PHOENIX_MASTER'], b, self.direction, max_steps=1)]
-            ),
-            'Prancing_Stag': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Poisonous_Snake': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_SIDE'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Rain_Dragon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE']+MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction)]
-            ),
-            'Rushing_Bird': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Right_Chariot': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['FORWARD_RIGHT_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_LEFT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['RIGHT_SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Reclining_Dragon': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction, max_steps=1)],
-            'River_General': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Right_General': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction, max_steps=1)],
-            'Running_Chariot': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)],
-            'Right_Dragon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_LEFT_DIAGONAL'] + MOVEMENT_PATTERNS['LEFT_SIDE']+MOVEMENT_PATTERNS['BACKWARD_LEFT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['RIGHT_SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Roc_Master': lambda p, b: (
-                [(move, ('origin', 1)) for move in MovementPattern.get_moves(p, [(-3,-3)], b, self.direction, max_steps=1)] +
-                [(move, ('origin', 2)) for move in MovementPattern.get_moves(p, [(-3, 3)], b, self.direction, max_steps=1)] +
-                [(move, ('direction', 1)) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_LEFT_DIAGONAL'], b, self.direction)] +
-                [(move, ('direction', 2)) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_RIGHT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'] + MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=5)]
-            ),
-            'Running_Stag': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=2)]
-            ),
-            'Rook_General': lambda p, b: [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)],
-            'Running_Pup': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Running_Rabbit': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Rear_Standard': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=2)]
-            ),
-            'Running_Tiger': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Running_Serpent': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Reverse_Chariot': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)],
-            'Running_Wolf': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Side_Boar': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Crossbow_Soldier': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=5)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Front_Standard': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=3)]
-            ),
-            'Sword_Soldier': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)],
-            'Side_Flyer': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Stone_General': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=1)],
-            'Side_Dragon': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'] + MOVEMENT_PATTERNS['SIDE'], b, self.direction)],
-            'Side_Soldier': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Side_Mover': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Coiled_Serpent': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction)],
-            'Soldier': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)],
-            'Spear_Soldier': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Square_Mover': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)],
-            'Silver_Rabbit': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction)]
-            ),
-            'Side_Serpent': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Strutting_Crow': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=1)],
-            'Southern_Barbarian': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Silver_Chariot': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Swallows_Wings': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Side_Ox': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_RIGHT_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_LEFT_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Tile_General': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)],
-            'Tile_Chariot': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_RIGHT_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_LEFT_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Turtle_Dove': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=5)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_AND_SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Treacherous_Fox': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction)],
-            'Savage_Tiger': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)],
-            'Turtle_Snake': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_RIGHT_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_LEFT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['FORWARD_LEFT_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD']+MOVEMENT_PATTERNS['BACKWARD_RIGHT_DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Right_Tiger': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_LEFT_DIAGONAL']+MOVEMENT_PATTERNS['LEFT_SIDE']+MOVEMENT_PATTERNS['BACKWARD_LEFT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_RIGHT_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_RIGHT_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Violent_Bear': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Violent_Dragon': lambda p, b: (
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction, max_steps=2)]
-            ),
-            'Vertical_Bear': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Vice_General': lambda p, b: (
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['VICE_GENERAL'], b, self.direction, max_steps=1)]
-            ),
-            'Vertical_Horse': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD']+MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Vermilion_Sparrow': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_LEFT_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_RIGHT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL']+MOVEMENT_PATTERNS['FORWARD_RIGHT_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_LEFT_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Vertical_Leopard': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD']+MOVEMENT_PATTERNS['SIDE']+MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Vertical_Mover': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Violent_Ox': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD']+MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Vertical_Pup': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Vertical_Soldier': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Violent_Stag': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction)],
-            'Vertical_Tiger': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=2)]
-            ),
-            'Vertical_Wolf': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Whale': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction)],
-            'Water_Dragon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=4)]
-            ),
-            'Water_Buffalo': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=2)]
-            ),
-            'Wood_Chariot': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_LEFT_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_RIGHT_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Wind_Dragon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'] + MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_RIGHT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_LEFT_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'White_Elephant': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction, max_steps=2)],
-            'Side_Wolf': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_LEFT_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_RIGHT_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Water_General': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=3)]
-            ),
-            'White_Horse': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)],
-            'Woodland_Demon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Wind_General': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD']+MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Wooden_Dove': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction, max_steps=2)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['WOODEN_DOVE'], b, self.direction, max_steps=1)]
-            ),
-            'Wrestler': lambda p, b: [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=3)],
-            'Western_Barbarian': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE']+MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'White_Tiger': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE']+MOVEMENT_PATTERNS['FORWARD_LEFT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=2)]
-            ),
-            'Yaksha': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Right_Army': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_RIGHT_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_RIGHT_DIAGONAL']+MOVEMENT_PATTERNS['RIGHT_SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD']+MOVEMENT_PATTERNS['FORWARD_LEFT_DIAGONAL']+MOVEMENT_PATTERNS['LEFT_SIDE']+MOVEMENT_PATTERNS['BACKWARD_LEFT_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Left_Army': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_LEFT_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_LEFT_DIAGONAL']+MOVEMENT_PATTERNS['LEFT_SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD']+MOVEMENT_PATTERNS['FORWARD_RIGHT_DIAGONAL']+MOVEMENT_PATTERNS['RIGHT_SIDE']+MOVEMENT_PATTERNS['BACKWARD_RIGHT_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Free_Fire': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction, max_steps=5)]
-            ),
-            'Great_Whale': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction)]
-            ),
-            'Divine_Tiger': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['SIDE']+MOVEMENT_PATTERNS['FORWARD_LEFT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=2)]
-            ),
-            'Divine_Turtle': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_RIGHT_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL']+MOVEMENT_PATTERNS['FORWARD_LEFT_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Elephant_King': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORHTOGONAL'], b, self.direction, max_steps=2)]
-            ),
-            'Captive_Bird': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=2)]
-            ),
-            'Thunder_Runner': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGOANL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_AND_SIDE'], b, self.direction, max_steps=4)]
-            ),
-            'Free_Leopard': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction)]
-            ),
-            'Free_Serpent': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction)]
-            ),
-            'Free_Tiger': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction)]
-            ),
-            'Free_Bear': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction)]
-            ),
-            'Heavenly_Tetrarch': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction, max_steps=4)]
-            ),
-            'Playful_Cockatoo': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=5)]
-            ),
-            'Running_Dragon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_DIAGOANL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=5)]
-            ),
-            'Free_Stag': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction)]
-            ),
-            'Free_Wolf': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction)]
-            ),
-            'Rain_Demon': lambda p, b: (
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Flying_Crocodile': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=2)]
-            ),
-            'Beast_Bird': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=3)]
-            ),
-            'Free_Dragon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction)]
-            ),
-            'Free_Dog': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=2)]
-            ),
-            'Goose_Wing': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=3)]
-            ),
-            'Free_Pig': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Free_Chicken': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Free_Horse': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Free_Ox': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Free_Boar': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Furious_Fiend': lambda p, b: (
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction, max_steps=2)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KNIGHT'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction, max_steps=3)]
-            ),
-            'Free_Bird': lambda p, b: (
-                [(move, ('limited_jumping', 3)) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=3)]
-            ),
-            'Right_Phoenix': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=5)]
-            ),
-            'Walking_Heron': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Strong_Eagle': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction)]
-            ),
-            'Copper_Elephant': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Burning_Chariot': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Tiger_Soldier': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Ancient_Dragon': lambda p, b: (
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)]
-            ),
-            'Buddhist_Spirit': lambda p, b: (
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction, max_steps=2)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KNIGHT'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction)]
-            ),
-            'Teaching_King': lambda p, b: (
-                [(move, ('limited_jumping', 3)) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction)]
-            ),
-            'Wind_Snapping_Turtle': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=2)]
-            ),
-            'Great_Horse': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Left_Dog': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD_RIGHT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Right_Dog': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD_LEFT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Great_Dream_Eater': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DREAM_EATER'], b, self.direction, max_steps=1)]
-            ),
-            'Flying_Falcon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Treasure_Turtle': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['VICE_GENERAL'], b, self.direction, max_steps=1)]
-            ),
-            'Spirit_Turtle': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SPIRIT_TURTLE'], b, self.direction, max_steps=1)]
-            ),
-            'Running_Tile': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Great_Bear': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Venomous_Wolf': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction, max_steps=1)]
-            ),
-            'Heavenly_Horse': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['HEAVENLY_HORSE'], b, self.direction, max_steps=1)]
-            ),
-            'Raiding_Falcon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Mountain_Witch': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction)]
-            ),
-            'Wizard_Stork': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['SIDE']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)]
-            ),
-            'Rushing_Boar': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Bears_Eyes': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction, max_steps=1)]
-            ),
-            'Mountain_Crane': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['LION_DOG'], b, self.direction, max_steps=1)]
-            ),
-            'Young_Bird': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Divine_Sparrow': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_LEFT_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_LEFT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Divine_Dragon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD']+MOVEMENT_PATTERNS['RIGHT_SIDE']+MOVEMENT_PATTERNS['FORWARD_RIGHT_DIAGOANL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['LEFT_SIDE'], b, self.direction, max_steps=2)]
-            ),
-            'Cavalier': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL']+MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)]
-            ),
-            'Gliding_Sparrow': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction)]
-            ),
-            'Flying_Stag': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Plooding_Ox': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Bird_of_Paradise': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)]
-            ),
-            'Strong_Chariot': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD']+MOVEMENT_PATTERNS['SIDE'], b, self.direction)]
-            ),
-            'Coiled_Dragon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD']+MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction)]
-            ),
-            'Heavenly_Tetrarch_King': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['HEAVENLY_TETRARCH'], b, self.direction, max_steps=1)]
-            ),
-            'Violent_Wind': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Chinese_River': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Peaceful_Mountain': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_SIDE'], b, self.direction, max_steps=5)]
-            ),
-            'Running_Ox': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction, max_steps=2)]
-            ),
-            'Running_Boar': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Running_Leopard': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['SIDE'], b, self.direction)]
-            ),
-            'Strong_Bear': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_SIDE']+MOVEMENT_PATTERNS['DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=2)]
-            ),
-            'Right_Iron_Chariot': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_LEFT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Left_Iron_Chariot': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD_RIGHT_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL'], b, self.direction, max_steps=1)]
-            ),
-            'Fire_Ox': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD_AND_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=1)]
-            ),
-            'Longbow_General': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=5)]
-            ),
-            'Leopard_King': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction, max_steps=5)]
-            ),
-            'Burning_General': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=2)]
-            ),
-            'Sword_General': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Great_Falcon': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['GREAT_FALCON'], b, self.direction, max_steps=1)]
-            ),
-            'Great_Eagle': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['KING'], b, self.direction)] +
-                [(move, True) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['HEAVENLY_TETRARCH'], b, self.direction, max_steps=1)]
-            ),
-            'Spear_General': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=2)]
-            ),
-            'Great_Leopard': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=2)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=1)]
-            ),
-            'Great_Tiger': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction, max_steps=1)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_SIDE'], b, self.direction)]
-            ),
-            'Crossbow_General': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=5)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['SIDE'], b, self.direction, max_steps=3)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['BACKWARD'], b, self.direction, max_steps=2)]
-            ),
-            'Great_Elephant': lambda p, b: (
-                [(move, ('limited_jumping', 3)) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['ORTHOGONAL']+MOVEMENT_PATTERNS['BACKWARD_DIAGONAL'], b, self.direction)] +
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_DIAGONAL'], b, self.direction, max_steps=3)]
-            ),
-            'Multi_General': lambda p, b: (
-                [(move, False) for move in MovementPattern.get_moves(p, MOVEMENT_PATTERNS['FORWARD_AND_DIAGONAL']+MOVEMENT_PATTERNS['BACKWARD'], b, self.direction)]
-            ),
-        }
-        
-        # Get the movement function for this piece type
-        movement_function = movement_patterns.get(self.piece_type)
-        if movement_function:
-            return movement_function(pos, board_size)
-        return list()
-
-    def _is_valid_position(self, pos: Tuple[int, int], board_size: int) -> bool:
-        """Check if a position is valid on the board."""
-        row, col = pos
-        return 0 <= row < board_size and 0 <= col < board_size
-
-    def _get_pawn_moves(self, pos, board_size):
-        moves = []
-        row, col = pos
-
-        # White pawns start at row board_size-2 and move up (decreasing row)
-        # Black pawns start at row 1 and move down (increasing row)
-        if self.color == 'White':
-            # White pawn moves
-            # One square forward (up)
-            if row > 0:  # Can't move up if at top
-                moves.append((row - 1, col))
-                # Two squares forward from starting position
-                if row == board_size - 2:  # Starting position
-                    moves.append((row - 2, col))
-            # Diagonal captures
-            if row > 0:  # Can't capture if at top
-                if col > 0:  # Can capture left
-                    moves.append((row - 1, col - 1))
-                if col < board_size - 1:  # Can capture right
-                    moves.append((row - 1, col + 1))
-        else:
-            # Black pawn moves
-            # One square forward (down)
-            if row < board_size - 1:  # Can't move down if at bottom
-                moves.append((row + 1, col))
-                # Two squares forward from starting position
-                if row == 1:  # Starting position
-                    moves.append((row + 2, col))
-            # Diagonal captures
-            if row < board_size - 1:  # Can't capture if at bottom
-                if col > 0:  # Can capture left
-                    moves.append((row + 1, col - 1))
-                if col < board_size - 1:  # Can capture right
-                    moves.append((row + 1, col + 1))
-
-        return moves
-
-
-# Factory function to create pieces
-def create_piece(piece_type: str, color: str, rank: int = 1) -> Piece:
-    """Create a new piece of the given type and color."""
-    return Piece(piece_type, color, rank)
-
-
-# Dictionary of all available pieces
-AVAILABLE_PIECES = {
-    'White_Pawn':           (PieceType.PAWN, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Knight':         (PieceType.KNIGHT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Bishop':         (PieceType.BISHOP, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Rook':           (PieceType.ROOK, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Queen':          (PieceType.QUEEN, PieceColor.WHITE, PieceRank.OTHER),
-    'White_King':           (PieceType.KING, PieceColor.WHITE, PieceRank.KING),
-    'White_Gold_General':   (PieceType.GOLD_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Silver_General': (PieceType.SILVER_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Shogi_Knight':   (PieceType.SHOGI_KNIGHT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Lance':          (PieceType.LANCE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Shogi_Pawn':     (PieceType.SHOGI_PAWN, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Dragon':         (PieceType.DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Horse':  (PieceType.HORSE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Angry_Boar':     (PieceType.ANGRY_BOAR, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Running_Bear':   (PieceType.RUNNING_BEAR, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Blind_Bear':     (PieceType.BLIND_BEAR, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Beast_Cadet':    (PieceType.BEAST_CADET, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Buddhist_Devil': (PieceType.BUDDHIST_DEVIL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Bear_Soldier':   (PieceType.BEAR_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Bishop_General': (PieceType.BISHOP_GENERAL, PieceColor.WHITE, PieceRank.GENERAL),
-    'White_Blind_Dog':      (PieceType.BLIND_DOG, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Blue_Dragon':    (PieceType.BLUE_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Blind_Monkey':   (PieceType.BLIND_MONKEY, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Burning_Soldier': (PieceType.BURNING_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Beast_Officer':  (PieceType.BEAST_OFFICER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Boar_Soldier':   (PieceType.BOAR_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Blind_Tiger':    (PieceType.BLIND_TIGER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Copper_General': (PieceType.COPPER_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Capricorn':      (PieceType.CAPRICORN, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Chinese_Rooster': (PieceType.CHINESE_ROOSTER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Ceramic_Dove':   (PieceType.CERAMIC_DOVE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Cloud_Eagle':    (PieceType.CLOUD_EAGLE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Chicken_General': (PieceType.CHICKEN_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Chariot_Soldier': (PieceType.CHARIOT_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Stone_Chariot':  (PieceType.STONE_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Flying_Rooster': (PieceType.FLYING_ROOSTER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Cloud_Dragon':   (PieceType.CLOUD_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Climbing_Monkey': (PieceType.CLIMBING_MONKEY, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Center_Standard': (PieceType.CENTER_STANDARD, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Captive_Officer': (PieceType.CAPTIVE_OFFICER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Prince':         (PieceType.PRINCE, PieceColor.WHITE, PieceRank.KING),
-    'White_Copper_Chariot': (PieceType.COPPER_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Cat_Sword':      (PieceType.CAT_SWORD, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Captive_Cadet':  (PieceType.CAPTIVE_CADET, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Dog':            (PieceType.DOG, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Drunken_Elephant': (PieceType.DRUNKEN_ELEPHANT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Roaring_Dog':    (PieceType.ROARING_DOG, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Dragon_Horse':   (PieceType.DRAGON_HORSE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Dragon_King':    (PieceType.DRAGON_KING, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Donkey':         (PieceType.DONKEY, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Fire_Demon':     (PieceType.FIRE_DEMON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Dark_Spirit':    (PieceType.DARK_SPIRIT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Deva':           (PieceType.DEVA, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Earth_General':  (PieceType.EARTH_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Enchanted_Badger': (PieceType.ENCHANTED_BADGER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Earth_Chariot':  (PieceType.EARTH_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Earth_Dragon':   (PieceType.EARTH_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Fierce_Eagle':   (PieceType.FIERCE_EAGLE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Soaring_Eagle':  (PieceType.SOARING_EAGLE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Eastern_Barbarian': (PieceType.EASTERN_BARBARIAN, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Evil_Wolf':      (PieceType.EVIL_WOLF, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Fire_General':   (PieceType.FIRE_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Flying_Cat':     (PieceType.FLYING_CAT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Flying_Dragon':  (PieceType.FLYING_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Eagle':     (PieceType.FREE_EAGLE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Fragrant_Elephant': (PieceType.FRAGRANT_ELEPHANT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Flying_Horse':    (PieceType.FLYING_HORSE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Fire_Dragon':     (PieceType.FIRE_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Ferocious_Leopard': (PieceType.FEROCIOUS_LEOPARD, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Forest_Demon':   (PieceType.FOREST_DEMON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Pup':       (PieceType.FREE_PUP, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Demon':     (PieceType.FREE_DEMON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Flying_Swallow': (PieceType.FLYING_SWALLOW, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Dream_Eater': (PieceType.FREE_DREAM_EATER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Flying_Goose':    (PieceType.FLYING_GOOSE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Go_Between':      (PieceType.GO_BETWEEN, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Gold_Chariot':   (PieceType.GOLD_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Great_Dragon':   (PieceType.GREAT_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Great_Standard':  (PieceType.GREAT_STANDARD, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Great_General':   (PieceType.GREAT_GENERAL, PieceColor.WHITE, PieceRank.GREAT_GENERAL),
-    'White_Golden_Deer':    (PieceType.GOLDEN_DEER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Great_Master':   (PieceType.GREAT_MASTER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Wood_General':   (PieceType.WOOD_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Golden_Bird':    (PieceType.GOLDEN_BIRD, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Great_Dove':     (PieceType.GREAT_DOVE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Great_Stag':     (PieceType.GREAT_STAG, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Great_Turtle':   (PieceType.GREAT_TURTLE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Guardian_Of_The_Gods': (PieceType.GUARDIAN_OF_THE_GODS, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Horse_General':  (PieceType.HORSE_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Howling_Dog':    (PieceType.HOWLING_DOG, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Rams_Head_Soldier': (PieceType.RAMS_HEAD_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Horned_Falcon':  (PieceType.HORNFED_FALCON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Hook_Mover':     (PieceType.HOOK_MOVER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Horseman':       (PieceType.HORSEMAN, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Running_Horse':  (PieceType.RUNNING_HORSE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Horse_Soldier':  (PieceType.HORSE_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Iron_General':   (PieceType.IRON_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Shogi_King':     (PieceType.SHOGI_KING, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Kirin_Master':   (PieceType.KIRIN_MASTER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Kirin':          (PieceType.KIRIN, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Longbow_Soldier': (PieceType.LONGBOW_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Left_Chariot':   (PieceType.LEFT_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Lion_Dog':       (PieceType.LION_DOG, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Left_Dragon':    (PieceType.LEFT_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Left_General':   (PieceType.LEFT_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Liberated_Horse': (PieceType.LIBERATED_HORSE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Lion_Hawk':      (PieceType.LION_HAWK, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Little_Turtle':  (PieceType.LITTLE_TURTLE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Lion':           (PieceType.LION, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Long_Nosed_Goblin': (PieceType.LONG_NOSED_GOBLIN, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Leopard_Soldier': (PieceType.LEOPARD_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Little_Standard': (PieceType.LITTLE_STANDARD, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Left_Tiger':     (PieceType.LEFT_TIGER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Mountain_General': (PieceType.MOUNTAIN_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Mountain_Falcon': (PieceType.MOUNTAIN_FALCON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Side_Monkey':    (PieceType.SIDE_MONKEY, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Left_Mountain_Eagle': (PieceType.LEFT_MOUNTAIN_EAGLE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Right_Mountain_Eagle': (PieceType.RIGHT_MOUNTAIN_EAGLE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Mountain_Stag':  (PieceType.MOUNTAIN_STAG, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Center_Master': (PieceType.CENTER_MASTER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Northern_Barbarian': (PieceType.NORTHERN_BARBARIAN, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Neighboring_King': (PieceType.NEIGHBORING_KING, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Violent_Wolf': (PieceType.VIOLENT_WOLF, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Ox_General': (PieceType.OX_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Oxcart': (PieceType.OXCART, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Old_Kite': (PieceType.OLD_KITE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Old_Monkey': (PieceType.OLD_MONKEY, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Old_Rat': (PieceType.OLD_RAT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Ox_Soldier': (PieceType.OX_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Swooping_Owl': (PieceType.SWOOPING_OWL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Flying_Ox': (PieceType.FLYING_OX, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Peacock': (PieceType.PEACOCK, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Pup_General': (PieceType.PUP_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Phoenix': (PieceType.PHOENIX, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Pig_General': (PieceType.PIG_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Phoenix_Master': (PieceType.PHOENIX_MASTER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Prancing_Stag': (PieceType.PRANCING_STAG, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Poisonous_Snake': (PieceType.POISONOUS_SNAKE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Rain_Dragon': (PieceType.RAIN_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Rushing_Bird': (PieceType.RUSHING_BIRD, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Right_Chariot': (PieceType.RIGHT_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Reclining_Dragon': (PieceType.RECLINING_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_River_General': (PieceType.RIVER_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Right_General': (PieceType.RIGHT_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Running_Chariot': (PieceType.RUNNING_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Right_Dragon': (PieceType.RIGHT_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Roc_Master': (PieceType.ROC_MASTER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Running_Stag': (PieceType.RUNNING_STAG, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Rook_General': (PieceType.ROOK_GENERAL, PieceColor.WHITE, PieceRank.GENERAL),
-    'White_Running_Pup': (PieceType.RUNNING_PUP, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Running_Rabbit': (PieceType.RUNNING_RABBIT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Rear_Standard': (PieceType.REAR_STANDARD, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Running_Tiger': (PieceType.RUNNING_TIGER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Running_Serpent': (PieceType.RUNNING_SERPENT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Reverse_Chariot': (PieceType.REVERSE_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Running_Wolf': (PieceType.RUNNING_WOLF, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Side_Boar': (PieceType.SIDE_BOAR, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Crossbow_Soldier': (PieceType.CROSSBOW_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Front_Standard': (PieceType.FRONT_STANDARD, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Sword_Soldier': (PieceType.SWORD_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Side_Flyer': (PieceType.SIDE_FLYER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Stone_General': (PieceType.STONE_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Side_Dragon': (PieceType.SIDE_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Side_Soldier': (PieceType.SIDE_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Side_Mover': (PieceType.SIDE_MOVER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Coiled_Serpent': (PieceType.COILED_SERPENT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Soldier': (PieceType.SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Spear_Soldier': (PieceType.SPEAR_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Square_Mover': (PieceType.SQUARE_MOVER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Silver_Rabbit': (PieceType.SILVER_RABBIT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Side_Serpent': (PieceType.SIDE_SERPENT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Strutting_Crow': (PieceType.STRUTTING_CROW, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Southern_Barbarian': (PieceType.SOUTHERN_BARBARIAN, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Silver_Chariot': (PieceType.SILVER_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Swallows_Wings': (PieceType.SWALLOWS_WINGS, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Side_Ox': (PieceType.SIDE_OX, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Tile_General': (PieceType.TILE_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Tile_Chariot': (PieceType.TILE_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Turtle_Dove': (PieceType.TURTLE_DOVE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Treacherous_Fox': (PieceType.TREACHEROUS_FOX, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Savage_Tiger': (PieceType.SAVAGE_TIGER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Turtle_Snake': (PieceType.TURTLE_SNAKE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Right_Tiger': (PieceType.RIGHT_TIGER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Violent_Bear': (PieceType.VIOLENT_BEAR, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Violent_Dragon': (PieceType.VIOLENT_DRAGON, PieceColor.WHITE, PieceRank.GENERAL),
-    'White_Vertical_Bear': (PieceType.VERTICAL_BEAR, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Vice_General': (PieceType.VICE_GENERAL, PieceColor.WHITE, PieceRank.VICE_GENERAL),
-    'White_Vertical_Horse': (PieceType.VERTICAL_HORSE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Vermilion_Sparrow': (PieceType.VERMILION_SPARROW, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Vertical_Leopard': (PieceType.VERTICAL_LEOPARD, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Vertical_Mover': (PieceType.VERTICAL_MOVER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Violent_Ox': (PieceType.VIOLENT_OX, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Vertical_Pup': (PieceType.VERTICAL_PUP, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Vertical_Soldier': (PieceType.VERTICAL_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Violent_Stag': (PieceType.VIOLENT_STAG, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Vertical_Tiger': (PieceType.VERTICAL_TIGER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Vertical_Wolf': (PieceType.VERTICAL_WOLF, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Whale': (PieceType.WHALE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Water_Dragon': (PieceType.WATER_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Water_Buffalo': (PieceType.WATER_BUFFALO, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Wood_Chariot': (PieceType.WOOD_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Wind_Dragon': (PieceType.WIND_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_White_Elephant': (PieceType.WHITE_ELEPHANT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Side_Wolf': (PieceType.SIDE_WOLF, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Water_General': (PieceType.WATER_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_White_Horse': (PieceType.WHITE_HORSE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Woodland_Demon': (PieceType.WOODLAND_DEMON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Wind_General': (PieceType.WIND_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Wooden_Dove': (PieceType.WOODEN_DOVE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Wrestler': (PieceType.WRESTLER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Western_Barbarian': (PieceType.WESTERN_BARBARIAN, PieceColor.WHITE, PieceRank.OTHER),
-    'White_White_Tiger': (PieceType.WHITE_TIGER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Yaksha': (PieceType.YAKSHA, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Right_Army': (PieceType.RIGHT_ARMY, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Left_Army': (PieceType.LEFT_ARMY, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Fire': (PieceType.FREE_FIRE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Great_Whale': (PieceType.GREAT_WHALE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Divine_Tiger': (PieceType.DIVINE_TIGER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Divine_Turtle': (PieceType.DIVINE_TURTLE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Elephant_King': (PieceType.ELEPHANT_KING, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Captive_Bird': (PieceType.CAPTIVE_BIRD, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Thunder_Runner': (PieceType.THUNDER_RUNNER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Leopard': (PieceType.FREE_LEOPARD, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Serpent': (PieceType.FREE_SERPENT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Tiger': (PieceType.FREE_TIGER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Bear': (PieceType.FREE_BEAR, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Heavenly_Tetrarch': (PieceType.HEAVENLY_TETRARCH, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Playful_Cockatoo': (PieceType.PLAYFUL_COCKATOO, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Running_Dragon': (PieceType.RUNNING_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Stag': (PieceType.FREE_STAG, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Wolf': (PieceType.FREE_WOLF, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Rain_Demon': (PieceType.RAIN_DEMON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Flying_Crocodile': (PieceType.FLYING_CROCODILE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Beast_Bird': (PieceType.BEAST_BIRD, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Dragon': (PieceType.FREE_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Dog': (PieceType.FREE_DOG, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Goose_Wing': (PieceType.GOOSE_WING, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Pig': (PieceType.FREE_PIG, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Chicken': (PieceType.FREE_CHICKEN, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Horse': (PieceType.FREE_HORSE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Ox': (PieceType.FREE_OX, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Boar': (PieceType.FREE_BOAR, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Furious_Fiend': (PieceType.FURIOUS_FIEND, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Free_Bird': (PieceType.FREE_BIRD, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Right_Phoenix': (PieceType.RIGHT_PHOENIX, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Walking_Heron': (PieceType.WALKING_HERON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Strong_Eagle': (PieceType.STRONG_EAGLE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Copper_Elephant': (PieceType.COPPER_ELEPHANT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Burning_Chariot': (PieceType.BURNING_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Tiger_Soldier': (PieceType.TIGER_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Ancient_Dragon': (PieceType.ANCIENT_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Buddhist_Spirit': (PieceType.BUDDHIST_SPIRIT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Teaching_King': (PieceType.TEACHING_KING, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Wind_Snapping_Turtle': (PieceType.WIND_SNAPPING_TURTLE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Great_Horse': (PieceType.GREAT_HORSE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Left_Dog': (PieceType.LEFT_DOG, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Right_Dog': (PieceType.RIGHT_DOG, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Great_Dream_Eater': (PieceType.GREAT_DREAM_EATER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Flying_Falcon': (PieceType.FLYING_FALCON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Treasure_Turtle': (PieceType.TREASURE_TURTLE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Spirit_Turtle': (PieceType.SPIRIT_TURTLE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Running_Tile': (PieceType.RUNNING_TILE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Great_Bear': (PieceType.GREAT_BEAR, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Venomous_Wolf': (PieceType.VENOMOUS_WOLF, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Heavenly_Horse': (PieceType.HEAVENLY_HORSE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Raiding_Falcon': (PieceType.RAIDING_FALCON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Mountain_Witch': (PieceType.MOUNTAIN_WITCH, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Wizard_Stork': (PieceType.WIZARD_STORK, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Rushing_Boar': (PieceType.RUSHING_BOAR, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Bears_Eyes': (PieceType.BEARS_EYES, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Mountain_Crane': (PieceType.MOUNTIAN_CRANE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Young_Bird': (PieceType.YOUNG_BIRD, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Divine_Sparrow': (PieceType.DIVINE_SPARROW, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Divine_Dragon': (PieceType.DIVINE_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Cavalier': (PieceType.CAVALIER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Gliding_Sparrow': (PieceType.GLIDING_SPARROW, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Flying_Stag': (PieceType.FLYING_STAG, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Plooding_Ox': (PieceType.PLODDING_OX, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Bird_of_Paradise': (PieceType.BIRD_OF_PARADISE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Strong_Chariot': (PieceType.STRONG_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Coiled_Dragon': (PieceType.COILED_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Heavenly_Tetrarch_King': (PieceType.HEAVENLY_TETRARCH_KING, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Violent_Wind': (PieceType.VIOLENT_WIND, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Chinese_River': (PieceType.CHINESE_RIVER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Peaceful_Mountain': (PieceType.PEACEFUL_MOUNTAIN, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Running_Ox': (PieceType.RUNNING_OX, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Running_Boar': (PieceType.RUNNING_BOAR, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Running_Leopard': (PieceType.RUNNING_LEOPARD, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Strong_Bear': (PieceType.STRONG_BEAR, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Right_Iron_Chariot': (PieceType.RIGHT_IRON_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Left_Iron_Chariot': (PieceType.LEFT_IRON_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Fire_Ox': (PieceType.FIRE_OX, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Longbow_General': (PieceType.LONGBOW_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Leopard_King': (PieceType.LEOPARD_KING, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Burning_General': (PieceType.BURNING_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Sword_General': (PieceType.SWORD_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Great_Falcon': (PieceType.GREAT_FALCON, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Great_Eagle': (PieceType.GREAT_EAGLE, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Spear_General': (PieceType.SPEAR_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Great_Leopard': (PieceType.GREAT_LEOPARD, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Great_Tiger': (PieceType.GREAT_TIGER, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Crossbow_General': (PieceType.CROSSBOW_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Great_Elephant': (PieceType.GREAT_ELEPHANT, PieceColor.WHITE, PieceRank.OTHER),
-    'White_Multi_General': (PieceType.MULTI_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
-
-    'Black_Pawn':           (PieceType.PAWN, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Knight':         (PieceType.KNIGHT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Bishop':         (PieceType.BISHOP, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Rook':           (PieceType.ROOK, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Queen':          (PieceType.QUEEN, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_King':           (PieceType.KING, PieceColor.BLACK, PieceRank.KING),
-    'Black_Gold_General':   (PieceType.GOLD_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Silver_General': (PieceType.SILVER_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Shogi_Knight':   (PieceType.SHOGI_KNIGHT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Lance':          (PieceType.LANCE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Shogi_Pawn':     (PieceType.SHOGI_PAWN, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Dragon':         (PieceType.DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Horse':          (PieceType.HORSE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Angry_Boar':     (PieceType.ANGRY_BOAR, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Running_Bear':   (PieceType.RUNNING_BEAR, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Blind_Bear':     (PieceType.BLIND_BEAR, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Beast_Cadet':    (PieceType.BEAST_CADET, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Buddhist_Devil': (PieceType.BUDDHIST_DEVIL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Bear_Soldier':   (PieceType.BEAR_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Bishop_General': (PieceType.BISHOP_GENERAL, PieceColor.BLACK, PieceRank.GENERAL),
-    'Black_Blind_Dog':      (PieceType.BLIND_DOG, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Blue_Dragon':    (PieceType.BLUE_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Blind_Monkey':   (PieceType.BLIND_MONKEY, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Burning_Soldier': (PieceType.BURNING_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Beast_Officer':  (PieceType.BEAST_OFFICER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Boar_Soldier':   (PieceType.BOAR_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Blind_Tiger':    (PieceType.BLIND_TIGER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Copper_General': (PieceType.COPPER_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Capricorn':      (PieceType.CAPRICORN, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Chinese_Rooster': (PieceType.CHINESE_ROOSTER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Ceramic_Dove':   (PieceType.CERAMIC_DOVE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Cloud_Eagle':    (PieceType.CLOUD_EAGLE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Chicken_General': (PieceType.CHICKEN_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Chariot_Soldier': (PieceType.CHARIOT_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Stone_Chariot':  (PieceType.STONE_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Flying_Rooster': (PieceType.FLYING_ROOSTER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Cloud_Dragon':   (PieceType.CLOUD_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Climbing_Monkey': (PieceType.CLIMBING_MONKEY, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Center_Standard': (PieceType.CENTER_STANDARD, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Captive_Officer': (PieceType.CAPTIVE_OFFICER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Prince':         (PieceType.PRINCE, PieceColor.BLACK, PieceRank.KING),
-    'Black_Copper_Chariot': (PieceType.COPPER_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Cat_Sword':      (PieceType.CAT_SWORD, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Captive_Cadet':  (PieceType.CAPTIVE_CADET, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Dog':            (PieceType.DOG, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Drunken_Elephant': (PieceType.DRUNKEN_ELEPHANT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Roaring_Dog':    (PieceType.ROARING_DOG, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Dragon_Horse':   (PieceType.DRAGON_HORSE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Dragon_King':    (PieceType.DRAGON_KING, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Donkey':         (PieceType.DONKEY, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Fire_Demon':     (PieceType.FIRE_DEMON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Dark_Spirit':    (PieceType.DARK_SPIRIT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Deva':           (PieceType.DEVA, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Earth_General':  (PieceType.EARTH_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Enchanted_Badger': (PieceType.ENCHANTED_BADGER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Earth_Chariot':  (PieceType.EARTH_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Earth_Dragon':   (PieceType.EARTH_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Fierce_Eagle':   (PieceType.FIERCE_EAGLE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Soaring_Eagle':  (PieceType.SOARING_EAGLE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Eastern_Barbarian': (PieceType.EASTERN_BARBARIAN, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Evil_Wolf':      (PieceType.EVIL_WOLF, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Fire_General':   (PieceType.FIRE_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Flying_Cat':     (PieceType.FLYING_CAT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Flying_Dragon':  (PieceType.FLYING_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Eagle':     (PieceType.FREE_EAGLE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Fragrant_Elephant': (PieceType.FRAGRANT_ELEPHANT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Flying_Horse':    (PieceType.FLYING_HORSE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Fire_Dragon':     (PieceType.FIRE_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Ferocious_Leopard': (PieceType.FEROCIOUS_LEOPARD, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Forest_Demon':   (PieceType.FOREST_DEMON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Pup':       (PieceType.FREE_PUP, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Demon':     (PieceType.FREE_DEMON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Flying_Swallow': (PieceType.FLYING_SWALLOW, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Dream_Eater': (PieceType.FREE_DREAM_EATER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Flying_Goose':    (PieceType.FLYING_GOOSE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Go_Between':      (PieceType.GO_BETWEEN, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Gold_Chariot':   (PieceType.GOLD_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Great_Dragon':   (PieceType.GREAT_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Great_Standard':  (PieceType.GREAT_STANDARD, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Great_General':   (PieceType.GREAT_GENERAL, PieceColor.BLACK, PieceRank.GREAT_GENERAL),
-    'Black_Golden_Deer':    (PieceType.GOLDEN_DEER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Great_Master':   (PieceType.GREAT_MASTER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Wood_General':   (PieceType.WOOD_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Golden_Bird':    (PieceType.GOLDEN_BIRD, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Great_Dove':     (PieceType.GREAT_DOVE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Great_Stag':     (PieceType.GREAT_STAG, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Great_Turtle':   (PieceType.GREAT_TURTLE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Guardian_Of_The_Gods': (PieceType.GUARDIAN_OF_THE_GODS, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Horse_General':  (PieceType.HORSE_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Howling_Dog':    (PieceType.HOWLING_DOG, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Rams_Head_Soldier': (PieceType.RAMS_HEAD_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Horned_Falcon':  (PieceType.HORNFED_FALCON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Hook_Mover':     (PieceType.HOOK_MOVER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Horseman':       (PieceType.HORSEMAN, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Running_Horse':  (PieceType.RUNNING_HORSE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Horse_Soldier':  (PieceType.HORSE_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Iron_General':   (PieceType.IRON_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Shogi_King':     (PieceType.SHOGI_KING, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Kirin_Master':   (PieceType.KIRIN_MASTER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Kirin':          (PieceType.KIRIN, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Longbow_Soldier': (PieceType.LONGBOW_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Left_Chariot':   (PieceType.LEFT_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Lion_Dog':       (PieceType.LION_DOG, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Left_Dragon':    (PieceType.LEFT_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Left_General':   (PieceType.LEFT_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Liberated_Horse': (PieceType.LIBERATED_HORSE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Lion_Hawk':      (PieceType.LION_HAWK, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Little_Turtle':  (PieceType.LITTLE_TURTLE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Lion':           (PieceType.LION, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Long_Nosed_Goblin': (PieceType.LONG_NOSED_GOBLIN, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Leopard_Soldier': (PieceType.LEOPARD_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Little_Standard': (PieceType.LITTLE_STANDARD, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Left_Tiger':     (PieceType.LEFT_TIGER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Mountain_General': (PieceType.MOUNTAIN_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Mountain_Falcon': (PieceType.MOUNTAIN_FALCON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Side_Monkey':    (PieceType.SIDE_MONKEY, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Left_Mountain_Eagle': (PieceType.LEFT_MOUNTAIN_EAGLE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Right_Mountain_Eagle': (PieceType.RIGHT_MOUNTAIN_EAGLE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Mountain_Stag':  (PieceType.MOUNTAIN_STAG, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Center_Master': (PieceType.CENTER_MASTER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Northern_Barbarian': (PieceType.NORTHERN_BARBARIAN, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Neighboring_King': (PieceType.NEIGHBORING_KING, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Violent_Wolf': (PieceType.VIOLENT_WOLF, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Ox_General': (PieceType.OX_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Oxcart': (PieceType.OXCART, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Old_Kite': (PieceType.OLD_KITE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Old_Monkey': (PieceType.OLD_MONKEY, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Old_Rat': (PieceType.OLD_RAT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Ox_Soldier': (PieceType.OX_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Swooping_Owl': (PieceType.SWOOPING_OWL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Flying_Ox': (PieceType.FLYING_OX, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Peacock': (PieceType.PEACOCK, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Pup_General': (PieceType.PUP_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Phoenix': (PieceType.PHOENIX, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Pig_General': (PieceType.PIG_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Phoenix_Master': (PieceType.PHOENIX_MASTER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Prancing_Stag': (PieceType.PRANCING_STAG, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Poisonous_Snake': (PieceType.POISONOUS_SNAKE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Rain_Dragon': (PieceType.RAIN_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Rushing_Bird': (PieceType.RUSHING_BIRD, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Right_Chariot': (PieceType.RIGHT_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Reclining_Dragon': (PieceType.RECLINING_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_River_General': (PieceType.RIVER_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Right_General': (PieceType.RIGHT_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Running_Chariot': (PieceType.RUNNING_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Right_Dragon': (PieceType.RIGHT_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Roc_Master': (PieceType.ROC_MASTER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Running_Stag': (PieceType.RUNNING_STAG, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Rook_General': (PieceType.ROOK_GENERAL, PieceColor.BLACK, PieceRank.GENERAL),
-    'Black_Running_Pup': (PieceType.RUNNING_PUP, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Running_Rabbit': (PieceType.RUNNING_RABBIT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Rear_Standard': (PieceType.REAR_STANDARD, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Running_Tiger': (PieceType.RUNNING_TIGER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Running_Serpent': (PieceType.RUNNING_SERPENT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Reverse_Chariot': (PieceType.REVERSE_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Running_Wolf': (PieceType.RUNNING_WOLF, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Side_Boar': (PieceType.SIDE_BOAR, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Crossbow_Soldier': (PieceType.CROSSBOW_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Front_Standard': (PieceType.FRONT_STANDARD, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Sword_Soldier': (PieceType.SWORD_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Side_Flyer': (PieceType.SIDE_FLYER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Stone_General': (PieceType.STONE_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Side_Dragon': (PieceType.SIDE_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Side_Soldier': (PieceType.SIDE_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Side_Mover': (PieceType.SIDE_MOVER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Coiled_Serpent': (PieceType.COILED_SERPENT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Soldier': (PieceType.SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Spear_Soldier': (PieceType.SPEAR_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Square_Mover': (PieceType.SQUARE_MOVER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Silver_Rabbit': (PieceType.SILVER_RABBIT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Side_Serpent': (PieceType.SIDE_SERPENT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Strutting_Crow': (PieceType.STRUTTING_CROW, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Southern_Barbarian': (PieceType.SOUTHERN_BARBARIAN, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Silver_Chariot': (PieceType.SILVER_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Swallows_Wings': (PieceType.SWALLOWS_WINGS, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Side_Ox': (PieceType.SIDE_OX, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Tile_General': (PieceType.TILE_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Tile_Chariot': (PieceType.TILE_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Turtle_Dove': (PieceType.TURTLE_DOVE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Treacherous_Fox': (PieceType.TREACHEROUS_FOX, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Savage_Tiger': (PieceType.SAVAGE_TIGER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Turtle_Snake': (PieceType.TURTLE_SNAKE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Right_Tiger': (PieceType.RIGHT_TIGER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Violent_Bear': (PieceType.VIOLENT_BEAR, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Violent_Dragon': (PieceType.VIOLENT_DRAGON, PieceColor.BLACK, PieceRank.GENERAL),
-    'Black_Vertical_Bear': (PieceType.VERTICAL_BEAR, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Vice_General': (PieceType.VICE_GENERAL, PieceColor.BLACK, PieceRank.VICE_GENERAL),
-    'Black_Vertical_Horse': (PieceType.VERTICAL_HORSE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Vermillion_Sparrow': (PieceType.VERMILION_SPARROW, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Vertical_Leopard': (PieceType.VERTICAL_LEOPARD, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Vertical_Mover': (PieceType.VERTICAL_MOVER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Violent_Ox': (PieceType.VIOLENT_OX, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Vertical_Pup': (PieceType.VERTICAL_PUP, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Vertical_Soldier': (PieceType.VERTICAL_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Violent_Stag': (PieceType.VIOLENT_STAG, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Vertical_Tiger': (PieceType.VERTICAL_TIGER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Vertical_Wolf': (PieceType.VERTICAL_WOLF, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Whale': (PieceType.WHALE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Water_Dragon': (PieceType.WATER_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Water_Buffalo': (PieceType.WATER_BUFFALO, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Wood_Chariot': (PieceType.WOOD_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Wind_Dragon': (PieceType.WIND_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_White_Elephant': (PieceType.WHITE_ELEPHANT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Side_Wolf': (PieceType.SIDE_WOLF, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Water_General': (PieceType.WATER_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_White_Horse': (PieceType.WHITE_HORSE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Woodland_Demon': (PieceType.WOODLAND_DEMON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Wind_General': (PieceType.WIND_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Wooden_Dove': (PieceType.WOODEN_DOVE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Wrestler': (PieceType.WRESTLER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Western_Barbarian': (PieceType.WESTERN_BARBARIAN, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_White_Tiger': (PieceType.WHITE_TIGER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Yaksha': (PieceType.YAKSHA, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Right_Army': (PieceType.RIGHT_ARMY, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Left_Army': (PieceType.LEFT_ARMY, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Fire': (PieceType.FREE_FIRE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Great_Whale': (PieceType.GREAT_WHALE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Divine_Tiger': (PieceType.DIVINE_TIGER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Divine_Turtle': (PieceType.DIVINE_TURTLE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Elephant_King': (PieceType.ELEPHANT_KING, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Captive_Bird': (PieceType.CAPTIVE_BIRD, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Thunder_Runner': (PieceType.THUNDER_RUNNER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Leopard': (PieceType.FREE_LEOPARD, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Serpent': (PieceType.FREE_SERPENT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Tiger': (PieceType.FREE_TIGER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Bear': (PieceType.FREE_BEAR, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Heavenly_Tetrarch': (PieceType.HEAVENLY_TETRARCH, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Playful_Cockatoo': (PieceType.PLAYFUL_COCKATOO, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Running_Dragon': (PieceType.RUNNING_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Stag': (PieceType.FREE_STAG, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Wolf': (PieceType.FREE_WOLF, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Rain_Demon': (PieceType.RAIN_DEMON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Flying_Crocodile': (PieceType.FLYING_CROCODILE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Beast_Bird': (PieceType.BEAST_BIRD, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Dragon': (PieceType.FREE_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Dog': (PieceType.FREE_DOG, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Goose_Wing': (PieceType.GOOSE_WING, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Pig': (PieceType.FREE_PIG, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Chicken': (PieceType.FREE_CHICKEN, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Horse': (PieceType.FREE_HORSE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Ox': (PieceType.FREE_OX, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Boar': (PieceType.FREE_BOAR, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Furious_Fiend': (PieceType.FURIOUS_FIEND, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Free_Bird': (PieceType.FREE_BIRD, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Right_Phoenix': (PieceType.RIGHT_PHOENIX, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Walking_Heron': (PieceType.WALKING_HERON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Strong_Eagle': (PieceType.STRONG_EAGLE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Copper_Elephant': (PieceType.COPPER_ELEPHANT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Burning_Chariot': (PieceType.BURNING_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Tiger_Soldier': (PieceType.TIGER_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Ancient_Dragon': (PieceType.ANCIENT_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Buddhist_Spirit': (PieceType.BUDDHIST_SPIRIT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Teaching_King': (PieceType.TEACHING_KING, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Wind_Snapping_Turtle': (PieceType.WIND_SNAPPING_TURTLE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Great_Horse': (PieceType.GREAT_HORSE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Left_Dog': (PieceType.LEFT_DOG, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Right_Dog': (PieceType.RIGHT_DOG, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Great_Dream_Eater': (PieceType.GREAT_DREAM_EATER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Flying_Falcon': (PieceType.FLYING_FALCON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Treasure_Turtle': (PieceType.TREASURE_TURTLE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Spirit_Turtle': (PieceType.SPIRIT_TURTLE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Running_Tile': (PieceType.RUNNING_TILE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Great_Bear': (PieceType.GREAT_BEAR, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Venomous_Wolf': (PieceType.VENOMOUS_WOLF, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Heavenly_Horse': (PieceType.HEAVENLY_HORSE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Raiding_Falcon': (PieceType.RAIDING_FALCON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Mountain_Witch': (PieceType.MOUNTAIN_WITCH, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Wizard_Stork': (PieceType.WIZARD_STORK, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Rushing_Boar': (PieceType.RUSHING_BOAR, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Bears_Eyes': (PieceType.BEARS_EYES, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Mountain_Crane': (PieceType.MOUNTIAN_CRANE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Young_Bird': (PieceType.YOUNG_BIRD, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Divine_Sparrow': (PieceType.DIVINE_SPARROW, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Divine_Dragon': (PieceType.DIVINE_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Cavalier': (PieceType.CAVALIER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Gliding_Sparrow': (PieceType.GLIDING_SPARROW, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Flying_Stag': (PieceType.FLYING_STAG, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Plooding_Ox': (PieceType.PLODDING_OX, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Bird_of_Paradise': (PieceType.BIRD_OF_PARADISE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Strong_Chariot': (PieceType.STRONG_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Coiled_Dragon': (PieceType.COILED_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Heavenly_Tetrarch_King': (PieceType.HEAVENLY_TETRARCH_KING, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Violent_Wind': (PieceType.VIOLENT_WIND, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Chinese_River': (PieceType.CHINESE_RIVER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Peaceful_Mountain': (PieceType.PEACEFUL_MOUNTAIN, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Running_Ox': (PieceType.RUNNING_OX, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Running_Boar': (PieceType.RUNNING_BOAR, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Running_Leopard': (PieceType.RUNNING_LEOPARD, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Strong_Bear': (PieceType.STRONG_BEAR, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Right_Iron_Chariot': (PieceType.RIGHT_IRON_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Left_Iron_Chariot': (PieceType.LEFT_IRON_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Fire_Ox': (PieceType.FIRE_OX, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Longbow_General': (PieceType.LONGBOW_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Leopard_King': (PieceType.LEOPARD_KING, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Burning_General': (PieceType.BURNING_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Sword_General': (PieceType.SWORD_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Great_Falcon': (PieceType.GREAT_FALCON, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Great_Eagle': (PieceType.GREAT_EAGLE, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Spear_General': (PieceType.SPEAR_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Great_Leopard': (PieceType.GREAT_LEOPARD, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Great_Tiger': (PieceType.GREAT_TIGER, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Crossbow_General': (PieceType.CROSSBOW_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Great_Elephant': (PieceType.GREAT_ELEPHANT, PieceColor.BLACK, PieceRank.OTHER),
-    'Black_Multi_General': (PieceType.MULTI_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
-}
-
-ROYAL_PIECES = ['Rook_General', 'Bishop_General', 'Violent_Dragon', 'Flying_Crocodile', 'Vice_General', 'Great_General']
-HOOK_MOVERS = ['Hook_Mover', 'Capricorn', 'Long_Nosed_Goblin', 'Peacock']
-JUMP_MOVERS = ['Roc_Master']
-LIMITED_JUMPING_MOVERS = ['Golden_Bird', 'Free_Bird']
\ No newline at end of file
+import threading
+from collections import OrderedDict
+from enum import Enum
+from types import MappingProxyType
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+
+# Define common movement patterns
+MOVEMENT_PATTERNS = {
+    'ORTHOGONAL': [(-1, 0), (1, 0), (0, -1), (0, 1)],  # Up, down, left, right
+    'DIAGONAL': [(-1, -1), (-1, 1), (1, -1), (1, 1)],  # All diagonals
+    'KING': [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)],  # King moves
+    'KNIGHT': [(-2, -1), (-2, 1), (2, -1), (2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2)],  # L-shape
+    'SHOGI_KNIGHT': [(-2, -1), (-2, 1)],  # L-shape Forward
+    'FORWARD': [(-1, 0)],  # Forward only
+    'FORWARD_AND_BACKWARD': [(-1, 0), (1, 0)],  # Forward and backward
+    'FORWARD_DIAGONAL': [(-1, -1), (-1, 1)],  # Forward diagonals
+    'FORWARD_LEFT_DIAGONAL': [(-1, -1)],  # Forward left diagonal
+    'FORWARD_RIGHT_DIAGONAL': [(-1, 1)],  # Forward right diagonal
+    'BACKWARD': [(1, 0)],  # Backward only
+    'BACKWARD_DIAGONAL': [(1, -1), (1, 1)],  # Backward diagonals
+    'BACKWARD_LEFT_DIAGONAL': [(1, -1)],  # Backward left diagonal
+    'BACKWARD_RIGHT_DIAGONAL': [(1, 1)],  # Backward right diagonal
+    'SIDE': [(0, -1), (0, 1)],  # Left and right only
+    'LEFT_SIDE': [(0, -1)],  # Left side only
+    'RIGHT_SIDE': [(0, 1)],  # Right side only
+    'FORWARD_AND_SIDE': [(-1, 0), (0, -1), (0, 1)],  # Forward and sides
+    'BACKWARD_AND_SIDE': [(1, 0), (0, -1), (0, 1)],  # Backward and sides
+    'FORWARD_AND_DIAGONAL': [(-1, 0), (-1, -1), (-1, 1)],  # Forward and forward diagonals
+    'BACKWARD_AND_DIAGONAL': [(1, 0), (1, -1), (1, 1)],  # Backward and backward diagonals
+
+    'ROARING_DOG': [(-3, -3), (-3, 0), (-3, 3), (-3, 0), (0, -3), (3, 0)],  # Roaring Dog moves
+    'FLYING_CAT': [(0, -3), (-3, -3), (-3, 0), (-3, 3), (0, 3)],  # Flying Cat moves
+    'FLYING_DRAGON': [(-2, -2), (-2, 2), (2, 2), (2, -2)],  # Flying Dragon moves
+    'FREE_EAGLE': [(-2, -2), (-3, -3), (-4, -4),
+                   (-2, 0), (-3, 0),
+                   (-2, 2), (-3, 3), (-4, 4),
+                   (0, 2), (0, 3),
+                   (2, 2), (3, 3),
+                   (2, 0), (3, 0),
+                   (2, -2), (3, -3),
+                   (0, -2), (0, -3)],  # Free Eagle moves
+    'GREAT_MASTER': [(-3, -3), (-3, 0), (-3, 3)],  # Great Master moves
+    'GREAT_STAG': [(-2, -2), (-2, 2)],  # Great Stag moves
+    'GREAT_TURTLE': [(-3, 0), (3, 0)],  # Great Turtle moves
+    'HORNED_FALCON': [(-2, 0)],  # Horned Falcon moves
+    'RUNNING_HORSE': [(2, -2), (2, 2)],  # Running Horse moves
+    'KIRIN': [(0, -2), (0, 2)],  # Kirin moves
+    'DREAM_EATER': [(0, -3), (0, 3)],  # Dream Eater moves
+    'GREAT_FALCON': [(-2, 0), (2, 0)],  # Great Falcon moves
+    'LION_DOG': [(-3, -3), (-3, 0), (-3, 3), (0, 3), (3, 3), (3, 0), (3, -3), (0, -3)],  # Lion Dog moves
+    'HEAVENLY_TETRARCH': [(-2, -2), (-2, 0), (-2, 2), (0, 2), (2, 2), (2, 0), (2, -2), (0, -2)],  # Heavenly Tetrarch moves
+    'LEFT_MOUNTAIN_EAGLE': [(-2, -2), (2, -2)],  # Left Mountain Eagle moves
+    'RIGHT_MOUNTAIN_EAGLE': [(-2, 2), (2, 2)],  # Right Mountain Eagle moves
+    'CENTER_MASTER': [(-2, -2), (-2, 0), (-2, 2), (2, 0)],  # Center Master moves
+    'PHOENIX_MASTER': [(-3, -3), (-3, 3)],  # Phoenix Master moves
+    'WOODEN_DOVE': [(-3, -3), (-4, -4), (-5, -5),
+                    (-3, 3), (-4, 4), (-5, 5),
+                    (3, -3), (4, -4), (5, -5),
+                    (3, 3), (4, 4), (5, 5)],  # Wooden Dove moves
+    'VICE_GENERAL': [(-2, 0), (2, 0), (-2, 0), (2, 0)],  # Vice General moves
+    'SPIRIT_TURTLE': [(-3, 0), (3, 0), (-3, 0), (3, 0)],  # Spirit Turtle moves
+    'HEAVENLY_HORSE': [(-2, -1), (-2, 1), (2, -1), (2, 1)],  # Heavenly Horse moves
+}
+
+class PieceColor(Enum):
+    WHITE = 'White'
+    BLACK = 'Black'
+
+class PieceRank(Enum):
+    KING = 1
+    GREAT_GENERAL = 2
+    VICE_GENERAL = 3
+    GENERAL = 4
+    OTHER = 5
+
+class PieceType(Enum):
+    PAWN = 'Pawn'
+    KNIGHT = 'Knight'
+    BISHOP = 'Bishop'
+    ROOK = 'Rook'
+    QUEEN = 'Queen'
+    KING = 'King'
+    GOLD_GENERAL = 'Gold_General'
+    SILVER_GENERAL = 'Silver_General'
+    SHOGI_KNIGHT = 'Shogi_Knight'
+    LANCE = 'Lance'
+    SHOGI_PAWN = 'Shogi_Pawn'
+    DRAGON = 'Dragon'
+    HORSE = 'Horse'
+    ANGRY_BOAR = 'Angry_Boar'
+    RUNNING_BEAR = 'Running_Bear'
+    BLIND_BEAR = 'Blind_Bear'
+    BEAST_CADET = 'Beast_Cadet'
+    BUDDHIST_DEVIL = 'Buddhist_Devil'
+    BEAR_SOLDIER = 'Bear_Soldier'
+    BISHOP_GENERAL = 'Bishop_General'
+    BLIND_DOG = 'Blind_Dog'
+    BLUE_DRAGON = 'Blue_Dragon'
+    BLIND_MONKEY = 'Blind_Monkey'
+    BURNING_SOLDIER = 'Burning_Soldier'
+    BEAST_OFFICER = 'Beast_Officer'
+    BOAR_SOLDIER = 'Boar_Soldier'
+    BLIND_TIGER = 'Blind_Tiger'
+    COPPER_GENERAL = 'Copper_General'
+    CAPRICORN = 'Capricorn'
+    CHINESE_ROOSTER = 'Chinese_Rooster'
+    CERAMIC_DOVE = 'Ceramic_Dove'
+    CLOUD_EAGLE = 'Cloud_Eagle'
+    CHICKEN_GENERAL = 'Chicken_General'
+    CHARIOT_SOLDIER = 'Chariot_Soldier'
+    STONE_CHARIOT = 'Stone_Chariot'
+    FLYING_ROOSTER = 'Flying_Rooster'
+    CLOUD_DRAGON = 'Cloud_Dragon'
+    CLIMBING_MONKEY = 'Climbing_Monkey'
+    CENTER_STANDARD = 'Center_Standard'
+    CAPTIVE_OFFICER = 'Captive_Officer'
+    PRINCE = 'Prince'
+    COPPER_CHARIOT = 'Copper_Chariot'
+    CAT_SWORD = 'Cat_Sword'
+    CAPTIVE_CADET = 'Captive_Cadet'
+    DOG = 'Dog'
+    DRUNKEN_ELEPHANT = 'Drunken_Elephant'
+    ROARING_DOG = 'Roaring_Dog'
+    DRAGON_HORSE = 'Dragon_Horse'
+    DRAGON_KING = 'Dragon_King'
+    DONKEY = 'Donkey'
+    FIRE_DEMON = 'Fire_Demon'
+    DARK_SPIRIT = 'Dark_Spirit'
+    DEVA = 'Deva'
+    EARTH_GENERAL = 'Earth_General'
+    ENCHANTED_BADGER = 'Enchanted_Badger'
+    EARTH_CHARIOT = 'Earth_Chariot'
+    EARTH_DRAGON = 'Earth_Dragon'
+    FIERCE_EAGLE = 'Fierce_Eagle'
+    SOARING_EAGLE = 'Soaring_Eagle'
+    EASTERN_BARBARIAN = 'Eastern_Barbarian'
+    EVIL_WOLF = 'Evil_Wolf'
+    FIRE_GENERAL = 'Fire_General'
+    FLYING_CAT = 'Flying_Cat'
+    FLYING_DRAGON = 'Flying_Dragon'
+    FREE_EAGLE = 'Free_Eagle'
+    FRAGRANT_ELEPHANT = 'Fragrant_Elephant'
+    FLYING_HORSE = 'Flying_Horse'
+    FIRE_DRAGON = 'Fire_Dragon'
+    FEROCIOUS_LEOPARD = 'Ferocious_Leopard'
+    FOREST_DEMON = 'Forest_Demon'
+    FREE_PUP = 'Free_Pup'
+    FREE_DEMON = 'Free_Demon'
+    FLYING_SWALLOW = 'Flying_Swallow'
+    FREE_DREAM_EATER = 'Free_Dream_Eater'
+    FLYING_GOOSE = 'Flying_Goose'
+    GO_BETWEEN = 'Go_Between'
+    GOLD_CHARIOT = 'Gold_Chariot'
+    GREAT_DRAGON = 'Great_Dragon'
+    GREAT_STANDARD = 'Great_Standard'
+    GREAT_GENERAL = 'Great_General'
+    GOLDEN_DEER = 'Golden_Deer'
+    GREAT_MASTER = 'Great_Master'
+    WOOD_GENERAL = 'Wood_General'
+    GOLDEN_BIRD = 'Golden_Bird'
+    GREAT_DOVE = 'Great_Dove'
+    GREAT_STAG = 'Great_Stag'
+    GREAT_TURTLE = 'Great_Turtle'
+    GUARDIAN_OF_THE_GODS = 'Guardian_Of_The_Gods'
+    HORSE_GENERAL = 'Horse_General'
+    HOWLING_DOG = 'Howling_Dog'
+    RAMS_HEAD_SOLDIER = 'Rams_Head_Soldier'
+    HORNFED_FALCON = 'Horned_Falcon'
+    HOOK_MOVER = 'Hook_Mover'
+    HORSEMAN = 'Horseman'
+    RUNNING_HORSE = 'Running_Horse'
+    HORSE_SOLDIER = 'Horse_Soldier'
+    IRON_GENERAL = 'Iron_General'
+    SHOGI_KING = 'Sogi_King'
+    KIRIN_MASTER = 'Kirin_Master'
+    KIRIN = 'Kirin'
+    LONGBOW_SOLDIER = 'Longbow_Soldier'
+    LEFT_CHARIOT = 'Left_Chariot'
+    LION_DOG = 'Lion_Dog'
+    LEFT_DRAGON = 'Left_Dragon'
+    LEFT_GENERAL = 'Left_General'
+    LIBERATED_HORSE = 'Liberated_Horse'
+    LION_HAWK = 'Lion_Hawk'
+    LITTLE_TURTLE = 'Little_Turtle'
+    LION = 'Lion'
+    LONG_NOSED_GOBLIN = 'Long_Nosed_Goblin'
+    LEOPARD_SOLDIER = 'Leopard_Soldier'
+    LITTLE_STANDARD = 'Little_Standard'
+    LEFT_TIGER = 'Left_Tiger'
+    MOUNTAIN_GENERAL = 'Mountain_General'
+    MOUNTAIN_FALCON = 'Mountain_Falcon'
+    SIDE_MONKEY = 'Side_Monkey'
+    LEFT_MOUNTAIN_EAGLE = 'Left_Mountain_Eagle'
+    RIGHT_MOUNTAIN_EAGLE = 'Right_Mountain_Eagle'
+    MOUNTAIN_STAG = 'Mountain_Stag'
+    CENTER_MASTER = 'Center_Master'
+    NORTHERN_BARBARIAN = 'Northern_Barbarian'
+    NEIGHBORING_KING = 'Neighboring_King'
+    VIOLENT_WOLF = 'Violent_Wolf'
+    OX_GENERAL = 'Ox_General'
+    OXCART = 'Oxcart'
+    OLD_KITE = 'Old_Kite'
+    OLD_MONKEY = 'Old_Monkey'
+    OLD_RAT = 'Old_Rat'
+    OX_SOLDIER = 'Ox_Soldier'
+    SWOOPING_OWL = 'Swooping_Owl'
+    FLYING_OX = 'Flying_Ox'
+    PEACOCK = 'Peacock'
+    PUP_GENERAL = 'Pup_General'
+    PHOENIX = 'Phoenix'
+    PIG_GENERAL = 'Pig_General'
+    PHOENIX_MASTER = 'Phoenix_Master'
+    PRANCING_STAG = 'Prancing_Stag'
+    POISONOUS_SNAKE = 'Poisonous_Snake'
+    RAIN_DRAGON = 'Rain_Dragon'
+    RUSHING_BIRD = 'Rushing_Bird'
+    RIGHT_CHARIOT = 'Right_Chariot'
+    RECLINING_DRAGON = 'Reclining_Dragon'
+    RIVER_GENERAL = 'River_General'
+    RIGHT_GENERAL = 'Right_General'
+    RUNNING_CHARIOT = 'Running_Chariot'
+    RIGHT_DRAGON = 'Right_Dragon'
+    ROC_MASTER = 'Roc_Master'
+    RUNNING_STAG = 'Running_Stag'
+    ROOK_GENERAL = 'Rook_General'
+    RUNNING_PUP = 'Running_Pup'
+    RUNNING_RABBIT = 'Running_Rabbit'
+    REAR_STANDARD = 'Rear_Standard'
+    RUNNING_TIGER = 'Running_Tiger'
+    RUNNING_SERPENT = 'Running_Serpent'
+    REVERSE_CHARIOT = 'Reverse_Chariot'
+    RUNNING_WOLF = 'Running_Wolf'
+    SIDE_BOAR = 'Side_Boar'
+    CROSSBOW_SOLDIER = 'Crossbow_Soldier'
+    FRONT_STANDARD = 'Front_Standard'
+    SWORD_SOLDIER = 'Sword_Soldier'
+    SIDE_FLYER = 'Side_Flyer'
+    STONE_GENERAL = 'Stone_General'
+    SIDE_DRAGON = 'Side_Dragon'
+    SIDE_SOLDIER = 'Side_Soldier'
+    SIDE_MOVER = 'Side_Mover'
+    COILED_SERPENT = 'Coiled_Serpent'
+    SOLDIER = 'Soldier'
+    SPEAR_SOLDIER = 'Spear_Soldier'
+    SQUARE_MOVER = 'Square_Mover'
+    SILVER_RABBIT = 'Silver_Rabbit'
+    SIDE_SERPENT = 'Side_Serpent'
+    STRUTTING_CROW = 'Strutting_Crow'
+    SOUTHERN_BARBARIAN = 'Southern_Barbarian'
+    SILVER_CHARIOT = 'Silver_Chariot'
+    SWALLOWS_WINGS = 'Swallows_Wings'
+    SIDE_OX = 'Side_Ox'
+    TILE_GENERAL = 'Tile_General'
+    TILE_CHARIOT = 'Tile_Chariot'
+    TURTLE_DOVE = 'Turtle_Dove'
+    TREACHEROUS_FOX = 'Treacherous_Fox'
+    SAVAGE_TIGER = 'Savage_Tiger'
+    TURTLE_SNAKE = 'Turtle_Snake'
+    RIGHT_TIGER = 'Right_Tiger'
+    VIOLENT_BEAR = 'Violent_Bear'
+    VIOLENT_DRAGON = 'Violent_Dragon'
+    VERTICAL_BEAR = 'Vertical_Bear'
+    VICE_GENERAL = 'Vice_General'
+    VERTICAL_HORSE = 'Vertical_Horse'
+    VERMILION_SPARROW = 'Vermilion_Sparrow'
+    VERTICAL_LEOPARD = 'Vertical_Leopard'
+    VERTICAL_MOVER = 'Vertical_Mover'
+    VIOLENT_OX = 'Violent_Ox'
+    VERTICAL_PUP = 'Vertical_Pup'
+    VERTICAL_SOLDIER = 'Vertical_Soldier'
+    VIOLENT_STAG = 'Violent_Stag'
+    VERTICAL_TIGER = 'Vertical_Tiger'
+    VERTICAL_WOLF = 'Vertical_Wolf'
+    WHALE = 'Whale'
+    WATER_DRAGON = 'Water_Dragon'
+    WATER_BUFFALO = 'Water_Buffalo'
+    WOOD_CHARIOT = 'Wood_Chariot'
+    WIND_DRAGON = 'Wind_Dragon'
+    WHITE_ELEPHANT = 'White_Elephant'
+    SIDE_WOLF = 'Side_Wolf'
+    WATER_GENERAL = 'Water_General'
+    WHITE_HORSE = 'White_Horse'
+    WOODLAND_DEMON = 'Woodland_Demon'
+    WIND_GENERAL = 'Wind_General'
+    WOODEN_DOVE = 'Wooden_Dove'
+    WRESTLER = 'Wrestler'
+    WESTERN_BARBARIAN = 'Western_Barbarian'
+    WHITE_TIGER = 'White_Tiger'
+    YAKSHA = 'Yaksha'
+    RIGHT_ARMY = 'Right_Army'
+    LEFT_ARMY = 'Left_Army'
+    FREE_FIRE = 'Free_Fire'
+    GREAT_WHALE = 'Great_Whale'
+    DIVINE_TIGER = 'Divine_Tiger'
+    DIVINE_TURTLE = 'Divine_Turtle'
+    ELEPHANT_KING = 'Elephant_King'
+    CAPTIVE_BIRD = 'Captive_Bird'
+    THUNDER_RUNNER = 'Thunder_Runner'
+    FREE_LEOPARD = 'Free_Leopard'
+    FREE_SERPENT = 'Free_Serpent'
+    FREE_TIGER = 'Free_Tiger'
+    FREE_BEAR = 'Free_Bear'
+    HEAVENLY_TETRARCH = 'Heavenly_Tetrarch'
+    PLAYFUL_COCKATOO = 'Playful_Cockatoo'
+    RUNNING_DRAGON = 'Running_Dragon'
+    FREE_STAG = 'Free_Stag'
+    FREE_WOLF = 'Free_Wolf'
+    RAIN_DEMON = 'Rain_Demon'
+    FLYING_CROCODILE = 'Flying_Crocodile'
+    BEAST_BIRD = 'Beast_Bird'
+    FREE_DRAGON = 'Free_Dragon'
+    FREE_DOG = 'Free_Dog'
+    GOOSE_WING = 'Goose_Wing'
+    FREE_PIG = 'Free_Pig'
+    FREE_CHICKEN = 'Free_Chicken'
+    FREE_HORSE = 'Free_Horse'
+    FREE_OX = 'Free_Ox'
+    FREE_BOAR = 'Free_Boar'
+    FURIOUS_FIEND = 'Furious_Fiend'
+    FREE_BIRD = 'Free_Bird'
+    RIGHT_PHOENIX = 'Right_Phoenix'
+    WALKING_HERON = 'Walking_Heron'
+    STRONG_EAGLE = 'Strong_Eagle'
+    COPPER_ELEPHANT = 'Copper_Elephant'
+    BURNING_CHARIOT = 'Burning_Chariot'
+    TIGER_SOLDIER = 'Tiger_Soldier'
+    ANCIENT_DRAGON = 'Ancient_Dragon'
+    BUDDHIST_SPIRIT = 'Buddhist_Spirit'
+    TEACHING_KING = 'Teaching_King'
+    WIND_SNAPPING_TURTLE = 'Wind_Snapping_Turtle'
+    GREAT_HORSE = 'Great_Horse'
+    LEFT_DOG = 'Left_Dog'
+    RIGHT_DOG = 'Right_Dog'
+    GREAT_DREAM_EATER = 'Great_Dream_Eater'
+    FLYING_FALCON = 'Flying_Falcon'
+    TREASURE_TURTLE = 'Treasure_Turtle'
+    SPIRIT_TURTLE = 'Spirit_Turtle'
+    RUNNING_TILE = 'Running_Tile'
+    GREAT_BEAR = 'Great_Bear'
+    VENOMOUS_WOLF = 'Venomous_Wolf'
+    HEAVENLY_HORSE = 'Heavenly_Horse'
+    RAIDING_FALCON = 'Raiding_Falcon'
+    MOUNTAIN_WITCH = 'Mountain_Witch'
+    WIZARD_STORK = 'Wizard_Stork'
+    RUSHING_BOAR = 'Rushing_Boar'
+    BEARS_EYES = 'Bears_Eyes'
+    MOUNTIAN_CRANE = 'Mountain_Crane'
+    YOUNG_BIRD = 'Young_Bird'
+    DIVINE_SPARROW = 'Divine_Sparrow'
+    DIVINE_DRAGON = 'Divine_Dragon'
+    CAVALIER = 'Cavalier'
+    GLIDING_SPARROW = 'Gliding_Sparrow'
+    FLYING_STAG = 'Flying_Stag'
+    PLODDING_OX = 'Plooding_Ox'
+    BIRD_OF_PARADISE = 'Bird_of_Paradise'
+    STRONG_CHARIOT = 'Strong_Chariot'
+    COILED_DRAGON = 'Coiled_Dragon'
+    HEAVENLY_TETRARCH_KING = 'Heavenly_Tetrarch_King'
+    VIOLENT_WIND = 'Violent_Wind'
+    CHINESE_RIVER = 'Chinese_River'
+    PEACEFUL_MOUNTAIN = 'Peaceful_Mountain'
+    RUNNING_OX = 'Running_Ox'
+    RUNNING_BOAR = 'Running_Boar'
+    RUNNING_LEOPARD = 'Running_Leopard'
+    STRONG_BEAR = 'Strong_Bear'
+    RIGHT_IRON_CHARIOT = 'Right_Iron_Chariot'
+    LEFT_IRON_CHARIOT = 'Left_Iron_Chariot'
+    FIRE_OX = 'Fire_Ox'
+    LONGBOW_GENERAL = 'Longbow_General'
+    LEOPARD_KING = 'Leopard_King'
+    BURNING_GENERAL = 'Burning_General'
+    SWORD_GENERAL = 'Sword_General'
+    GREAT_FALCON = 'Great_Falcon'
+    GREAT_EAGLE = 'Great_Eagle'
+    SPEAR_GENERAL = 'Spear_General'
+    GREAT_LEOPARD = 'Great_Leopard'
+    GREAT_TIGER = 'Great_Tiger'
+    CROSSBOW_GENERAL = 'Crossbow_General'
+    GREAT_ELEPHANT = 'Great_Elephant'
+    MULTI_GENERAL = 'Multi_General'
+
+class PieceKey:
+    def __init__(self, color, piece_type, rank):
+        self.color = color  # 'White' or 'Black'
+        self.piece_type = piece_type  # 'Pawn', 'Knight', etc
+        self.rank = rank  # 'King', 'Great_General', etc
+
+    @classmethod
+    def from_string(cls, key_str):
+        # For backward compatibility, assume rank 1 if not specified
+        parts = key_str.split('_', 2)
+        if len(parts) >= 3:
+            return cls(parts[0], parts[1], int(parts[2]))
+        else:
+            return cls(parts[0], parts[1], 1)
+
+    def __str__(self):
+        return f"{self.color}{self.piece_type}{self.rank}"
+
+
+class Piece:
+    def __init__(self, piece_type: str, color: str, rank: int = 1):
+        self.piece_type = piece_type
+        self.color = color
+        self.rank = rank  # Numerical rank (1-10, 1=lowest, 10=highest)
+        self.symbol = color + '_' + piece_type  # Keep image filename without rank
+        self.direction = 1 if color == 'White' else -1
+
+    def get_legal_moves_with_info(self, pos: Tuple[int, int], board_size: int) -> List[Tuple[Tuple[int, int], bool]]:
+        """Get all legal moves for this piece from the given position with jump information.
+        Returns a list of tuples: (position, can_jump_over_pieces)"""
+        return [(move, can_jump)
+                for squares, can_jump in self.get_rays(pos, board_size)
+                for move in squares]
+
+    def get_rays(self, pos: Tuple[int, int], board_size: int) -> Tuple[Tuple[Tuple[Tuple[int, int], ...], bool], ...]:
+        """Get the empty-board rays for this piece from the given position.
+        Returns a tuple of (squares, can_jump) pairs in move order, served from RAY_TABLES."""
+        return RAY_TABLES.get_rays(self.piece_type, self.color, board_size, pos)
+
+    def _build_rays(self, pos: Tuple[int, int], board_size: int) -> Tuple[Tuple[Tuple[Tuple[int, int], ...], bool], ...]:
+        """Walk the compiled movement spec for this piece on an empty board."""
+        if self.piece_type == 'Pawn':
+            # Pawn moves depend on the start row, so keep each one as its own ray
+            return tuple(((move,), False) for move in self._get_pawn_moves(pos, board_size))
+
+        rays = []
+        row, col = pos
+        for ray in PIECE_SPECS.get(self.piece_type, ()):
+            dr = ray.row_step * self.direction
+            dc = ray.col_step * self.direction
+            current_row, current_col = row + dr, col + dc
+            squares = []
+            while (ray.max_steps is None or len(squares) < ray.max_steps) and 0 <= current_row < board_size and 0 <= current_col < board_size:
+                squares.append((current_row, current_col))
+                current_row += dr
+                current_col += dc
+            if squares:
+                rays.append((tuple(squares), ray.can_jump))
+        return tuple(rays)
+
+    def _is_valid_position(self, pos: Tuple[int, int], board_size: int) -> bool:
+        """Check if a position is valid on the board."""
+        row, col = pos
+        return 0 <= row < board_size and 0 <= col < board_size
+
+    def _get_pawn_moves(self, pos, board_size):
+        moves = []
+        row, col = pos
+
+        # White pawns start at row board_size-2 and move up (decreasing row)
+        # Black pawns start at row 1 and move down (increasing row)
+        if self.color == 'White':
+            # White pawn moves
+            # One square forward (up)
+            if row > 0:  # Can't move up if at top
+                moves.append((row - 1, col))
+                # Two squares forward from starting position
+                if row == board_size - 2:  # Starting position
+                    moves.append((row - 2, col))
+            # Diagonal captures
+            if row > 0:  # Can't capture if at top
+                if col > 0:  # Can capture left
+                    moves.append((row - 1, col - 1))
+                if col < board_size - 1:  # Can capture right
+                    moves.append((row - 1, col + 1))
+        else:
+            # Black pawn moves
+            # One square forward (down)
+            if row < board_size - 1:  # Can't move down if at bottom
+                moves.append((row + 1, col))
+                # Two squares forward from starting position
+                if row == 1:  # Starting position
+                    moves.append((row + 2, col))
+            # Diagonal captures
+            if row < board_size - 1:  # Can't capture if at bottom
+                if col > 0:  # Can capture left
+                    moves.append((row + 1, col - 1))
+                if col < board_size - 1:  # Can capture right
+                    moves.append((row + 1, col + 1))
+
+        return moves
+
+
+class Ray(NamedTuple):
+    """A single compiled movement ray, expressed for a White piece.
+
+    can_jump is passed through to the move filters unchanged: True/False, or a
+    ('limited_jumping', limit), ('origin', id) or ('direction', id) tuple."""
+    row_step: int
+    col_step: int
+    max_steps: Optional[int]
+    can_jump: Union[bool, Tuple[str, int]]
+
+
+# Movement definitions for every piece type. Each entry is a list of
+# (patterns, max_steps, can_jump) components, where patterns holds
+# MOVEMENT_PATTERNS keys and/or explicit (row, col) offsets.
+PIECE_MOVEMENTS = {
+    # Standard chess pieces (Pawn is generated by Piece._get_pawn_moves)
+    'Knight': [(['KNIGHT'], 1, True)],
+    'Bishop': [(['DIAGONAL'], None, False)],
+    'Rook': [(['ORTHOGONAL'], None, False)],
+    'Queen': [(['KING'], None, False)],
+    'King': [(['KING'], 1, False)],
+
+    # Shogi pieces
+    'Gold_General': [(['ORTHOGONAL', 'FORWARD_DIAGONAL'], 1, False)],
+    'Silver_General': [(['FORWARD_AND_DIAGONAL', 'BACKWARD_DIAGONAL'], 1, False)],
+    'Shogi_Knight': [(['SHOGI_KNIGHT'], 1, True)],
+    'Lance': [(['FORWARD'], None, False)],
+    'Shogi_Pawn': [(['FORWARD'], 1, False)],
+    'Dragon_General': [(['ORTHOGONAL'], 1, False)],
+    'Horse_General': [
+        (['FORWARD'], 3, False),
+        (['FORWARD_DIAGONAL', 'BACKWARD'], 1, False),
+    ],
+
+    # Taikyoku pieces
+    'Angry_Boar': [
+        (['FORWARD_AND_SIDE'], 1, False),
+        (['FORWARD_DIAGONAL'], 2, False),
+    ],
+    'Running_Bear': [
+        (['SIDE'], 2, False),
+        (['FORWARD'], None, False),
+    ],
+    'Blind_Bear': [(['SIDE', 'DIAGONAL'], 1, False)],
+    'Beast_Cadet': [(['FORWARD_AND_SIDE', 'DIAGONAL'], 2, False)],
+    'Buddhist_Devil': [
+        (['BACKWARD_AND_SIDE'], 1, False),
+        (['FORWARD_DIAGONAL'], 3, False),
+    ],
+    'Bear_Soldier': [
+        (['BACKWARD'], 1, False),
+        (['SIDE'], 2, False),
+        (['FORWARD_DIAGONAL'], None, False),
+        (['FORWARD'], None, False),
+    ],
+    'Bishop_General': [(['DIAGONAL'], None, False)],
+    'Blind_Dog': [(['BACKWARD_AND_SIDE', 'FORWARD_DIAGONAL'], 1, False)],
+    'Blue_Dragon': [
+        (['FORWARD', 'BACKWARD', 'FORWARD_RIGHT_DIAGONAL'], None, False),
+        (['SIDE'], 2, False),
+    ],
+    'Blind_Monkey': [(['SIDE', 'DIAGONAL'], 1, False)],
+    'Burning_Soldier': [
+        (['BACKWARD'], 1, False),
+        (['SIDE'], 3, False),
+        (['FORWARD_DIAGONAL'], 5, False),
+        (['FORWARD'], 7, False),
+    ],
+    'Beast_Officer': [
+        (['FORWARD_AND_DIAGONAL'], 3, False),
+        (['SIDE'], 2, False),
+    ],
+    'Boar_Soldier': [
+        (['BACKWARD'], 1, False),
+        (['SIDE'], 2, False),
+        (['FORWARD_AND_DIAGONAL'], None, False),
+    ],
+    'Blind_Tiger': [(['BACKWARD', 'SIDE', 'DIAGONAL'], 1, False)],
+    'Copper_General': [(['FORWARD_AND_DIAGONAL', 'BACKWARD'], 1, False)],
+    'Capricorn': [
+        (['ORTHOGONAL'], 1, False),
+        (['DIAGONAL'], None, True),
+    ],
+    'Chinese_Rooster': [(['BACKWARD_AND_SIDE', 'FORWARD_DIAGONAL'], 1, False)],
+    'Ceramic_Dove': [
+        (['ORTHOGONAL'], 2, False),
+        (['DIAGONAL'], None, False),
+    ],
+    'Cloud_Eagle': [
+        (['FORWARD_AND_BACKWARD'], None, False),
+        (['FORWARD_DIAGONAL'], 3, False),
+        (['SIDE'], 1, False),
+    ],
+    'Chicken_General': [
+        (['BACKWARD_DIAGONAL'], 1, False),
+        (['FORWARD'], 4, False),
+    ],
+    'Chariot_Soldier': [
+        (['FORWARD', 'BACKWARD', 'DIAGONAL'], None, False),
+        (['SIDE'], 2, False),
+    ],
+    'Stone_Chariot': [
+        (['FORWARD', 'BACKWARD'], None, False),
+        (['SIDE'], 2, False),
+        (['FORWARD_DIAGONAL'], 1, False),
+    ],
+    'Flying_Rooster': [(['FORWARD_DIAGONAL', 'SIDE'], 1, False)],
+    'Cloud_Dragon': [
+        (['DIAGONAL', 'BACKWARD'], None, False),
+        (['FORWARD', 'SIDE'], 1, False),
+    ],
+    'Climbing_Monkey': [(['FORWARD_AND_DIAGONAL', 'BACKWARD'], 1, False)],
+    'Center_Standard': [
+        (['ORTHOGONAL'], None, False),
+        (['DIAGONAL'], 3, False),
+    ],
+    'Captive_Officer': [
+        (['FORWARD_AND_SIDE'], 2, False),
+        (['DIAGONAL'], 3, False),
+    ],
+    'Prince': [(['KING'], 1, False)],
+    'Copper_Chariot': [
+        (['FORWARD', 'BACKWARD'], None, False),
+        (['FORWARD_DIAGONAL'], 3, False),
+    ],
+    'Cat_Sword': [(['DIAGONAL'], 1, False)],
+    'Captive_Cadet': [(['FORWARD_AND_SIDE', 'DIAGONAL'], 3, False)],
+    'Dog': [(['FORWARD_AND_DIAGONAL'], 1, False)],
+    'Drunken_Elephant': [(['FORWARD_AND_SIDE', 'DIAGONAL'], 1, False)],
+    'Roaring_Dog': [
+        (['ORTHOGONAL', 'FORWARD_DIAGONAL'], None, False),
+        (['BACKWARD_DIAGONAL'], 3, False),
+        (['ROARING_DOG'], None, True),
+    ],
+    'Dragon_Horse': [
+        (['DIAGONAL'], None, False),
+        (['ORTHOGONAL'], 1, False),
+    ],
+    'Dragon_King': [
+        (['ORTHOGONAL'], None, False),
+        (['DIAGONAL'], 1, False),
+    ],
+    'Donkey': [(['ORTHOGONAL'], 2, False)],
+    'Fire_Demon': [
+        (['DIAGONAL', 'SIDE'], None, False),
+        (['FORWARD', 'BACKWARD'], 2, False),
+    ],
+    'Dark_Spirit': [(['ORTHOGONAL', 'BACKWARD_DIAGONAL', 'FORWARD_RIGHT_DIAGONAL'], 1, False)],
+    'Deva': [(['ORTHOGONAL', 'BACKWARD_DIAGONAL', 'FORWARD_LEFT_DIAGONAL'], 1, False)],
+    'Earth_General': [(['FORWARD', 'BACKWARD'], 1, False)],
+    'Enchanted_Badger': [(['ORTHOGONAL'], 2, False)],
+    'Earth_Chariot': [
+        (['FORWARD', 'BACKWARD'], None, False),
+        (['SIDE'], 1, False),
+    ],
+    'Earth_Dragon': [
+        (['FORWARD_DIAGONAL'], 2, False),
+        (['FORWARD'], 1, False),
+        (['BACKWARD_DIAGONAL'], None, False),
+    ],  # This piece is different in Japanese
+    'Fierce_Eagle': [
+        (['DIAGONAL'], 2, False),
+        (['FORWARD_AND_SIDE'], 1, False),
+    ],
+    'Soaring_Eagle': [
+        (['KING'], None, False),
+        (['FORWARD_DIAGONAL'], 2, True),
+    ],
+    'Eastern_Barbarian': [
+        (['FORWARD', 'BACKWARD'], 2, False),
+        (['SIDE', 'FORWARD_DIAGONAL'], 1, False),
+    ],
+    'Evil_Wolf': [(['FORWARD_AND_SIDE', 'FORWARD_DIAGONAL'], 1, False)],
+    'Fire_General': [
+        (['FORWARD_DIAGONAL'], 1, False),
+        (['FORWARD', 'BACKWARD'], 3, False),
+    ],
+    'Flying_Cat': [
+        (['FORWARD_AND_DIAGONAL'], 1, False),
+        (['FLYING_CAT'], 1, True),
+    ],
+    'Flying_Dragon': [
+        (['DIAGONAL'], 1, False),
+        (['KING'], 1, False),
+    ],
+    'Free_Eagle': [
+        (['KING'], None, False),
+        (['FREE_EAGLE'], 1, True),
+    ],
+    'Fragrant_Elephant': [(['KING'], 2, False)],
+    'Flying_Horse': [(['DIAGONAL'], 2, False)],
+    'Fire_Dragon': [
+        (['ORTHOGONAL'], None, False),
+        (['FORWARD_DIAGONAL'], 4, False),
+        (['BACKWARD_DIAGONAL'], 2, False),
+    ],
+    'Ferocious_Leopard': [(['FORWARD_AND_DIAGONAL', 'BACKWARD_AND_DIAGONAL'], 1, False)],
+    'Forest_Demon': [
+        (['FORWARD_DIAGONAL', 'BACKWARD'], None, False),
+        (['FORWARD_AND_SIDE'], 3, False),
+    ],
+    'Free_Pup': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD'], 1, False),
+        (['SIDE'], 2, False),
+        (['BACKWARD_DIAGONAL'], 1, False),
+    ],
+    'Free_Demon': [
+        (['DIAGONAL', 'RIGHT_SIDE'], 1, False),
+        (['BACKWARD'], 5, False),
+    ],  # Free Demon is different in Japanese
+    'Flying_Swallow': [
+        (['FORWARD_DIAGONAL'], None, False),
+        (['BACKWARD'], 1, False),
+    ],
+    'Free_Dream_Eater': [
+        (['DIAGONAL', 'FORWARD', 'BACKWARD'], None, False),
+        (['SIDE'], 5, False),
+    ],
+    'Flying_Goose': [(['FORWARD_AND_DIAGONAL', 'BACKWARD'], 1, False)],
+    'Go_Between': [(['FORWARD', 'BACKWARD'], 1, False)],
+    'Gold_Chariot': [
+        (['FORWARD', 'BACKWARD'], None, False),
+        (['SIDE'], 2, False),
+        (['DIAGONAL'], 1, False),
+    ],
+    'Great_Dragon': [
+        (['DIAGONAL'], None, False),
+        (['FORWARD', 'BACKWARD'], 3, False),
+    ],
+    'Great_Standard': [
+        (['ORTHOGONAL', 'FORWARD_DIAGONAL'], None, False),
+        (['BACKWARD_DIAGONAL'], 3, False),
+    ],
+    'Great_General': [(['KING'], None, False)],
+    'Golden_Deer': [
+        (['FORWARD_DIAGONAL'], None, False),
+        (['BACKWARD_DIAGONAL'], 2, False),
+    ],
+    'Great_Master': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD'], None, False),
+        (['SIDE', 'BACKWARD_DIAGONAL'], 5, False),
+        (['GREAT_MASTER'], 1, True),
+    ],
+    'Wood_General': [(['FORWARD_DIAGONAL'], 2, False)],
+    'Golden_Bird': [
+        (['FORWARD_DIAGONAL'], None, ('limited_jumping', 3)),
+        (['FORWARD_AND_BACKWARD'], None, False),
+        (['SIDE', 'BACKWARD_DIAGONAL'], 3, False),
+    ],
+    'Great_Dove': [
+        (['DIAGONAL'], None, False),
+        (['ORTHOGONAL'], 3, False),
+    ],
+    'Great_Stag': [
+        (['ORTHOGONAL'], None, False),
+        (['BACKWARD_DIAGONAL'], 2, False),
+        (['GREAT_STAG'], 1, True),
+    ],
+    'Great_Turtle': [
+        (['DIAGONAL', 'FORWARD_AND_BACKWARD'], None, False),
+        (['SIDE'], 3, False),
+        (['GREAT_TURTLE'], 1, True),
+    ],
+    'Guardian_Of_The_Gods': [(['ORTHOGONAL'], 3, False)],
+    'Howling_Dog': [
+        (['FORWARD'], None, False),
+        (['BACKWARD'], 1, False),
+    ],
+    'Rams_Head_Soldier': [
+        (['FORWARD_DIAGONAL'], None, False),
+        (['BACKWARD'], 1, False),
+    ],
+    'Horned_Falcon': [
+        (['KING'], None, False),
+        (['HORNED_FALCON'], 1, True),
+    ],
+    'Hook_Mover': [(['ORTHOGONAL'], None, True)],
+    'Horseman': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD'], None, False),
+        (['SIDE'], 2, False),
+    ],
+    'Running_Horse': [
+        (['FORWARD_AND_DIAGONAL'], None, False),
+        (['BACKWARD'], 1, False),
+        (['RUNNING_HORSE'], 1, True),
+    ],
+    'Horse_Soldier': [
+        (['FORWARD_AND_DIAGONAL'], None, False),
+        (['SIDE'], 3, False),
+        (['BACKWARD'], 1, False),
+    ],
+    'Iron_General': [(['FORWARD_AND_DIAGONAL'], 1, False)],
+    'Shogi_King': [(['KING'], 2, False)],
+    'Kirin_Master': [
+        (['DIAGONAL', 'FORWARD_AND_BACKWARD'], None, False),
+        (['SIDE'], 3, False),
+        (['GREAT_TURTLE'], 1, True),
+    ],
+    'Kirin': [
+        (['DIAGONAL'], 1, False),
+        (['KIRIN'], 1, True),
+    ],
+    'Longbow_Soldier': [
+        (['FORWARD'], None, False),
+        (['FORWARD_DIAGONAL'], 3, False),
+        (['BACKWARD'], 1, False),
+        (['SIDE'], 2, False),
+    ],
+    'Left_Chariot': [
+        (['FORWARD', 'FORWARD_LEFT_DIAGONAL', 'BACKWARD_RIGHT_DIAGONAL'], None, False),
+        (['LEFT_SIDE'], 1, False),
+    ],
+    'Lion_Dog': [
+        (['KING'], None, False),
+        (['LION_DOG'], 1, True),
+    ],
+    'Left_Dragon': [
+        (['RIGHT_SIDE', 'FORWARD_RIGHT_DIAGONAL', 'BACKWARD_RIGHT_DIAGONAL'], None, False),
+        (['LEFT_SIDE'], 2, False),
+    ],
+    'Left_General': [(['KING'], 1, False)],
+    'Liberated_Horse': [
+        (['FORWARD'], None, False),
+        (['BACKWARD'], 2, False),
+        (['SIDE'], 1, False),
+    ],
+    'Lion_Hawk': [
+        (['KING'], 2, True),
+        (['KNIGHT'], 1, True),
+        (['DIAGONAL'], None, True),
+        (['FLYING_DRAGON'], 1, True),
+    ],
+    'Little_Turtle': [
+        (['DIAGONAL', 'FORWARD_AND_BACKWARD'], None, False),
+        (['SIDE'], 2, False),
+        (['KIRIN'], 1, True),
+    ],
+    'Lion': [
+        (['KING'], 2, True),
+        (['KNIGHT'], 1, True),
+    ],
+    'Long_Nosed_Goblin': [(['DIAGONAL'], None, True)],
+    'Leopard_Soldier': [
+        (['FORWARD_AND_DIAGONAL'], None, False),
+        (['BACKWARD'], 1, False),
+        (['SIDE'], 2, False),
+    ],
+    'Little_Standard': [
+        (['ORTHOGONAL'], None, False),
+        (['FORWARD_DIAGONAL'], 2, False),
+        (['BACKWARD_DIAGONAL'], 1, False),
+    ],
+    'Left_Tiger': [
+        (['RIGHT_SIDE', 'FORWARD_RIGHT_DIAGONAL', 'BACKWARD_RIGHT_DIAGONAL'], None, False),
+        (['FORWARD_LEFT_DIAGONAL', 'BACKWARD_LEFT_DIAGONAL'], 1, False),
+    ],
+    'Mountain_General': [
+        (['FORWARD_DIAGONAL'], 3, False),
+        (['FORWARD', 'BACKWARD'], 1, False),
+    ],
+    'Mountain_Falcon': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD', 'SIDE'], None, False),
+        (['HORNED_FALCON'], 1, True),
+    ],
+    'Side_Monkey': [
+        (['SIDE'], None, False),
+        (['FORWARD_DIAGONAL', 'BACKWARD'], 1, False),
+    ],
+    'Left_Mountain_Eagle': [
+        (['ORTHOGONAL', 'FORWARD_DIAGONAL', 'BACKWARD_LEFT_DIAGONAL'], None, False),
+        (['BACKWARD_RIGHT_DIAGONAL'], 2, False),
+        (['LEFT_MOUNTAIN_EAGLE'], 1, True),
+    ],
+    'Right_Mountain_Eagle': [
+        (['ORTHOGONAL', 'FORWARD_DIAGONAL', 'BACKWARD_RIGHT_DIAGONAL'], None, False),
+        (['BACKWARD_LEFT_DIAGONAL'], 2, False),
+        (['RIGHT_MOUNTAIN_EAGLE'], 1, True),
+    ],
+    'Mountain_Stag': [
+        (['FORWARD_DIAGONAL'], 3, False),
+        (['FORWARD'], 1, False),
+        (['BACKWARD'], 4, False),
+        (['SIDE'], 2, False),
+    ],
+    'Center_Master': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD'], None, False),
+        (['SIDE', 'BACKWARD_DIAGONAL'], 3, False),
+        (['CENTER_MASTER'], 1, True),
+    ],
+    'Northern_Barbarian': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD'], 1, False),
+        (['SIDE'], 2, False),
+    ],
+    'Neighboring_King': [(['DIAGONAL', 'FORWARD_AND_SIDE'], 1, False)],
+    'Violent_Wolf': [(['FORWARD_AND_DIAGONAL', 'BACKWARD', 'SIDE'], 1, False)],
+    'Ox_General': [
+        (['FORWARD_DIAGONAL', 'BACKWARD'], 1, False),
+        (['FORWARD'], 3, False),
+    ],
+    'Oxcart': [(['FORWARD'], None, False)],
+    'Old_Kite': [
+        (['FORWARD_DIAGONAL', 'BACKWARD_DIAGONAL'], 2, False),
+        (['SIDE'], 1, False),
+    ],
+    'Old_Monkey': [(['FORWARD_DIAGONAL', 'BACKWARD_AND_DIAGONAL'], 1, False)],
+    'Old_Rat': [(['FORWARD', 'BACKWARD_AND_DIAGONAL'], 1, False)],
+    'Ox_Soldier': [
+        (['FORWARD_AND_DIAGONAL'], None, False),
+        (['BACKWARD'], 1, False),
+        (['SIDE'], 3, False),
+    ],
+    'Swooping_Owl': [(['FORWARD', 'BACKWARD_DIAGONAL'], 1, False)],
+    'Flying_Ox': [(['FORWARD_AND_DIAGONAL', 'BACKWARD_AND_DIAGONAL'], None, False)],
+    'Peacock': [
+        (['BACKWARD_DIAGONAL'], 2, False),
+        (['FORWARD_DIAGONAL'], None, True),
+    ],
+    'Pup_General': [
+        (['BACKWARD_DIAGONAL'], 1, False),
+        (['FORWARD'], 4, False),
+    ],
+    'Phoenix': [
+        (['ORTHOGONAL'], 1, False),
+        (['FLYING_DRAGON'], 1, True),
+    ],
+    'Pig_General': [
+        (['FORWARD_DIAGONAL'], 4, False),
+        (['BACKWARD'], 2, False),
+    ],
+    'Phoenix_Master': [
+        (['DIAGONAL', 'FORWARD_AND_BACKWARD'], None, False),
+        (['SIDE'], 3, False),
+        (['PHOENIX_MASTER'], 1, True),
+    ],
+    'Prancing_Stag': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD'], None, False),
+        (['SIDE'], 2, False),
+    ],
+    'Poisonous_Snake': [
+        (['FORWARD_AND_SIDE'], 2, False),
+        (['FORWARD_DIAGONAL', 'BACKWARD'], 1, False),
+    ],
+    'Rain_Dragon': [
+        (['FORWARD_AND_DIAGONAL'], 1, False),
+        (['SIDE', 'BACKWARD_AND_DIAGONAL'], None, False),
+    ],
+    'Rushing_Bird': [
+        (['FORWARD'], 2, False),
+        (['DIAGONAL', 'SIDE'], 1, False),
+    ],
+    'Right_Chariot': [
+        (['FORWARD', 'FORWARD_RIGHT_DIAGONAL', 'BACKWARD_LEFT_DIAGONAL'], None, False),
+        (['RIGHT_SIDE'], 1, False),
+    ],
+    'Reclining_Dragon': [(['ORTHOGONAL'], 1, False)],
+    'River_General': [
+        (['FORWARD'], 3, False),
+        (['FORWARD_DIAGONAL', 'BACKWARD'], 1, False),
+    ],
+    'Right_General': [(['KING'], 1, False)],
+    'Running_Chariot': [(['ORTHOGONAL'], None, False)],
+    'Right_Dragon': [
+        (['FORWARD_LEFT_DIAGONAL', 'LEFT_SIDE', 'BACKWARD_LEFT_DIAGONAL'], None, False),
+        (['RIGHT_SIDE'], 2, False),
+    ],
+    'Roc_Master': [
+        ([(-3, -3)], 1, ('origin', 1)),
+        ([(-3, 3)], 1, ('origin', 2)),
+        (['FORWARD_LEFT_DIAGONAL'], None, ('direction', 1)),
+        (['FORWARD_RIGHT_DIAGONAL'], None, ('direction', 2)),
+        (['FORWARD_AND_BACKWARD'], None, False),
+        (['SIDE', 'BACKWARD_DIAGONAL'], 5, False),
+    ],
+    'Running_Stag': [
+        (['FORWARD_DIAGONAL', 'SIDE'], 1, False),
+        (['BACKWARD'], 2, False),
+    ],
+    'Rook_General': [(['ORTHOGONAL'], None, True)],
+    'Running_Pup': [
+        (['FORWARD', 'BACKWARD'], None, False),
+        (['SIDE'], 1, False),
+    ],
+    'Running_Rabbit': [
+        (['FORWARD_AND_DIAGONAL'], None, False),
+        (['BACKWARD_AND_DIAGONAL'], 1, False),
+    ],
+    'Rear_Standard': [
+        (['ORTHOGONAL'], None, False),
+        (['DIAGONAL'], 2, False),
+    ],
+    'Running_Tiger': [
+        (['FORWARD', 'BACKWARD'], None, False),
+        (['SIDE'], 2, False),
+    ],
+    'Running_Serpent': [
+        (['FORWARD', 'BACKWARD'], None, False),
+        (['SIDE'], 1, False),
+    ],
+    'Reverse_Chariot': [(['FORWARD', 'BACKWARD'], None, False)],
+    'Running_Wolf': [
+        (['FORWARD_DIAGONAL', 'SIDE'], 1, False),
+        (['FORWARD'], 1, False),
+    ],
+    'Side_Boar': [
+        (['SIDE'], None, False),
+        (['FORWARD_DIAGONAL', 'BACKWARD_DIAGONAL'], 1, False),
+    ],
+    'Crossbow_Soldier': [
+        (['FORWARD'], 5, False),
+        (['FORWARD_DIAGONAL', 'SIDE'], 3, False),
+        (['BACKWARD'], 1, False),
+    ],
+    'Front_Standard': [
+        (['ORTHOGONAL'], None, False),
+        (['FORWARD_DIAGONAL', 'BACKWARD_DIAGONAL'], 3, False),
+    ],
+    'Sword_Soldier': [(['FORWARD_DIAGONAL', 'BACKWARD'], None, False)],
+    'Side_Flyer': [
+        (['SIDE'], None, False),
+        (['FORWARD_DIAGONAL', 'BACKWARD_DIAGONAL'], 1, False),
+    ],
+    'Stone_General': [(['FORWARD_DIAGONAL'], 1, False)],
+    'Side_Dragon': [(['FORWARD', 'SIDE'], None, False)],
+    'Side_Soldier': [
+        (['SIDE'], None, False),
+        (['FORWARD'], 2, False),
+        (['BACKWARD'], 1, False),
+    ],
+    'Side_Mover': [
+        (['SIDE'], None, False),
+        (['FORWARD', 'BACKWARD'], 1, False),
+    ],
+    'Coiled_Serpent': [(['FORWARD', 'BACKWARD_AND_DIAGONAL'], None, False)],
+    'Soldier': [(['ORTHOGONAL'], None, False)],
+    'Spear_Soldier': [
+        (['FORWARD'], None, False),
+        (['SIDE', 'BACKWARD'], 1, False),
+    ],
+    'Square_Mover': [(['ORTHOGONAL'], None, False)],
+    'Silver_Rabbit': [
+        (['FORWARD_DIAGONAL'], 2, False),
+        (['BACKWARD_DIAGONAL'], None, False),
+    ],
+    'Side_Serpent': [
+        (['SIDE'], None, False),
+        (['FORWARD'], 3, False),
+        (['BACKWARD'], 1, False),
+    ],
+    'Strutting_Crow': [(['FORWARD', 'BACKWARD_DIAGONAL'], 1, False)],
+    'Southern_Barbarian': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD'], 1, False),
+        (['SIDE'], 2, False),
+    ],
+    'Silver_Chariot': [
+        (['FORWARD', 'BACKWARD'], None, False),
+        (['FORWARD_DIAGONAL'], 2, False),
+        (['BACKWARD_DIAGONAL'], 1, False),
+    ],
+    'Swallows_Wings': [
+        (['SIDE'], None, False),
+        (['FORWARD_DIAGONAL', 'BACKWARD'], 1, False),
+    ],
+    'Side_Ox': [
+        (['SIDE'], None, False),
+        (['FORWARD_RIGHT_DIAGONAL', 'BACKWARD_LEFT_DIAGONAL'], 1, False),
+    ],
+    'Tile_General': [(['FORWARD_DIAGONAL', 'BACKWARD'], 1, False)],
+    'Tile_Chariot': [
+        (['FORWARD', 'BACKWARD'], None, False),
+        (['FORWARD_RIGHT_DIAGONAL', 'BACKWARD_LEFT_DIAGONAL'], 1, False),
+    ],
+    'Turtle_Dove': [
+        (['FORWARD_DIAGONAL'], 5, False),
+        (['BACKWARD_AND_SIDE'], 1, False),
+    ],
+    'Treacherous_Fox': [(['FORWARD_AND_DIAGONAL', 'BACKWARD_AND_DIAGONAL'], None, False)],
+    'Savage_Tiger': [(['FORWARD'], None, False)],
+    'Turtle_Snake': [
+        (['FORWARD_RIGHT_DIAGONAL', 'BACKWARD_LEFT_DIAGONAL'], None, False),
+        (['FORWARD', 'FORWARD_LEFT_DIAGONAL', 'BACKWARD', 'BACKWARD_RIGHT_DIAGONAL', 'SIDE'], 1, False),
+    ],
+    'Right_Tiger': [
+        (['FORWARD_LEFT_DIAGONAL', 'LEFT_SIDE', 'BACKWARD_LEFT_DIAGONAL'], None, False),
+        (['FORWARD_RIGHT_DIAGONAL', 'BACKWARD_RIGHT_DIAGONAL'], 1, False),
+    ],
+    'Violent_Bear': [
+        (['FORWARD_DIAGONAL'], 2, False),
+        (['FORWARD_AND_SIDE'], 1, False),
+    ],
+    'Violent_Dragon': [
+        (['DIAGONAL'], None, True),
+        (['ORTHOGONAL'], 2, False),
+    ],
+    'Vertical_Bear': [
+        (['FORWARD'], None, False),
+        (['BACKWARD'], 1, False),
+        (['SIDE'], 2, False),
+    ],
+    'Vice_General': [
+        (['DIAGONAL'], None, True),
+        (['VICE_GENERAL'], 1, True),
+    ],
+    'Vertical_Horse': [
+        (['FORWARD'], None, False),
+        (['BACKWARD', 'FORWARD_DIAGONAL'], 1, False),
+    ],
+    'Vermilion_Sparrow': [
+        (['FORWARD_LEFT_DIAGONAL', 'BACKWARD_RIGHT_DIAGONAL'], None, False),
+        (['ORTHOGONAL', 'FORWARD_RIGHT_DIAGONAL', 'BACKWARD_LEFT_DIAGONAL'], 1, False),
+    ],
+    'Vertical_Leopard': [
+        (['FORWARD'], None, False),
+        (['BACKWARD', 'SIDE', 'FORWARD_DIAGONAL'], 1, False),
+    ],
+    'Vertical_Mover': [
+        (['FORWARD', 'BACKWARD'], None, False),
+        (['SIDE'], 1, False),
+    ],
+    'Violent_Ox': [
+        (['FORWARD_DIAGONAL'], None, False),
+        (['BACKWARD', 'FORWARD'], 1, False),
+    ],
+    'Vertical_Pup': [
+        (['FORWARD'], None, False),
+        (['BACKWARD_AND_DIAGONAL'], 1, False),
+    ],
+    'Vertical_Soldier': [
+        (['FORWARD'], None, False),
+        (['BACKWARD'], 1, False),
+        (['SIDE'], 2, False),
+    ],
+    'Violent_Stag': [(['FORWARD_AND_DIAGONAL', 'BACKWARD_DIAGONAL'], None, False)],
+    'Vertical_Tiger': [
+        (['FORWARD'], None, False),
+        (['BACKWARD'], 2, False),
+    ],
+    'Vertical_Wolf': [
+        (['FORWARD'], None, False),
+        (['BACKWARD'], 3, False),
+        (['SIDE'], 1, False),
+    ],
+    'Whale': [(['FORWARD', 'BACKWARD_AND_DIAGONAL'], None, False)],
+    'Water_Dragon': [
+        (['ORTHOGONAL'], None, False),
+        (['FORWARD_DIAGONAL'], 2, False),
+        (['BACKWARD_DIAGONAL'], 4, False),
+    ],
+    'Water_Buffalo': [
+        (['DIAGONAL', 'SIDE'], None, False),
+        (['FORWARD', 'BACKWARD'], 2, False),
+    ],
+    'Wood_Chariot': [
+        (['FORWARD', 'BACKWARD'], None, False),
+        (['FORWARD_LEFT_DIAGONAL', 'BACKWARD_RIGHT_DIAGONAL'], 1, False),
+    ],
+    'Wind_Dragon': [
+        (['SIDE', 'FORWARD_DIAGONAL', 'BACKWARD_RIGHT_DIAGONAL'], None, False),
+        (['BACKWARD_LEFT_DIAGONAL'], 1, False),
+    ],
+    'White_Elephant': [(['KING'], 2, False)],
+    'Side_Wolf': [
+        (['SIDE'], None, False),
+        (['FORWARD_LEFT_DIAGONAL', 'BACKWARD_RIGHT_DIAGONAL'], 1, False),
+    ],
+    'Water_General': [
+        (['FORWARD', 'BACKWARD'], None, False),
+        (['FORWARD_DIAGONAL'], 3, False),
+    ],
+    'White_Horse': [(['FORWARD_AND_DIAGONAL', 'BACKWARD'], None, False)],
+    'Woodland_Demon': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD'], None, False),
+        (['SIDE'], 2, False),
+    ],
+    'Wind_General': [
+        (['FORWARD'], 3, False),
+        (['BACKWARD', 'FORWARD_DIAGONAL'], 1, False),
+    ],
+    'Wooden_Dove': [
+        (['DIAGONAL'], None, False),
+        (['ORTHOGONAL'], 2, False),
+        (['WOODEN_DOVE'], 1, True),
+    ],
+    'Wrestler': [(['DIAGONAL'], 3, False)],
+    'Western_Barbarian': [
+        (['FORWARD', 'BACKWARD'], 2, False),
+        (['SIDE', 'FORWARD_DIAGONAL'], 1, False),
+    ],
+    'White_Tiger': [
+        (['SIDE', 'FORWARD_LEFT_DIAGONAL'], None, False),
+        (['FORWARD', 'BACKWARD'], 2, False),
+    ],
+    'Yaksha': [
+        (['SIDE'], 3, False),
+        (['FORWARD_DIAGONAL', 'BACKWARD'], 1, False),
+    ],
+    'Right_Army': [
+        (['FORWARD_RIGHT_DIAGONAL', 'BACKWARD_RIGHT_DIAGONAL', 'RIGHT_SIDE'], None, False),
+        (['FORWARD_AND_BACKWARD', 'FORWARD_LEFT_DIAGONAL', 'LEFT_SIDE', 'BACKWARD_LEFT_DIAGONAL'], 1, False),
+    ],
+    'Left_Army': [
+        (['FORWARD_LEFT_DIAGONAL', 'BACKWARD_LEFT_DIAGONAL', 'LEFT_SIDE'], None, False),
+        (['FORWARD_AND_BACKWARD', 'FORWARD_RIGHT_DIAGONAL', 'RIGHT_SIDE', 'BACKWARD_RIGHT_DIAGONAL'], 1, False),
+    ],
+    'Free_Fire': [
+        (['FORWARD_DIAGONAL', 'BACKWARD_DIAGONAL', 'SIDE'], None, False),
+        (['FORWARD_AND_BACKWARD'], 5, False),
+    ],
+    'Great_Whale': [(['FORWARD_AND_DIAGONAL', 'BACKWARD_AND_DIAGONAL'], None, False)],
+    'Divine_Tiger': [
+        (['FORWARD', 'SIDE', 'FORWARD_LEFT_DIAGONAL'], None, False),
+        (['BACKWARD'], 2, False),
+    ],
+    'Divine_Turtle': [
+        (['FORWARD_RIGHT_DIAGONAL', 'BACKWARD_DIAGONAL'], None, False),
+        (['ORTHOGONAL', 'FORWARD_LEFT_DIAGONAL'], 1, False),
+    ],
+    'Elephant_King': [
+        (['DIAGONAL'], None, False),
+        (['ORTHOGONAL'], 2, False),
+    ],
+    'Captive_Bird': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD_DIAGONAL'], None, False),
+        (['SIDE'], 3, False),
+        (['BACKWARD'], 2, False),
+    ],
+    'Thunder_Runner': [
+        (['FORWARD_AND_DIAGONAL'], None, False),
+        (['BACKWARD_AND_SIDE'], 4, False),
+    ],
+    'Free_Leopard': [(['FORWARD_AND_DIAGONAL', 'BACKWARD_AND_DIAGONAL'], None, False)],
+    'Free_Serpent': [(['FORWARD', 'BACKWARD_AND_DIAGONAL'], None, False)],
+    'Free_Tiger': [(['FORWARD_DIAGONAL', 'BACKWARD_AND_DIAGONAL', 'SIDE'], None, False)],
+    'Free_Bear': [(['FORWARD_AND_DIAGONAL', 'BACKWARD_AND_DIAGONAL'], None, False)],
+    'Heavenly_Tetrarch': [(['KING'], 4, False)],
+    'Playful_Cockatoo': [
+        (['FORWARD_AND_BACKWARD'], None, False),
+        (['FORWARD_DIAGONAL'], 3, False),
+        (['BACKWARD_DIAGONAL'], 2, False),
+        (['SIDE'], 5, False),
+    ],
+    'Running_Dragon': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD_DIAGONAL', 'SIDE'], None, False),
+        (['BACKWARD'], 5, False),
+    ],
+    'Free_Stag': [(['KING'], None, False)],
+    'Free_Wolf': [(['FORWARD_AND_DIAGONAL', 'SIDE'], None, False)],
+    'Rain_Demon': [
+        (['FORWARD_DIAGONAL'], None, True),
+        (['FORWARD'], 3, False),
+        (['BACKWARD'], None, False),
+        (['SIDE'], 2, False),
+    ],
+    'Flying_Crocodile': [
+        (['ORTHOGONAL'], None, False),
+        (['FORWARD_DIAGONAL'], 3, False),
+        (['BACKWARD_DIAGONAL'], 2, False),
+    ],
+    'Beast_Bird': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD_DIAGONAL'], None, False),
+        (['BACKWARD'], 2, False),
+        (['SIDE'], 3, False),
+    ],
+    'Free_Dragon': [(['FORWARD_DIAGONAL', 'BACKWARD_AND_DIAGONAL', 'SIDE'], None, False)],
+    'Free_Dog': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD'], None, False),
+        (['SIDE', 'BACKWARD_DIAGONAL'], 2, False),
+    ],
+    'Goose_Wing': [
+        (['FORWARD_AND_BACKWARD'], None, False),
+        (['DIAGONAL'], 1, False),
+        (['SIDE'], 3, False),
+    ],
+    'Free_Pig': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD'], None, False),
+        (['SIDE'], 2, False),
+        (['BACKWARD_DIAGONAL'], 1, False),
+    ],
+    'Free_Chicken': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD'], None, False),
+        (['SIDE'], 2, False),
+    ],
+    'Free_Horse': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD'], None, False),
+        (['SIDE'], 2, False),
+        (['BACKWARD_DIAGONAL'], 1, False),
+    ],
+    'Free_Ox': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD'], None, False),
+        (['SIDE'], 2, False),
+        (['BACKWARD_DIAGONAL'], 1, False),
+    ],
+    'Free_Boar': [
+        (['FORWARD_AND_DIAGONAL', 'SIDE'], None, False),
+        (['BACKWARD'], 1, False),
+    ],
+    'Furious_Fiend': [
+        (['KING'], 2, True),
+        (['KNIGHT'], 1, True),
+        (['KING'], 3, False),
+    ],
+    'Free_Bird': [
+        (['FORWARD_DIAGONAL'], None, ('limited_jumping', 3)),
+        (['ORTHOGONAL'], None, False),
+        (['BACKWARD_DIAGONAL'], 3, False),
+    ],
+    'Right_Phoenix': [
+        (['DIAGONAL'], None, False),
+        (['SIDE'], 5, False),
+    ],
+    'Walking_Heron': [
+        (['FORWARD_AND_BACKWARD'], None, False),
+        (['FORWARD_DIAGONAL', 'SIDE'], 1, False),
+    ],
+    'Strong_Eagle': [(['KING'], None, False)],
+    'Copper_Elephant': [
+        (['FORWARD_AND_BACKWARD'], None, False),
+        (['FORWARD_DIAGONAL', 'BACKWARD_DIAGONAL', 'SIDE'], 1, False),
+    ],
+    'Burning_Chariot': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD'], None, False),
+        (['SIDE'], 1, False),
+    ],
+    'Tiger_Soldier': [
+        (['FORWARD_DIAGONAL'], None, False),
+        (['FORWARD'], 2, False),
+        (['BACKWARD'], 1, False),
+    ],
+    'Ancient_Dragon': [
+        (['FORWARD_AND_BACKWARD'], None, True),
+        (['DIAGONAL'], None, False),
+    ],
+    'Buddhist_Spirit': [
+        (['KING'], 2, True),
+        (['KNIGHT'], 1, True),
+        (['KING'], None, False),
+    ],
+    'Teaching_King': [(['KING'], None, ('limited_jumping', 3))],
+    'Wind_Snapping_Turtle': [
+        (['FORWARD_AND_BACKWARD'], None, False),
+        (['FORWARD_DIAGONAL'], 2, False),
+    ],
+    'Great_Horse': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD'], None, False),
+        (['SIDE'], 2, False),
+    ],
+    'Left_Dog': [
+        (['FORWARD', 'BACKWARD_RIGHT_DIAGONAL'], None, False),
+        (['BACKWARD'], 1, False),
+    ],
+    'Right_Dog': [
+        (['FORWARD', 'BACKWARD_LEFT_DIAGONAL'], None, False),
+        (['BACKWARD'], 1, False),
+    ],
+    'Great_Dream_Eater': [
+        (['KING'], None, False),
+        (['DREAM_EATER'], 1, True),
+    ],
+    'Flying_Falcon': [
+        (['DIAGONAL'], None, False),
+        (['FORWARD'], 1, False),
+    ],
+    'Treasure_Turtle': [
+        (['KING'], None, False),
+        (['VICE_GENERAL'], 1, True),
+    ],
+    'Spirit_Turtle': [
+        (['FORWARD', 'BACKWARD'], None, False),
+        (['SPIRIT_TURTLE'], 1, False),
+    ],
+    'Running_Tile': [
+        (['FORWARD_AND_BACKWARD'], None, False),
+        (['SIDE'], 2, False),
+    ],
+    'Great_Bear': [
+        (['FORWARD_AND_DIAGONAL'], None, False),
+        (['SIDE', 'BACKWARD'], 1, False),
+    ],
+    'Venomous_Wolf': [(['KING'], 1, False)],
+    'Heavenly_Horse': [
+        (['FORWARD'], None, False),
+        (['HEAVENLY_HORSE'], 1, True),
+    ],
+    'Raiding_Falcon': [
+        (['FORWARD'], None, False),
+        (['FORWARD_DIAGONAL', 'SIDE'], 1, False),
+    ],
+    'Mountain_Witch': [(['BACKWARD_AND_DIAGONAL'], None, False)],
+    'Wizard_Stork': [(['FORWARD_DIAGONAL', 'SIDE', 'BACKWARD'], None, False)],
+    'Rushing_Boar': [(['FORWARD', 'DIAGONAL', 'SIDE'], 1, False)],
+    'Bears_Eyes': [(['KING'], 1, False)],
+    'Mountain_Crane': [
+        (['KING'], None, False),
+        (['LION_DOG'], 1, True),
+    ],
+    'Young_Bird': [
+        (['FORWARD_AND_BACKWARD'], None, False),
+        (['SIDE', 'BACKWARD_DIAGONAL'], 1, False),
+    ],
+    'Divine_Sparrow': [
+        (['FORWARD_LEFT_DIAGONAL', 'BACKWARD_LEFT_DIAGONAL'], None, False),
+        (['ORTHOGONAL'], 1, False),
+    ],
+    'Divine_Dragon': [
+        (['FORWARD_AND_BACKWARD', 'RIGHT_SIDE', 'FORWARD_RIGHT_DIAGONAL'], None, False),
+        (['LEFT_SIDE'], 2, False),
+    ],
+    'Cavalier': [(['FORWARD_DIAGONAL', 'ORTHOGONAL'], None, False)],
+    'Gliding_Sparrow': [(['ORTHOGONAL'], None, False)],
+    'Flying_Stag': [
+        (['FORWARD_AND_BACKWARD'], None, False),
+        (['DIAGONAL', 'SIDE'], 1, False),
+    ],
+    'Plooding_Ox': [
+        (['FORWARD_AND_BACKWARD'], None, False),
+        (['DIAGONAL'], 1, False),
+    ],
+    'Bird_of_Paradise': [(['FORWARD_AND_DIAGONAL', 'BACKWARD'], None, False)],
+    'Strong_Chariot': [(['FORWARD_AND_DIAGONAL', 'BACKWARD', 'SIDE'], None, False)],
+    'Coiled_Dragon': [(['FORWARD', 'BACKWARD_AND_DIAGONAL'], None, False)],
+    'Heavenly_Tetrarch_King': [
+        (['KING'], None, False),
+        (['HEAVENLY_TETRARCH'], 1, True),
+    ],
+    'Violent_Wind': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD_AND_DIAGONAL'], None, False),
+        (['SIDE'], 1, False),
+    ],
+    'Chinese_River': [
+        (['DIAGONAL', 'SIDE'], None, False),
+        (['FORWARD_AND_BACKWARD'], 1, False),
+    ],
+    'Peaceful_Mountain': [
+        (['DIAGONAL'], None, False),
+        (['FORWARD_AND_SIDE'], 5, False),
+    ],
+    'Running_Ox': [
+        (['FORWARD_AND_DIAGONAL', 'SIDE'], None, False),
+        (['BACKWARD_DIAGONAL'], 2, False),
+    ],
+    'Running_Boar': [
+        (['FORWARD_AND_BACKWARD'], None, False),
+        (['SIDE'], 1, False),
+    ],
+    'Running_Leopard': [(['FORWARD_AND_DIAGONAL', 'SIDE'], None, False)],
+    'Strong_Bear': [
+        (['FORWARD_AND_SIDE', 'DIAGONAL'], None, False),
+        (['BACKWARD'], 2, False),
+    ],
+    'Right_Iron_Chariot': [
+        (['BACKWARD_LEFT_DIAGONAL'], None, False),
+        (['ORTHOGONAL'], 1, False),
+    ],
+    'Left_Iron_Chariot': [
+        (['BACKWARD_RIGHT_DIAGONAL'], None, False),
+        (['ORTHOGONAL'], 1, False),
+    ],
+    'Fire_Ox': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD_AND_DIAGONAL'], None, False),
+        (['SIDE'], 1, False),
+    ],
+    'Longbow_General': [
+        (['FORWARD_AND_DIAGONAL', 'BACKWARD'], None, False),
+        (['SIDE'], 5, False),
+    ],
+    'Leopard_King': [(['KING'], 5, False)],
+    'Burning_General': [
+        (['FORWARD_AND_DIAGONAL'], None, False),
+        (['SIDE'], 3, False),
+        (['BACKWARD'], 2, False),
+    ],
+    'Sword_General': [
+        (['FORWARD_AND_DIAGONAL'], 3, False),
+        (['BACKWARD'], 1, False),
+    ],
+    'Great_Falcon': [
+        (['KING'], None, False),
+        (['GREAT_FALCON'], 1, True),
+    ],
+    'Great_Eagle': [
+        (['KING'], None, False),
+        (['HEAVENLY_TETRARCH'], 1, True),
+    ],
+    'Spear_General': [
+        (['FORWARD'], None, False),
+        (['SIDE'], 3, False),
+        (['BACKWARD'], 2, False),
+    ],
+    'Great_Leopard': [
+        (['FORWARD'], None, False),
+        (['FORWARD_DIAGONAL'], 3, False),
+        (['SIDE'], 2, False),
+        (['BACKWARD'], 1, False),
+    ],
+    'Great_Tiger': [
+        (['FORWARD'], 1, False),
+        (['FORWARD_AND_SIDE'], None, False),
+    ],
+    'Crossbow_General': [
+        (['FORWARD'], None, False),
+        (['FORWARD_DIAGONAL'], 5, False),
+        (['SIDE'], 3, False),
+        (['BACKWARD'], 2, False),
+    ],
+    'Great_Elephant': [
+        (['ORTHOGONAL', 'BACKWARD_DIAGONAL'], None, ('limited_jumping', 3)),
+        (['FORWARD_DIAGONAL'], 3, False),
+    ],
+    'Multi_General': [(['FORWARD_AND_DIAGONAL', 'BACKWARD'], None, False)],
+}
+
+def compile_movement(piece_type: str, components) -> Tuple[Ray, ...]:
+    """Compile the movement components of a piece type into a tuple of rays.
+    Raises ValueError for unknown pattern keys or malformed components."""
+    rays = []
+    for patterns, max_steps, can_jump in components:
+        if max_steps is not None and max_steps < 1:
+            raise ValueError(f"{piece_type}: max_steps must be positive, got {max_steps}")
+        if not (isinstance(can_jump, bool) or
+                (isinstance(can_jump, tuple) and len(can_jump) == 2 and
+                 can_jump[0] in ('limited_jumping', 'origin', 'direction'))):
+            raise ValueError(f"{piece_type}: invalid jump flag {can_jump!r}")
+        for pattern in patterns:
+            if isinstance(pattern, str):
+                if pattern not in MOVEMENT_PATTERNS:
+                    raise ValueError(f"{piece_type}: unknown movement pattern '{pattern}'")
+                offsets = MOVEMENT_PATTERNS[pattern]
+            else:
+                offsets = [pattern]
+            for row_step, col_step in offsets:
+                rays.append(Ray(row_step, col_step, max_steps, can_jump))
+    return tuple(rays)
+
+
+# Compiled, read-only movement specs keyed by piece type
+PIECE_SPECS = MappingProxyType({
+    piece_type: compile_movement(piece_type, components)
+    for piece_type, components in PIECE_MOVEMENTS.items()
+})
+
+
+# Memory budget of the cached rays. An entry is estimated to cost these many bytes per
+# target square, per ray and for itself (key and cache slot), fitted with tracemalloc.
+RAY_TABLE_MAX_BYTES = 64 * 1024 * 1024
+RAY_SQUARE_BYTES = 72
+RAY_BYTES = 108
+RAY_ENTRY_BYTES = 290
+
+
+class RayTableCache:
+    """LRU cache of empty-board rays keyed on (piece_type, color, board_size, square).
+
+    Each entry holds the rays a piece reaches from one square on an empty
+    board. Entries are filled in lazily and evicted one at a time, least
+    recently used first, once their estimated size exceeds max_bytes. A single
+    slider table on a 300x300 board is larger than the budget, so evicting
+    per square keeps the squares in use instead of dropping whole tables.
+
+    The cache is shared by the GUI and the analysis thread, so every access to
+    it holds a lock; rays are built outside it."""
+
+    def __init__(self, max_bytes: int = RAY_TABLE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (rays, estimated bytes)
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def get_rays(self, piece_type: str, color: str, board_size: int, pos: Tuple[int, int]):
+        key = (piece_type, color, board_size, pos)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+
+        rays = create_piece(piece_type, color)._build_rays(pos, board_size)
+        size = (RAY_ENTRY_BYTES + RAY_BYTES * len(rays)
+                + RAY_SQUARE_BYTES * sum(len(squares) for squares, _ in rays))
+        if size <= self.max_bytes:
+            with self._lock:
+                # Another thread may have built the same rays meanwhile
+                previous = self._entries.pop(key, None)
+                if previous is not None:
+                    self._total -= previous[1]
+                self._entries[key] = (rays, size)
+                self._total += size
+                while self._total > self.max_bytes:
+                    _, (_, evicted_size) = self._entries.popitem(last=False)
+                    self._total -= evicted_size
+        return rays
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+RAY_TABLES = RayTableCache()
+
+
+# Factory function to create pieces
+def create_piece(piece_type: str, color: str, rank: int = 1) -> Piece:
+    """Create a new piece of the given type and color."""
+    return Piece(piece_type, color, rank)
+
+
+# Dictionary of all available pieces
+AVAILABLE_PIECES = {
+    'White_Pawn':           (PieceType.PAWN, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Knight':         (PieceType.KNIGHT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Bishop':         (PieceType.BISHOP, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Rook':           (PieceType.ROOK, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Queen':          (PieceType.QUEEN, PieceColor.WHITE, PieceRank.OTHER),
+    'White_King':           (PieceType.KING, PieceColor.WHITE, PieceRank.KING),
+    'White_Gold_General':   (PieceType.GOLD_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Silver_General': (PieceType.SILVER_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Shogi_Knight':   (PieceType.SHOGI_KNIGHT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Lance':          (PieceType.LANCE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Shogi_Pawn':     (PieceType.SHOGI_PAWN, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Dragon':         (PieceType.DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Horse':  (PieceType.HORSE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Angry_Boar':     (PieceType.ANGRY_BOAR, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Running_Bear':   (PieceType.RUNNING_BEAR, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Blind_Bear':     (PieceType.BLIND_BEAR, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Beast_Cadet':    (PieceType.BEAST_CADET, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Buddhist_Devil': (PieceType.BUDDHIST_DEVIL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Bear_Soldier':   (PieceType.BEAR_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Bishop_General': (PieceType.BISHOP_GENERAL, PieceColor.WHITE, PieceRank.GENERAL),
+    'White_Blind_Dog':      (PieceType.BLIND_DOG, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Blue_Dragon':    (PieceType.BLUE_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Blind_Monkey':   (PieceType.BLIND_MONKEY, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Burning_Soldier': (PieceType.BURNING_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Beast_Officer':  (PieceType.BEAST_OFFICER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Boar_Soldier':   (PieceType.BOAR_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Blind_Tiger':    (PieceType.BLIND_TIGER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Copper_General': (PieceType.COPPER_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Capricorn':      (PieceType.CAPRICORN, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Chinese_Rooster': (PieceType.CHINESE_ROOSTER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Ceramic_Dove':   (PieceType.CERAMIC_DOVE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Cloud_Eagle':    (PieceType.CLOUD_EAGLE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Chicken_General': (PieceType.CHICKEN_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Chariot_Soldier': (PieceType.CHARIOT_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Stone_Chariot':  (PieceType.STONE_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Flying_Rooster': (PieceType.FLYING_ROOSTER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Cloud_Dragon':   (PieceType.CLOUD_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Climbing_Monkey': (PieceType.CLIMBING_MONKEY, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Center_Standard': (PieceType.CENTER_STANDARD, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Captive_Officer': (PieceType.CAPTIVE_OFFICER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Prince':         (PieceType.PRINCE, PieceColor.WHITE, PieceRank.KING),
+    'White_Copper_Chariot': (PieceType.COPPER_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Cat_Sword':      (PieceType.CAT_SWORD, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Captive_Cadet':  (PieceType.CAPTIVE_CADET, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Dog':            (PieceType.DOG, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Drunken_Elephant': (PieceType.DRUNKEN_ELEPHANT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Roaring_Dog':    (PieceType.ROARING_DOG, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Dragon_Horse':   (PieceType.DRAGON_HORSE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Dragon_King':    (PieceType.DRAGON_KING, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Donkey':         (PieceType.DONKEY, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Fire_Demon':     (PieceType.FIRE_DEMON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Dark_Spirit':    (PieceType.DARK_SPIRIT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Deva':           (PieceType.DEVA, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Earth_General':  (PieceType.EARTH_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Enchanted_Badger': (PieceType.ENCHANTED_BADGER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Earth_Chariot':  (PieceType.EARTH_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Earth_Dragon':   (PieceType.EARTH_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Fierce_Eagle':   (PieceType.FIERCE_EAGLE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Soaring_Eagle':  (PieceType.SOARING_EAGLE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Eastern_Barbarian': (PieceType.EASTERN_BARBARIAN, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Evil_Wolf':      (PieceType.EVIL_WOLF, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Fire_General':   (PieceType.FIRE_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Flying_Cat':     (PieceType.FLYING_CAT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Flying_Dragon':  (PieceType.FLYING_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Eagle':     (PieceType.FREE_EAGLE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Fragrant_Elephant': (PieceType.FRAGRANT_ELEPHANT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Flying_Horse':    (PieceType.FLYING_HORSE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Fire_Dragon':     (PieceType.FIRE_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Ferocious_Leopard': (PieceType.FEROCIOUS_LEOPARD, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Forest_Demon':   (PieceType.FOREST_DEMON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Pup':       (PieceType.FREE_PUP, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Demon':     (PieceType.FREE_DEMON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Flying_Swallow': (PieceType.FLYING_SWALLOW, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Dream_Eater': (PieceType.FREE_DREAM_EATER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Flying_Goose':    (PieceType.FLYING_GOOSE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Go_Between':      (PieceType.GO_BETWEEN, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Gold_Chariot':   (PieceType.GOLD_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Great_Dragon':   (PieceType.GREAT_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Great_Standard':  (PieceType.GREAT_STANDARD, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Great_General':   (PieceType.GREAT_GENERAL, PieceColor.WHITE, PieceRank.GREAT_GENERAL),
+    'White_Golden_Deer':    (PieceType.GOLDEN_DEER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Great_Master':   (PieceType.GREAT_MASTER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Wood_General':   (PieceType.WOOD_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Golden_Bird':    (PieceType.GOLDEN_BIRD, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Great_Dove':     (PieceType.GREAT_DOVE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Great_Stag':     (PieceType.GREAT_STAG, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Great_Turtle':   (PieceType.GREAT_TURTLE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Guardian_Of_The_Gods': (PieceType.GUARDIAN_OF_THE_GODS, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Horse_General':  (PieceType.HORSE_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Howling_Dog':    (PieceType.HOWLING_DOG, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Rams_Head_Soldier': (PieceType.RAMS_HEAD_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Horned_Falcon':  (PieceType.HORNFED_FALCON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Hook_Mover':     (PieceType.HOOK_MOVER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Horseman':       (PieceType.HORSEMAN, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Running_Horse':  (PieceType.RUNNING_HORSE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Horse_Soldier':  (PieceType.HORSE_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Iron_General':   (PieceType.IRON_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Shogi_King':     (PieceType.SHOGI_KING, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Kirin_Master':   (PieceType.KIRIN_MASTER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Kirin':          (PieceType.KIRIN, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Longbow_Soldier': (PieceType.LONGBOW_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Left_Chariot':   (PieceType.LEFT_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Lion_Dog':       (PieceType.LION_DOG, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Left_Dragon':    (PieceType.LEFT_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Left_General':   (PieceType.LEFT_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Liberated_Horse': (PieceType.LIBERATED_HORSE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Lion_Hawk':      (PieceType.LION_HAWK, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Little_Turtle':  (PieceType.LITTLE_TURTLE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Lion':           (PieceType.LION, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Long_Nosed_Goblin': (PieceType.LONG_NOSED_GOBLIN, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Leopard_Soldier': (PieceType.LEOPARD_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Little_Standard': (PieceType.LITTLE_STANDARD, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Left_Tiger':     (PieceType.LEFT_TIGER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Mountain_General': (PieceType.MOUNTAIN_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Mountain_Falcon': (PieceType.MOUNTAIN_FALCON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Side_Monkey':    (PieceType.SIDE_MONKEY, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Left_Mountain_Eagle': (PieceType.LEFT_MOUNTAIN_EAGLE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Right_Mountain_Eagle': (PieceType.RIGHT_MOUNTAIN_EAGLE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Mountain_Stag':  (PieceType.MOUNTAIN_STAG, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Center_Master': (PieceType.CENTER_MASTER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Northern_Barbarian': (PieceType.NORTHERN_BARBARIAN, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Neighboring_King': (PieceType.NEIGHBORING_KING, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Violent_Wolf': (PieceType.VIOLENT_WOLF, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Ox_General': (PieceType.OX_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Oxcart': (PieceType.OXCART, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Old_Kite': (PieceType.OLD_KITE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Old_Monkey': (PieceType.OLD_MONKEY, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Old_Rat': (PieceType.OLD_RAT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Ox_Soldier': (PieceType.OX_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Swooping_Owl': (PieceType.SWOOPING_OWL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Flying_Ox': (PieceType.FLYING_OX, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Peacock': (PieceType.PEACOCK, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Pup_General': (PieceType.PUP_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Phoenix': (PieceType.PHOENIX, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Pig_General': (PieceType.PIG_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Phoenix_Master': (PieceType.PHOENIX_MASTER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Prancing_Stag': (PieceType.PRANCING_STAG, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Poisonous_Snake': (PieceType.POISONOUS_SNAKE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Rain_Dragon': (PieceType.RAIN_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Rushing_Bird': (PieceType.RUSHING_BIRD, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Right_Chariot': (PieceType.RIGHT_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Reclining_Dragon': (PieceType.RECLINING_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_River_General': (PieceType.RIVER_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Right_General': (PieceType.RIGHT_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Running_Chariot': (PieceType.RUNNING_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Right_Dragon': (PieceType.RIGHT_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Roc_Master': (PieceType.ROC_MASTER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Running_Stag': (PieceType.RUNNING_STAG, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Rook_General': (PieceType.ROOK_GENERAL, PieceColor.WHITE, PieceRank.GENERAL),
+    'White_Running_Pup': (PieceType.RUNNING_PUP, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Running_Rabbit': (PieceType.RUNNING_RABBIT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Rear_Standard': (PieceType.REAR_STANDARD, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Running_Tiger': (PieceType.RUNNING_TIGER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Running_Serpent': (PieceType.RUNNING_SERPENT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Reverse_Chariot': (PieceType.REVERSE_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Running_Wolf': (PieceType.RUNNING_WOLF, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Side_Boar': (PieceType.SIDE_BOAR, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Crossbow_Soldier': (PieceType.CROSSBOW_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Front_Standard': (PieceType.FRONT_STANDARD, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Sword_Soldier': (PieceType.SWORD_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Side_Flyer': (PieceType.SIDE_FLYER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Stone_General': (PieceType.STONE_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Side_Dragon': (PieceType.SIDE_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Side_Soldier': (PieceType.SIDE_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Side_Mover': (PieceType.SIDE_MOVER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Coiled_Serpent': (PieceType.COILED_SERPENT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Soldier': (PieceType.SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Spear_Soldier': (PieceType.SPEAR_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Square_Mover': (PieceType.SQUARE_MOVER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Silver_Rabbit': (PieceType.SILVER_RABBIT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Side_Serpent': (PieceType.SIDE_SERPENT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Strutting_Crow': (PieceType.STRUTTING_CROW, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Southern_Barbarian': (PieceType.SOUTHERN_BARBARIAN, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Silver_Chariot': (PieceType.SILVER_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Swallows_Wings': (PieceType.SWALLOWS_WINGS, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Side_Ox': (PieceType.SIDE_OX, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Tile_General': (PieceType.TILE_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Tile_Chariot': (PieceType.TILE_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Turtle_Dove': (PieceType.TURTLE_DOVE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Treacherous_Fox': (PieceType.TREACHEROUS_FOX, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Savage_Tiger': (PieceType.SAVAGE_TIGER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Turtle_Snake': (PieceType.TURTLE_SNAKE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Right_Tiger': (PieceType.RIGHT_TIGER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Violent_Bear': (PieceType.VIOLENT_BEAR, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Violent_Dragon': (PieceType.VIOLENT_DRAGON, PieceColor.WHITE, PieceRank.GENERAL),
+    'White_Vertical_Bear': (PieceType.VERTICAL_BEAR, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Vice_General': (PieceType.VICE_GENERAL, PieceColor.WHITE, PieceRank.VICE_GENERAL),
+    'White_Vertical_Horse': (PieceType.VERTICAL_HORSE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Vermilion_Sparrow': (PieceType.VERMILION_SPARROW, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Vertical_Leopard': (PieceType.VERTICAL_LEOPARD, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Vertical_Mover': (PieceType.VERTICAL_MOVER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Violent_Ox': (PieceType.VIOLENT_OX, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Vertical_Pup': (PieceType.VERTICAL_PUP, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Vertical_Soldier': (PieceType.VERTICAL_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Violent_Stag': (PieceType.VIOLENT_STAG, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Vertical_Tiger': (PieceType.VERTICAL_TIGER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Vertical_Wolf': (PieceType.VERTICAL_WOLF, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Whale': (PieceType.WHALE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Water_Dragon': (PieceType.WATER_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Water_Buffalo': (PieceType.WATER_BUFFALO, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Wood_Chariot': (PieceType.WOOD_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Wind_Dragon': (PieceType.WIND_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_White_Elephant': (PieceType.WHITE_ELEPHANT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Side_Wolf': (PieceType.SIDE_WOLF, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Water_General': (PieceType.WATER_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_White_Horse': (PieceType.WHITE_HORSE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Woodland_Demon': (PieceType.WOODLAND_DEMON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Wind_General': (PieceType.WIND_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Wooden_Dove': (PieceType.WOODEN_DOVE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Wrestler': (PieceType.WRESTLER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Western_Barbarian': (PieceType.WESTERN_BARBARIAN, PieceColor.WHITE, PieceRank.OTHER),
+    'White_White_Tiger': (PieceType.WHITE_TIGER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Yaksha': (PieceType.YAKSHA, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Right_Army': (PieceType.RIGHT_ARMY, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Left_Army': (PieceType.LEFT_ARMY, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Fire': (PieceType.FREE_FIRE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Great_Whale': (PieceType.GREAT_WHALE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Divine_Tiger': (PieceType.DIVINE_TIGER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Divine_Turtle': (PieceType.DIVINE_TURTLE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Elephant_King': (PieceType.ELEPHANT_KING, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Captive_Bird': (PieceType.CAPTIVE_BIRD, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Thunder_Runner': (PieceType.THUNDER_RUNNER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Leopard': (PieceType.FREE_LEOPARD, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Serpent': (PieceType.FREE_SERPENT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Tiger': (PieceType.FREE_TIGER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Bear': (PieceType.FREE_BEAR, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Heavenly_Tetrarch': (PieceType.HEAVENLY_TETRARCH, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Playful_Cockatoo': (PieceType.PLAYFUL_COCKATOO, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Running_Dragon': (PieceType.RUNNING_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Stag': (PieceType.FREE_STAG, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Wolf': (PieceType.FREE_WOLF, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Rain_Demon': (PieceType.RAIN_DEMON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Flying_Crocodile': (PieceType.FLYING_CROCODILE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Beast_Bird': (PieceType.BEAST_BIRD, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Dragon': (PieceType.FREE_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Dog': (PieceType.FREE_DOG, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Goose_Wing': (PieceType.GOOSE_WING, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Pig': (PieceType.FREE_PIG, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Chicken': (PieceType.FREE_CHICKEN, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Horse': (PieceType.FREE_HORSE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Ox': (PieceType.FREE_OX, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Boar': (PieceType.FREE_BOAR, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Furious_Fiend': (PieceType.FURIOUS_FIEND, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Free_Bird': (PieceType.FREE_BIRD, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Right_Phoenix': (PieceType.RIGHT_PHOENIX, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Walking_Heron': (PieceType.WALKING_HERON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Strong_Eagle': (PieceType.STRONG_EAGLE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Copper_Elephant': (PieceType.COPPER_ELEPHANT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Burning_Chariot': (PieceType.BURNING_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Tiger_Soldier': (PieceType.TIGER_SOLDIER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Ancient_Dragon': (PieceType.ANCIENT_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Buddhist_Spirit': (PieceType.BUDDHIST_SPIRIT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Teaching_King': (PieceType.TEACHING_KING, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Wind_Snapping_Turtle': (PieceType.WIND_SNAPPING_TURTLE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Great_Horse': (PieceType.GREAT_HORSE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Left_Dog': (PieceType.LEFT_DOG, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Right_Dog': (PieceType.RIGHT_DOG, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Great_Dream_Eater': (PieceType.GREAT_DREAM_EATER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Flying_Falcon': (PieceType.FLYING_FALCON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Treasure_Turtle': (PieceType.TREASURE_TURTLE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Spirit_Turtle': (PieceType.SPIRIT_TURTLE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Running_Tile': (PieceType.RUNNING_TILE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Great_Bear': (PieceType.GREAT_BEAR, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Venomous_Wolf': (PieceType.VENOMOUS_WOLF, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Heavenly_Horse': (PieceType.HEAVENLY_HORSE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Raiding_Falcon': (PieceType.RAIDING_FALCON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Mountain_Witch': (PieceType.MOUNTAIN_WITCH, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Wizard_Stork': (PieceType.WIZARD_STORK, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Rushing_Boar': (PieceType.RUSHING_BOAR, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Bears_Eyes': (PieceType.BEARS_EYES, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Mountain_Crane': (PieceType.MOUNTIAN_CRANE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Young_Bird': (PieceType.YOUNG_BIRD, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Divine_Sparrow': (PieceType.DIVINE_SPARROW, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Divine_Dragon': (PieceType.DIVINE_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Cavalier': (PieceType.CAVALIER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Gliding_Sparrow': (PieceType.GLIDING_SPARROW, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Flying_Stag': (PieceType.FLYING_STAG, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Plooding_Ox': (PieceType.PLODDING_OX, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Bird_of_Paradise': (PieceType.BIRD_OF_PARADISE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Strong_Chariot': (PieceType.STRONG_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Coiled_Dragon': (PieceType.COILED_DRAGON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Heavenly_Tetrarch_King': (PieceType.HEAVENLY_TETRARCH_KING, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Violent_Wind': (PieceType.VIOLENT_WIND, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Chinese_River': (PieceType.CHINESE_RIVER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Peaceful_Mountain': (PieceType.PEACEFUL_MOUNTAIN, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Running_Ox': (PieceType.RUNNING_OX, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Running_Boar': (PieceType.RUNNING_BOAR, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Running_Leopard': (PieceType.RUNNING_LEOPARD, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Strong_Bear': (PieceType.STRONG_BEAR, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Right_Iron_Chariot': (PieceType.RIGHT_IRON_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Left_Iron_Chariot': (PieceType.LEFT_IRON_CHARIOT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Fire_Ox': (PieceType.FIRE_OX, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Longbow_General': (PieceType.LONGBOW_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Leopard_King': (PieceType.LEOPARD_KING, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Burning_General': (PieceType.BURNING_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Sword_General': (PieceType.SWORD_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Great_Falcon': (PieceType.GREAT_FALCON, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Great_Eagle': (PieceType.GREAT_EAGLE, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Spear_General': (PieceType.SPEAR_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Great_Leopard': (PieceType.GREAT_LEOPARD, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Great_Tiger': (PieceType.GREAT_TIGER, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Crossbow_General': (PieceType.CROSSBOW_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Great_Elephant': (PieceType.GREAT_ELEPHANT, PieceColor.WHITE, PieceRank.OTHER),
+    'White_Multi_General': (PieceType.MULTI_GENERAL, PieceColor.WHITE, PieceRank.OTHER),
+
+    'Black_Pawn':           (PieceType.PAWN, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Knight':         (PieceType.KNIGHT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Bishop':         (PieceType.BISHOP, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Rook':           (PieceType.ROOK, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Queen':          (PieceType.QUEEN, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_King':           (PieceType.KING, PieceColor.BLACK, PieceRank.KING),
+    'Black_Gold_General':   (PieceType.GOLD_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Silver_General': (PieceType.SILVER_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Shogi_Knight':   (PieceType.SHOGI_KNIGHT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Lance':          (PieceType.LANCE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Shogi_Pawn':     (PieceType.SHOGI_PAWN, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Dragon':         (PieceType.DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Horse':          (PieceType.HORSE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Angry_Boar':     (PieceType.ANGRY_BOAR, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Running_Bear':   (PieceType.RUNNING_BEAR, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Blind_Bear':     (PieceType.BLIND_BEAR, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Beast_Cadet':    (PieceType.BEAST_CADET, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Buddhist_Devil': (PieceType.BUDDHIST_DEVIL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Bear_Soldier':   (PieceType.BEAR_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Bishop_General': (PieceType.BISHOP_GENERAL, PieceColor.BLACK, PieceRank.GENERAL),
+    'Black_Blind_Dog':      (PieceType.BLIND_DOG, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Blue_Dragon':    (PieceType.BLUE_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Blind_Monkey':   (PieceType.BLIND_MONKEY, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Burning_Soldier': (PieceType.BURNING_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Beast_Officer':  (PieceType.BEAST_OFFICER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Boar_Soldier':   (PieceType.BOAR_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Blind_Tiger':    (PieceType.BLIND_TIGER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Copper_General': (PieceType.COPPER_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Capricorn':      (PieceType.CAPRICORN, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Chinese_Rooster': (PieceType.CHINESE_ROOSTER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Ceramic_Dove':   (PieceType.CERAMIC_DOVE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Cloud_Eagle':    (PieceType.CLOUD_EAGLE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Chicken_General': (PieceType.CHICKEN_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Chariot_Soldier': (PieceType.CHARIOT_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Stone_Chariot':  (PieceType.STONE_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Flying_Rooster': (PieceType.FLYING_ROOSTER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Cloud_Dragon':   (PieceType.CLOUD_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Climbing_Monkey': (PieceType.CLIMBING_MONKEY, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Center_Standard': (PieceType.CENTER_STANDARD, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Captive_Officer': (PieceType.CAPTIVE_OFFICER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Prince':         (PieceType.PRINCE, PieceColor.BLACK, PieceRank.KING),
+    'Black_Copper_Chariot': (PieceType.COPPER_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Cat_Sword':      (PieceType.CAT_SWORD, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Captive_Cadet':  (PieceType.CAPTIVE_CADET, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Dog':            (PieceType.DOG, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Drunken_Elephant': (PieceType.DRUNKEN_ELEPHANT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Roaring_Dog':    (PieceType.ROARING_DOG, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Dragon_Horse':   (PieceType.DRAGON_HORSE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Dragon_King':    (PieceType.DRAGON_KING, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Donkey':         (PieceType.DONKEY, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Fire_Demon':     (PieceType.FIRE_DEMON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Dark_Spirit':    (PieceType.DARK_SPIRIT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Deva':           (PieceType.DEVA, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Earth_General':  (PieceType.EARTH_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Enchanted_Badger': (PieceType.ENCHANTED_BADGER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Earth_Chariot':  (PieceType.EARTH_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Earth_Dragon':   (PieceType.EARTH_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Fierce_Eagle':   (PieceType.FIERCE_EAGLE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Soaring_Eagle':  (PieceType.SOARING_EAGLE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Eastern_Barbarian': (PieceType.EASTERN_BARBARIAN, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Evil_Wolf':      (PieceType.EVIL_WOLF, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Fire_General':   (PieceType.FIRE_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Flying_Cat':     (PieceType.FLYING_CAT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Flying_Dragon':  (PieceType.FLYING_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Eagle':     (PieceType.FREE_EAGLE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Fragrant_Elephant': (PieceType.FRAGRANT_ELEPHANT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Flying_Horse':    (PieceType.FLYING_HORSE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Fire_Dragon':     (PieceType.FIRE_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Ferocious_Leopard': (PieceType.FEROCIOUS_LEOPARD, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Forest_Demon':   (PieceType.FOREST_DEMON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Pup':       (PieceType.FREE_PUP, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Demon':     (PieceType.FREE_DEMON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Flying_Swallow': (PieceType.FLYING_SWALLOW, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Dream_Eater': (PieceType.FREE_DREAM_EATER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Flying_Goose':    (PieceType.FLYING_GOOSE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Go_Between':      (PieceType.GO_BETWEEN, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Gold_Chariot':   (PieceType.GOLD_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Great_Dragon':   (PieceType.GREAT_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Great_Standard':  (PieceType.GREAT_STANDARD, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Great_General':   (PieceType.GREAT_GENERAL, PieceColor.BLACK, PieceRank.GREAT_GENERAL),
+    'Black_Golden_Deer':    (PieceType.GOLDEN_DEER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Great_Master':   (PieceType.GREAT_MASTER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Wood_General':   (PieceType.WOOD_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Golden_Bird':    (PieceType.GOLDEN_BIRD, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Great_Dove':     (PieceType.GREAT_DOVE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Great_Stag':     (PieceType.GREAT_STAG, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Great_Turtle':   (PieceType.GREAT_TURTLE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Guardian_Of_The_Gods': (PieceType.GUARDIAN_OF_THE_GODS, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Horse_General':  (PieceType.HORSE_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Howling_Dog':    (PieceType.HOWLING_DOG, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Rams_Head_Soldier': (PieceType.RAMS_HEAD_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Horned_Falcon':  (PieceType.HORNFED_FALCON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Hook_Mover':     (PieceType.HOOK_MOVER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Horseman':       (PieceType.HORSEMAN, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Running_Horse':  (PieceType.RUNNING_HORSE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Horse_Soldier':  (PieceType.HORSE_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Iron_General':   (PieceType.IRON_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Shogi_King':     (PieceType.SHOGI_KING, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Kirin_Master':   (PieceType.KIRIN_MASTER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Kirin':          (PieceType.KIRIN, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Longbow_Soldier': (PieceType.LONGBOW_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Left_Chariot':   (PieceType.LEFT_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Lion_Dog':       (PieceType.LION_DOG, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Left_Dragon':    (PieceType.LEFT_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Left_General':   (PieceType.LEFT_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Liberated_Horse': (PieceType.LIBERATED_HORSE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Lion_Hawk':      (PieceType.LION_HAWK, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Little_Turtle':  (PieceType.LITTLE_TURTLE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Lion':           (PieceType.LION, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Long_Nosed_Goblin': (PieceType.LONG_NOSED_GOBLIN, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Leopard_Soldier': (PieceType.LEOPARD_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Little_Standard': (PieceType.LITTLE_STANDARD, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Left_Tiger':     (PieceType.LEFT_TIGER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Mountain_General': (PieceType.MOUNTAIN_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Mountain_Falcon': (PieceType.MOUNTAIN_FALCON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Side_Monkey':    (PieceType.SIDE_MONKEY, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Left_Mountain_Eagle': (PieceType.LEFT_MOUNTAIN_EAGLE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Right_Mountain_Eagle': (PieceType.RIGHT_MOUNTAIN_EAGLE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Mountain_Stag':  (PieceType.MOUNTAIN_STAG, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Center_Master': (PieceType.CENTER_MASTER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Northern_Barbarian': (PieceType.NORTHERN_BARBARIAN, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Neighboring_King': (PieceType.NEIGHBORING_KING, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Violent_Wolf': (PieceType.VIOLENT_WOLF, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Ox_General': (PieceType.OX_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Oxcart': (PieceType.OXCART, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Old_Kite': (PieceType.OLD_KITE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Old_Monkey': (PieceType.OLD_MONKEY, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Old_Rat': (PieceType.OLD_RAT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Ox_Soldier': (PieceType.OX_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Swooping_Owl': (PieceType.SWOOPING_OWL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Flying_Ox': (PieceType.FLYING_OX, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Peacock': (PieceType.PEACOCK, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Pup_General': (PieceType.PUP_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Phoenix': (PieceType.PHOENIX, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Pig_General': (PieceType.PIG_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Phoenix_Master': (PieceType.PHOENIX_MASTER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Prancing_Stag': (PieceType.PRANCING_STAG, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Poisonous_Snake': (PieceType.POISONOUS_SNAKE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Rain_Dragon': (PieceType.RAIN_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Rushing_Bird': (PieceType.RUSHING_BIRD, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Right_Chariot': (PieceType.RIGHT_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Reclining_Dragon': (PieceType.RECLINING_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_River_General': (PieceType.RIVER_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Right_General': (PieceType.RIGHT_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Running_Chariot': (PieceType.RUNNING_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Right_Dragon': (PieceType.RIGHT_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Roc_Master': (PieceType.ROC_MASTER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Running_Stag': (PieceType.RUNNING_STAG, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Rook_General': (PieceType.ROOK_GENERAL, PieceColor.BLACK, PieceRank.GENERAL),
+    'Black_Running_Pup': (PieceType.RUNNING_PUP, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Running_Rabbit': (PieceType.RUNNING_RABBIT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Rear_Standard': (PieceType.REAR_STANDARD, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Running_Tiger': (PieceType.RUNNING_TIGER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Running_Serpent': (PieceType.RUNNING_SERPENT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Reverse_Chariot': (PieceType.REVERSE_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Running_Wolf': (PieceType.RUNNING_WOLF, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Side_Boar': (PieceType.SIDE_BOAR, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Crossbow_Soldier': (PieceType.CROSSBOW_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Front_Standard': (PieceType.FRONT_STANDARD, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Sword_Soldier': (PieceType.SWORD_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Side_Flyer': (PieceType.SIDE_FLYER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Stone_General': (PieceType.STONE_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Side_Dragon': (PieceType.SIDE_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Side_Soldier': (PieceType.SIDE_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Side_Mover': (PieceType.SIDE_MOVER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Coiled_Serpent': (PieceType.COILED_SERPENT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Soldier': (PieceType.SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Spear_Soldier': (PieceType.SPEAR_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Square_Mover': (PieceType.SQUARE_MOVER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Silver_Rabbit': (PieceType.SILVER_RABBIT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Side_Serpent': (PieceType.SIDE_SERPENT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Strutting_Crow': (PieceType.STRUTTING_CROW, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Southern_Barbarian': (PieceType.SOUTHERN_BARBARIAN, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Silver_Chariot': (PieceType.SILVER_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Swallows_Wings': (PieceType.SWALLOWS_WINGS, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Side_Ox': (PieceType.SIDE_OX, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Tile_General': (PieceType.TILE_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Tile_Chariot': (PieceType.TILE_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Turtle_Dove': (PieceType.TURTLE_DOVE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Treacherous_Fox': (PieceType.TREACHEROUS_FOX, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Savage_Tiger': (PieceType.SAVAGE_TIGER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Turtle_Snake': (PieceType.TURTLE_SNAKE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Right_Tiger': (PieceType.RIGHT_TIGER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Violent_Bear': (PieceType.VIOLENT_BEAR, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Violent_Dragon': (PieceType.VIOLENT_DRAGON, PieceColor.BLACK, PieceRank.GENERAL),
+    'Black_Vertical_Bear': (PieceType.VERTICAL_BEAR, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Vice_General': (PieceType.VICE_GENERAL, PieceColor.BLACK, PieceRank.VICE_GENERAL),
+    'Black_Vertical_Horse': (PieceType.VERTICAL_HORSE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Vermillion_Sparrow': (PieceType.VERMILION_SPARROW, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Vertical_Leopard': (PieceType.VERTICAL_LEOPARD, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Vertical_Mover': (PieceType.VERTICAL_MOVER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Violent_Ox': (PieceType.VIOLENT_OX, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Vertical_Pup': (PieceType.VERTICAL_PUP, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Vertical_Soldier': (PieceType.VERTICAL_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Violent_Stag': (PieceType.VIOLENT_STAG, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Vertical_Tiger': (PieceType.VERTICAL_TIGER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Vertical_Wolf': (PieceType.VERTICAL_WOLF, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Whale': (PieceType.WHALE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Water_Dragon': (PieceType.WATER_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Water_Buffalo': (PieceType.WATER_BUFFALO, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Wood_Chariot': (PieceType.WOOD_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Wind_Dragon': (PieceType.WIND_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_White_Elephant': (PieceType.WHITE_ELEPHANT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Side_Wolf': (PieceType.SIDE_WOLF, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Water_General': (PieceType.WATER_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_White_Horse': (PieceType.WHITE_HORSE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Woodland_Demon': (PieceType.WOODLAND_DEMON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Wind_General': (PieceType.WIND_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Wooden_Dove': (PieceType.WOODEN_DOVE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Wrestler': (PieceType.WRESTLER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Western_Barbarian': (PieceType.WESTERN_BARBARIAN, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_White_Tiger': (PieceType.WHITE_TIGER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Yaksha': (PieceType.YAKSHA, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Right_Army': (PieceType.RIGHT_ARMY, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Left_Army': (PieceType.LEFT_ARMY, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Fire': (PieceType.FREE_FIRE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Great_Whale': (PieceType.GREAT_WHALE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Divine_Tiger': (PieceType.DIVINE_TIGER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Divine_Turtle': (PieceType.DIVINE_TURTLE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Elephant_King': (PieceType.ELEPHANT_KING, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Captive_Bird': (PieceType.CAPTIVE_BIRD, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Thunder_Runner': (PieceType.THUNDER_RUNNER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Leopard': (PieceType.FREE_LEOPARD, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Serpent': (PieceType.FREE_SERPENT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Tiger': (PieceType.FREE_TIGER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Bear': (PieceType.FREE_BEAR, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Heavenly_Tetrarch': (PieceType.HEAVENLY_TETRARCH, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Playful_Cockatoo': (PieceType.PLAYFUL_COCKATOO, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Running_Dragon': (PieceType.RUNNING_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Stag': (PieceType.FREE_STAG, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Wolf': (PieceType.FREE_WOLF, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Rain_Demon': (PieceType.RAIN_DEMON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Flying_Crocodile': (PieceType.FLYING_CROCODILE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Beast_Bird': (PieceType.BEAST_BIRD, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Dragon': (PieceType.FREE_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Dog': (PieceType.FREE_DOG, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Goose_Wing': (PieceType.GOOSE_WING, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Pig': (PieceType.FREE_PIG, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Chicken': (PieceType.FREE_CHICKEN, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Horse': (PieceType.FREE_HORSE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Ox': (PieceType.FREE_OX, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Boar': (PieceType.FREE_BOAR, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Furious_Fiend': (PieceType.FURIOUS_FIEND, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Free_Bird': (PieceType.FREE_BIRD, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Right_Phoenix': (PieceType.RIGHT_PHOENIX, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Walking_Heron': (PieceType.WALKING_HERON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Strong_Eagle': (PieceType.STRONG_EAGLE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Copper_Elephant': (PieceType.COPPER_ELEPHANT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Burning_Chariot': (PieceType.BURNING_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Tiger_Soldier': (PieceType.TIGER_SOLDIER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Ancient_Dragon': (PieceType.ANCIENT_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Buddhist_Spirit': (PieceType.BUDDHIST_SPIRIT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Teaching_King': (PieceType.TEACHING_KING, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Wind_Snapping_Turtle': (PieceType.WIND_SNAPPING_TURTLE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Great_Horse': (PieceType.GREAT_HORSE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Left_Dog': (PieceType.LEFT_DOG, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Right_Dog': (PieceType.RIGHT_DOG, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Great_Dream_Eater': (PieceType.GREAT_DREAM_EATER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Flying_Falcon': (PieceType.FLYING_FALCON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Treasure_Turtle': (PieceType.TREASURE_TURTLE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Spirit_Turtle': (PieceType.SPIRIT_TURTLE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Running_Tile': (PieceType.RUNNING_TILE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Great_Bear': (PieceType.GREAT_BEAR, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Venomous_Wolf': (PieceType.VENOMOUS_WOLF, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Heavenly_Horse': (PieceType.HEAVENLY_HORSE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Raiding_Falcon': (PieceType.RAIDING_FALCON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Mountain_Witch': (PieceType.MOUNTAIN_WITCH, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Wizard_Stork': (PieceType.WIZARD_STORK, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Rushing_Boar': (PieceType.RUSHING_BOAR, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Bears_Eyes': (PieceType.BEARS_EYES, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Mountain_Crane': (PieceType.MOUNTIAN_CRANE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Young_Bird': (PieceType.YOUNG_BIRD, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Divine_Sparrow': (PieceType.DIVINE_SPARROW, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Divine_Dragon': (PieceType.DIVINE_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Cavalier': (PieceType.CAVALIER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Gliding_Sparrow': (PieceType.GLIDING_SPARROW, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Flying_Stag': (PieceType.FLYING_STAG, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Plooding_Ox': (PieceType.PLODDING_OX, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Bird_of_Paradise': (PieceType.BIRD_OF_PARADISE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Strong_Chariot': (PieceType.STRONG_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Coiled_Dragon': (PieceType.COILED_DRAGON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Heavenly_Tetrarch_King': (PieceType.HEAVENLY_TETRARCH_KING, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Violent_Wind': (PieceType.VIOLENT_WIND, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Chinese_River': (PieceType.CHINESE_RIVER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Peaceful_Mountain': (PieceType.PEACEFUL_MOUNTAIN, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Running_Ox': (PieceType.RUNNING_OX, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Running_Boar': (PieceType.RUNNING_BOAR, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Running_Leopard': (PieceType.RUNNING_LEOPARD, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Strong_Bear': (PieceType.STRONG_BEAR, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Right_Iron_Chariot': (PieceType.RIGHT_IRON_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Left_Iron_Chariot': (PieceType.LEFT_IRON_CHARIOT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Fire_Ox': (PieceType.FIRE_OX, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Longbow_General': (PieceType.LONGBOW_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Leopard_King': (PieceType.LEOPARD_KING, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Burning_General': (PieceType.BURNING_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Sword_General': (PieceType.SWORD_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Great_Falcon': (PieceType.GREAT_FALCON, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Great_Eagle': (PieceType.GREAT_EAGLE, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Spear_General': (PieceType.SPEAR_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Great_Leopard': (PieceType.GREAT_LEOPARD, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Great_Tiger': (PieceType.GREAT_TIGER, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Crossbow_General': (PieceType.CROSSBOW_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Great_Elephant': (PieceType.GREAT_ELEPHANT, PieceColor.BLACK, PieceRank.OTHER),
+    'Black_Multi_General': (PieceType.MULTI_GENERAL, PieceColor.BLACK, PieceRank.OTHER),
+}
+
+ROYAL_PIECES = ['Rook_General', 'Bishop_General', 'Violent_Dragon', 'Flying_Crocodile', 'Vice_General', 'Great_General']
+HOOK_MOVERS = ['Hook_Mover', 'Capricorn', 'Long_Nosed_Goblin', 'Peacock']
+JUMP_MOVERS = ['Roc_Master']
+LIMITED_JUMPING_MOVERS = ['Golden_Bird', 'Free_Bird']
+
+
+def get_piece_rank(piece_key: str) -> int:
+    """Get the numerical rank for a piece key from AVAILABLE_PIECES."""
+    if piece_key in AVAILABLE_PIECES:
+        piece_info = AVAILABLE_PIECES[piece_key]
+        # Convert PieceRank enum to numerical rank
+        rank_enum = piece_info[2]
+        if rank_enum.value == 1:  # KING
+            return 10
+        elif rank_enum.value == 2:  # GREAT_GENERAL
+            return 9
+        elif rank_enum.value == 3:  # VICE_GENERAL
+            return 8
+        elif rank_enum.value == 4:  # GENERAL
+            return 7
+        else:  # OTHER
+            return 1
+    return 1  # Default rank
@@ -0,0 +1,129 @@
+"""
+Frame-time profiler for the chess visualizer.
+
+FrameProfiler keeps a rolling window of per-frame timings for each named
+stage of a frame (event handling, board drawing, legal moves, ...). It can
+draw the p50/p95/max of each stage plus the frame rate as an overlay, and dump
+the recorded frames to CSV or JSONL for offline comparison. Nothing is timed
+while the profiler is disabled.
+"""
+import csv
+import json
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+import pygame
+
+from menus import get_font
+
+PROFILE_WINDOW = 240  # Frames kept per stage
+PROFILE_DUMP_FILE = "frame_profile.jsonl"
+OVERLAY_BACKGROUND = (0, 0, 0, 180)
+OVERLAY_TEXT_COLOR = (255, 255, 255)
+OVERLAY_FONT_SIZE = 20
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty sequence."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class FrameProfiler:
+    def __init__(self, window=PROFILE_WINDOW):
+        self.enabled = False
+        self.frames = deque(maxlen=window)  # {stage: seconds} per finished frame
+        self.frame_starts = deque(maxlen=window)
+        self.stages = []  # Stage names in first-seen order
+        self._current = None
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        if not self.enabled:
+            self._current = None
+
+    def start_frame(self):
+        if self.enabled:
+            self._current = {}
+            self.frame_starts.append(time.perf_counter())
+
+    def end_frame(self):
+        if self._current is not None:
+            self.frames.append(self._current)
+            self._current = None
+
+    def stage(self, name):
+        """Context manager that adds the time spent inside it to a stage of the current frame."""
+        if self._current is None:
+            return nullcontext()
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name, seconds):
+        """Add seconds to a stage of the current frame."""
+        # The frame may have ended or the profiler been turned off meanwhile
+        if self._current is not None:
+            if name not in self.stages:
+                self.stages.append(name)
+            self._current[name] = self._current.get(name, 0.0) + seconds
+
+    def fps(self):
+        if len(self.frame_starts) < 2:
+            return 0.0
+        elapsed = self.frame_starts[-1] - self.frame_starts[0]
+        return (len(self.frame_starts) - 1) / elapsed if elapsed > 0 else 0.0
+
+    def summary(self):
+        """Map each stage to its (p50, p95, max) in milliseconds over the window."""
+        summary = {}
+        for name in self.stages + ['total']:
+            if name == 'total':
+                values = [sum(frame.values()) for frame in self.frames]
+            else:
+                values = [frame.get(name, 0.0) for frame in self.frames]
+            if values:
+                summary[name] = tuple(1000 * value for value in
+                                      (percentile(values, 0.5), percentile(values, 0.95), max(values)))
+        return summary
+
+    def draw(self, screen, pos=(10, 60)):
+        """Draw the timing table; returns the rect it covered."""
+        font = get_font(OVERLAY_FONT_SIZE)
+        lines = [f"FPS {self.fps():6.1f}   frames {len(self.frames)}",
+                 f"{'stage':<12}{'p50':>8}{'p95':>8}{'max':>8}  ms"]
+        for name, (p50, p95, worst) in self.summary().items():
+            lines.append(f"{name:<12}{p50:8.2f}{p95:8.2f}{worst:8.2f}")
+
+        # Rendered fresh every frame: the numbers change too often to be worth caching
+        texts = [font.render(line, True, OVERLAY_TEXT_COLOR) for line in lines]
+        line_height = font.get_linesize()
+        rect = pygame.Rect(pos, (max(text.get_width() for text in texts) + 10,
+                                 line_height * len(texts) + 10))
+        background = pygame.Surface(rect.size, pygame.SRCALPHA)
+        background.fill(OVERLAY_BACKGROUND)
+        screen.blit(background, rect)
+        for i, text in enumerate(texts):
+            screen.blit(text, (rect.x + 5, rect.y + 5 + i * line_height))
+        return rect
+
+    def dump(self, filename=PROFILE_DUMP_FILE):
+        """Write the recorded frames, one row per frame in milliseconds, as CSV or JSONL
+        depending on the file extension."""
+        rows = [{name: round(1000 * frame.get(name, 0.0), 4) for name in self.stages} for frame in self.frames]
+        with open(filename, "w", newline="") as f:
+            if filename.endswith(".csv"):
+                writer = csv.DictWriter(f, fieldnames=self.stages)
+                writer.writeheader()
+                writer.writerows(rows)
+            else:
+                for row in rows:
+                    f.write(json.dumps(row) + "\n")
+        return len(rows)
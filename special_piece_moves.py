@@ -4,6 +4,9 @@ CAPTURE_COLOR = (255, 0, 0, 128)       # Red with alpha for capture squares
 
 def is_path_clear(board, start, end):
     """Check if the path between two squares is clear of pieces."""
+    if not isinstance(board, dict):
+        # Board backends such as BitBoard answer this with mask operations
+        return board.is_path_clear(start, end)
     start_row, start_col = start
     end_row, end_col = end
 
@@ -24,56 +27,84 @@ def is_valid_position(board_size, pos):
     row, col = pos
     return 0 <= row < board_size and 0 <= col < board_size
 
-def jump_moves_filter(board, square, color, moves_with_info):
+def is_unit_ray(square, squares):
+    """Check if a ray advances one square at a time, so its path is the ray itself."""
     start_row, start_col = square
-    ORIGIN_DIRECTION = {}
+    first_row, first_col = squares[0]
+    return abs(first_row - start_row) <= 1 and abs(first_col - start_col) <= 1
+
+def ray_moves_filter(board, square, color, rays):
+    """Filter rays for pieces without special rules, walking each ray once up to its first blocker."""
     filtered_moves = []
-    for move, can_jump in moves_with_info:
-        if isinstance(can_jump, tuple) and can_jump[0] == 'origin':
-            target_board_result = board.get(move)
-            if target_board_result:
-                target_piece_key, _ = target_board_result
-                target_color = target_piece_key.split('_')[0]
-            if target_board_result is None:
-                ORIGIN_DIRECTION[can_jump[1]] = move
+    for squares, can_jump in rays:
+        if not can_jump and not is_unit_ray(square, squares):
+            # Leaps longer than one square still need their own path check
+            for move in squares:
+                target_color = board.color_at(move)
+                if target_color is None:
+                    if is_path_clear(board, square, move):
+                        filtered_moves.append((move, HIGHLIGHT_COLOR))
+                elif target_color != color:
+                    if is_path_clear(board, square, move):
+                        filtered_moves.append((move, CAPTURE_COLOR))
+            continue
+        if not can_jump:
+            # The board backend finds the first blocker (BitBoard with one mask operation)
+            empty_count = board.sliding_targets(square, squares)
+            filtered_moves.extend((move, HIGHLIGHT_COLOR) for move in squares[:empty_count])
+            if empty_count < len(squares) and board.color_at(squares[empty_count]) != color:
+                filtered_moves.append((squares[empty_count], CAPTURE_COLOR))
+            continue
+        for move in squares:
+            target_color = board.color_at(move)
+            if target_color is None:
                 filtered_moves.append((move, HIGHLIGHT_COLOR))
             elif target_color != color:
                 filtered_moves.append((move, CAPTURE_COLOR))
-    for move, can_jump in moves_with_info:
-        if isinstance(can_jump, tuple) and can_jump[0] == 'direction':
-            end_row, end_col = move
-            if can_jump[1] in ORIGIN_DIRECTION.keys():
-                move = (ORIGIN_DIRECTION[can_jump[1]][0] + end_row - start_row, ORIGIN_DIRECTION[can_jump[1]][1] + end_col - start_col)
+    return filtered_moves
+
+def jump_moves_filter(board, square, color, rays):
+    start_row, start_col = square
+    ORIGIN_DIRECTION = {}
+    filtered_moves = []
+    for squares, can_jump in rays:
+        if isinstance(can_jump, tuple) and can_jump[0] == 'origin':
+            for move in squares:
                 target_board_result = board.get(move)
                 if target_board_result:
-                    target_piece_key, _ = target_board_result
-                    target_color = target_piece_key.split('_')[0]
-                else:
-                    target_color = None
+                    target_color = board.color_at(move)
                 if target_board_result is None:
+                    ORIGIN_DIRECTION[can_jump[1]] = move
                     filtered_moves.append((move, HIGHLIGHT_COLOR))
                 elif target_color != color:
                     filtered_moves.append((move, CAPTURE_COLOR))
-                    ORIGIN_DIRECTION.pop(can_jump[1], None)
+    for squares, can_jump in rays:
+        if isinstance(can_jump, tuple) and can_jump[0] == 'direction':
+            for move in squares:
+                end_row, end_col = move
+                if can_jump[1] in ORIGIN_DIRECTION.keys():
+                    move = (ORIGIN_DIRECTION[can_jump[1]][0] + end_row - start_row, ORIGIN_DIRECTION[can_jump[1]][1] + end_col - start_col)
+                    target_board_result = board.get(move)
+                    if target_board_result:
+                        target_color = board.color_at(move)
+                    else:
+                        target_color = None
+                    if target_board_result is None:
+                        filtered_moves.append((move, HIGHLIGHT_COLOR))
+                    elif target_color != color:
+                        filtered_moves.append((move, CAPTURE_COLOR))
+                        ORIGIN_DIRECTION.pop(can_jump[1], None)
+        elif can_jump == True:
+            filtered_moves.extend(ray_moves_filter(board, square, color, [(squares, True)]))
         else:
-            target_board_result = board.get(move)
-            if target_board_result:
-                target_piece_key, _ = target_board_result
-                target_color = target_piece_key.split('_')[0]
-            else:
-                target_color = None
-            if target_board_result is None:
-                # Empty square, check if path is clear or if piece can jump
-                if can_jump == True or is_path_clear(board, square, move):
-                    filtered_moves.append((move, HIGHLIGHT_COLOR))
-
-            elif target_color != color:  # Different color piece
-                if can_jump == True or is_path_clear(board, square, move):
-                    filtered_moves.append((move, CAPTURE_COLOR))
+            # Origin leaps are re-checked here with their path, like any other non-jumping move
+            filtered_moves.extend(ray_moves_filter(board, square, color, [(squares, False)]))
     return filtered_moves
 
 def is_path_clear_for_royal_piece(board, start, end, piece_rank):
     """Check if the path between two squares is clear for Royal pieces, allowing jumps over pieces ranked below."""
+    if not isinstance(board, dict):
+        return board.is_path_clear_for_rank(start, end, piece_rank)
     start_row, start_col = start
     end_row, end_col = end
 
@@ -95,22 +126,25 @@ def is_path_clear_for_royal_piece(board, start, end, piece_rank):
         current_col += col_dir
     return True
 
-def royal_moves_filter(board, square, color, rank, moves_with_info):
-    start_row, start_col = square
+def royal_moves_filter(board, square, color, rank, rays):
     filtered_moves = []
 
-    for move, can_jump in moves_with_info:
-        target_board_result = board.get(move)
-        if target_board_result:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
-        else:
-            target_color = None
-        if is_path_clear_for_royal_piece(board, square, move, rank):
-            if target_board_result is None:
-                filtered_moves.append((move, HIGHLIGHT_COLOR))
-            else:
-                filtered_moves.append((move, CAPTURE_COLOR))
+    for squares, can_jump in rays:
+        unit_ray = is_unit_ray(square, squares)
+        path_clear = True
+        for move in squares:
+            if not unit_ray:
+                path_clear = is_path_clear_for_royal_piece(board, square, move, rank)
+            elif not path_clear:
+                break  # Everything further along is behind a piece this royal cannot pass
+            target_code = board.code_at(move)
+            if path_clear:
+                if not target_code:
+                    filtered_moves.append((move, HIGHLIGHT_COLOR))
+                else:
+                    filtered_moves.append((move, CAPTURE_COLOR))
+            if unit_ray and target_code and board.rank_at(move) >= rank:
+                path_clear = False
     return filtered_moves
 
 def highlight_turned_squares(board, board_size, start, end, color):
@@ -130,8 +164,7 @@ def highlight_turned_squares(board, board_size, start, end, color):
             move = (move[0], move[1] - 1)
             target_board_result = board.get(move) if is_valid_position(board_size, move) else None
         if is_valid_position(board_size, move) and target_board_result is not None:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
+            target_color = board.color_at(move)
             if target_color != color:
                 highlighted_turned_moves.append((move, CAPTURE_COLOR))
         move = (end_row, end_col + 1)
@@ -141,8 +174,7 @@ def highlight_turned_squares(board, board_size, start, end, color):
             move = (move[0], move[1] + 1)
             target_board_result = board.get(move) if is_valid_position(board_size, move) else None
         if is_valid_position(board_size, move) and target_board_result is not None:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
+            target_color = board.color_at(move)
             if target_color != color:
                 highlighted_turned_moves.append((move, CAPTURE_COLOR))
     elif x_delta != 0 and y_delta == 0: # Moving right or left
@@ -153,8 +185,7 @@ def highlight_turned_squares(board, board_size, start, end, color):
             move = (move[0] - 1, move[1])
             target_board_result = board.get(move) if is_valid_position(board_size, move) else None
         if is_valid_position(board_size, move) and target_board_result is not None:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
+            target_color = board.color_at(move)
             if target_color != color:
                 highlighted_turned_moves.append((move, CAPTURE_COLOR))
         move = (end_row + 1, end_col)
@@ -164,8 +195,7 @@ def highlight_turned_squares(board, board_size, start, end, color):
             move = (move[0] + 1, move[1])
             target_board_result = board.get(move) if is_valid_position(board_size, move) else None
         if is_valid_position(board_size, move) and target_board_result is not None:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
+            target_color = board.color_at(move)
             if target_color != color:
                 highlighted_turned_moves.append((move, CAPTURE_COLOR))
     elif (x_delta < 0 and y_delta < 0) or (x_delta > 0 and y_delta > 0): # Moving diagonally
@@ -176,8 +206,7 @@ def highlight_turned_squares(board, board_size, start, end, color):
             move = (move[0] - 1, move[1] + 1)
             target_board_result = board.get(move) if is_valid_position(board_size, move) else None
         if is_valid_position(board_size, move) and target_board_result is not None:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
+            target_color = board.color_at(move)
             if target_color != color:
                 highlighted_turned_moves.append((move, CAPTURE_COLOR))
         move = (end_row + 1, end_col - 1)
@@ -187,8 +216,7 @@ def highlight_turned_squares(board, board_size, start, end, color):
             move = (move[0] + 1, move[1] - 1)
             target_board_result = board.get(move) if is_valid_position(board_size, move) else None
         if is_valid_position(board_size, move) and target_board_result is not None:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
+            target_color = board.color_at(move)
             if target_color != color:
                 highlighted_turned_moves.append((move, CAPTURE_COLOR))
     elif (x_delta < 0 and y_delta > 0) or (x_delta > 0 and y_delta < 0): # Moving diagonally
@@ -199,8 +227,7 @@ def highlight_turned_squares(board, board_size, start, end, color):
             move = (move[0] + 1, move[1] + 1)
             target_board_result = board.get(move) if is_valid_position(board_size, move) else None
         if is_valid_position(board_size, move) and target_board_result is not None:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
+            target_color = board.color_at(move)
             if target_color != color:
                 highlighted_turned_moves.append((move, CAPTURE_COLOR))
         move = (end_row - 1, end_col - 1)
@@ -210,31 +237,34 @@ def highlight_turned_squares(board, board_size, start, end, color):
             move = (move[0] - 1, move[1] - 1)
             target_board_result = board.get(move) if is_valid_position(board_size, move) else None
         if is_valid_position(board_size, move) and target_board_result is not None:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
+            target_color = board.color_at(move)
             if target_color != color:
                 highlighted_turned_moves.append((move, CAPTURE_COLOR))
     return highlighted_turned_moves
 
-def hook_moves_filter(board, board_size, square, color, moves_with_info):
+def hook_moves_filter(board, board_size, square, color, rays):
     filtered_moves = []
 
-    for move, can_jump in moves_with_info:
-        target_board_result = board.get(move)
-        if target_board_result:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
-        else:
-            target_color = None
-        if target_board_result is None:
-            if is_path_clear(board, square, move):
-                filtered_moves.append((move, HIGHLIGHT_COLOR))
-            if can_jump:
-                highlighted_turned_moves = highlight_turned_squares(board, board_size, square, move, color)
-                filtered_moves.extend(highlighted_turned_moves)
-        elif target_color != color:
-            if is_path_clear(board, square, move):
-                filtered_moves.append((move, CAPTURE_COLOR))
+    for squares, can_jump in rays:
+        unit_ray = is_unit_ray(square, squares)
+        path_clear = True
+        for move in squares:
+            if not unit_ray:
+                path_clear = is_path_clear(board, square, move)
+            elif not path_clear and not can_jump:
+                break  # Blocked, and there is no turn to make from further squares
+            target_color = board.color_at(move)
+            if target_color is None:
+                if path_clear:
+                    filtered_moves.append((move, HIGHLIGHT_COLOR))
+                if can_jump:
+                    highlighted_turned_moves = highlight_turned_squares(board, board_size, square, move, color)
+                    filtered_moves.extend(highlighted_turned_moves)
+            else:
+                if target_color != color and path_clear:
+                    filtered_moves.append((move, CAPTURE_COLOR))
+                if unit_ray:
+                    path_clear = False
     return filtered_moves
 
 def highlight_jumpable_squares(board, square, move, color, limit, pieces_jumped_per_direction):
@@ -257,8 +287,7 @@ def highlight_jumpable_squares(board, square, move, color, limit, pieces_jumped_
         if target_board_result is None and pieces_jumped_per_direction[0] <= limit:
             highlighted_jumpable_moves.append((move, HIGHLIGHT_COLOR))
         elif target_board_result is not None and pieces_jumped_per_direction[0] <= limit:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
+            target_color = board.color_at(move)
             pieces_jumped_per_direction[0] += 1
             if target_color != color:
                 highlighted_jumpable_moves.append((move, CAPTURE_COLOR))
@@ -267,8 +296,7 @@ def highlight_jumpable_squares(board, square, move, color, limit, pieces_jumped_
         if target_board_result is None and pieces_jumped_per_direction[1] <= limit:
             highlighted_jumpable_moves.append((move, HIGHLIGHT_COLOR))
         elif target_board_result is not None and pieces_jumped_per_direction[1] <= limit:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
+            target_color = board.color_at(move)
             pieces_jumped_per_direction[1] += 1
             if target_color != color:
                 highlighted_jumpable_moves.append((move, CAPTURE_COLOR))
@@ -276,8 +304,7 @@ def highlight_jumpable_squares(board, square, move, color, limit, pieces_jumped_
         if target_board_result is None and pieces_jumped_per_direction[2] <= limit:
             highlighted_jumpable_moves.append((move, HIGHLIGHT_COLOR))
         elif target_board_result is not None and pieces_jumped_per_direction[2] <= limit:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
+            target_color = board.color_at(move)
             pieces_jumped_per_direction[2] += 1
             if target_color != color:
                 highlighted_jumpable_moves.append((move, CAPTURE_COLOR))
@@ -285,8 +312,7 @@ def highlight_jumpable_squares(board, square, move, color, limit, pieces_jumped_
         if target_board_result is None and pieces_jumped_per_direction[3] <= limit:
             highlighted_jumpable_moves.append((move, HIGHLIGHT_COLOR))
         elif target_board_result is not None and pieces_jumped_per_direction[3] <= limit:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
+            target_color = board.color_at(move)
             pieces_jumped_per_direction[3] += 1
             if target_color != color:
                 highlighted_jumpable_moves.append((move, CAPTURE_COLOR))
@@ -294,8 +320,7 @@ def highlight_jumpable_squares(board, square, move, color, limit, pieces_jumped_
         if target_board_result is None and pieces_jumped_per_direction[4] <= limit:
             highlighted_jumpable_moves.append((move, HIGHLIGHT_COLOR))
         elif target_board_result is not None and pieces_jumped_per_direction[4] <= limit:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
+            target_color = board.color_at(move)
             pieces_jumped_per_direction[4] += 1
             if target_color != color:
                 highlighted_jumpable_moves.append((move, CAPTURE_COLOR))
@@ -303,8 +328,7 @@ def highlight_jumpable_squares(board, square, move, color, limit, pieces_jumped_
         if target_board_result is None and pieces_jumped_per_direction[5] <= limit:
             highlighted_jumpable_moves.append((move, HIGHLIGHT_COLOR))
         elif target_board_result is not None and pieces_jumped_per_direction[5] <= limit:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
+            target_color = board.color_at(move)
             pieces_jumped_per_direction[5] += 1
             if target_color != color:
                 highlighted_jumpable_moves.append((move, CAPTURE_COLOR))
@@ -312,8 +336,7 @@ def highlight_jumpable_squares(board, square, move, color, limit, pieces_jumped_
         if target_board_result is None and pieces_jumped_per_direction[6] <= limit:
             highlighted_jumpable_moves.append((move, HIGHLIGHT_COLOR))
         elif target_board_result is not None and pieces_jumped_per_direction[6] <= limit:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
+            target_color = board.color_at(move)
             pieces_jumped_per_direction[6] += 1
             if target_color != color:
                 highlighted_jumpable_moves.append((move, CAPTURE_COLOR))
@@ -321,32 +344,51 @@ def highlight_jumpable_squares(board, square, move, color, limit, pieces_jumped_
         if target_board_result is None and pieces_jumped_per_direction[7] <= limit:
             highlighted_jumpable_moves.append((move, HIGHLIGHT_COLOR))
         elif target_board_result is not None and pieces_jumped_per_direction[7] <= limit:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
+            target_color = board.color_at(move)
             pieces_jumped_per_direction[7] += 1
             if target_color != color:
                 highlighted_jumpable_moves.append((move, CAPTURE_COLOR))
     return highlighted_jumpable_moves
 
-def limited_jumping_moves_filter(board, square, color, moves_with_info):
+def limited_jumping_moves_filter(board, square, color, rays):
     pieces_jumped_per_direction = [0, 0, 0, 0, 0, 0, 0, 0]
-    start_row, start_col = square
     filtered_moves = []
-    for move, can_jump in moves_with_info:
-        target_board_result = board.get(move)
-        if target_board_result:
-            target_piece_key, _ = target_board_result
-            target_color = target_piece_key.split('_')[0]
-        else:
-            target_color = None
+    for squares, can_jump in rays:
         if isinstance(can_jump, tuple) and can_jump[0] == 'limited_jumping':
-            highlighted_jumpable_moves = highlight_jumpable_squares(board, square, move, color, can_jump[1], pieces_jumped_per_direction)
-            filtered_moves.extend(highlighted_jumpable_moves)
+            for move in squares:
+                highlighted_jumpable_moves = highlight_jumpable_squares(board, square, move, color, can_jump[1], pieces_jumped_per_direction)
+                filtered_moves.extend(highlighted_jumpable_moves)
         else:
-            if target_board_result is None:
-                if can_jump or is_path_clear(square, move):
-                    filtered_moves.append((move, HIGHLIGHT_COLOR))
-            elif target_color != color:
-                if can_jump == True or is_path_clear(square, move):
+            filtered_moves.extend(ray_moves_filter(board, square, color, [(squares, can_jump)]))
+    return filtered_moves
+
+def pawn_moves_filter(board, square, color, rays, en_passant_target=None):
+    """Filter pawn rays: forward moves need empty squares, diagonal moves need a capture or en passant."""
+    filtered_moves = []
+    start_row, start_col = square
+    for squares, _ in rays:
+        for move in squares:
+            target_color = board.color_at(move)
+
+            # Get the direction of movement
+            end_row, end_col = move
+            is_diagonal = start_col != end_col
+
+            if is_diagonal:
+                # Diagonal moves are only valid for captures
+                if target_color is not None and target_color != color:
                     filtered_moves.append((move, CAPTURE_COLOR))
+                # Check for en passant
+                elif en_passant_target == move:
+                    filtered_moves.append((move, CAPTURE_COLOR))
+            else:
+                # Forward moves are only valid for empty squares
+                if target_color is None:
+                    # For two-square moves, check if the middle square is empty
+                    if abs(end_row - start_row) == 2:
+                        intermediate_row = (start_row + end_row) // 2
+                        if (intermediate_row, start_col) not in board:
+                            filtered_moves.append((move, HIGHLIGHT_COLOR))
+                    else:
+                        filtered_moves.append((move, HIGHLIGHT_COLOR))
     return filtered_moves
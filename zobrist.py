@@ -0,0 +1,104 @@
+"""
+Zobrist hashing and a transposition table for board positions.
+
+Instead of a random table per (square, piece) — which would need millions of
+entries for a 300x300 board and every piece code — each key is derived on the
+fly by a 64-bit mixing function (splitmix64) of the square and piece code.
+Keys are deterministic, cover every board size and piece, and only the ones
+in use are kept, in a bounded cache.
+Board keeps the XOR of the keys of its pieces up to date on every change, so
+a position hash costs O(1) per make/unmake.
+"""
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+MASK64 = (1 << 64) - 1
+TRANSPOSITION_TABLE_SIZE = 1 << 20  # Slots, a power of two
+PIECE_KEY_CACHE_BYTES = 64 * 1024 * 1024  # Same budget as the ray tables (pieces.RAY_TABLE_MAX_BYTES)
+PIECE_KEY_BYTES = 280  # Measured with tracemalloc: LRU link, argument tuple and key per entry
+
+# Bound types of a stored search value
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+def mix64(value: int) -> int:
+    """splitmix64 finalizer: spreads any 64-bit value over all 64 bits."""
+    value = (value + 0x9E3779B97F4A7C15) & MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK64
+    return value ^ (value >> 31)
+
+
+@lru_cache(maxsize=PIECE_KEY_CACHE_BYTES // PIECE_KEY_BYTES)  # A cache lookup is cheaper than mixing again
+def piece_key(pos: Tuple[int, int], code: int) -> int:
+    """Key of a piece code (a piece_key and rank) standing on a square."""
+    row, col = pos
+    return mix64((row << 32) | (col << 16) | code)
+
+
+# Keys for the state that is not on the squares; the high bits keep them apart from piece keys
+BLACK_TO_MOVE = mix64(1 << 63)
+
+
+def en_passant_key(target: Optional[Tuple[int, int]]) -> int:
+    if target is None:
+        return 0
+    row, col = target
+    return mix64((1 << 62) | (row << 16) | col)
+
+
+class TTEntry(NamedTuple):
+    key: int  # Full hash, to tell apart positions sharing a slot
+    depth: int
+    value: float
+    bound: int  # EXACT, LOWER_BOUND or UPPER_BOUND
+    best_move: Optional[Tuple[Tuple[int, int], Tuple[int, int]]]
+    generation: int
+
+
+class TranspositionTable:
+    """Fixed number of slots indexed by the low bits of the hash. A slot is replaced when
+    the new entry searched at least as deep, or the stored one is from an older search."""
+
+    def __init__(self, size: int = TRANSPOSITION_TABLE_SIZE):
+        if size & (size - 1):
+            raise ValueError(f"Transposition table size must be a power of two, got {size}")
+        self.size = size
+        self._mask = size - 1
+        self._slots = [None] * size
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def probe(self, key: int) -> Optional[TTEntry]:
+        entry = self._slots[key & self._mask]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, key: int, depth: int, value: float, bound: int = EXACT, best_move=None) -> bool:
+        """Store a search result; returns whether the slot was written."""
+        index = key & self._mask
+        entry = self._slots[index]
+        if entry is not None and entry.key != key and entry.generation == self.generation \
+                and entry.depth > depth:
+            return False
+        self._slots[index] = TTEntry(key, depth, value, bound, best_move, self.generation)
+        return True
+
+    def new_search(self):
+        """Age the stored entries, so the next search may replace them freely."""
+        self.generation += 1
+
+    def clear(self):
+        self._slots = [None] * self.size
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return sum(entry is not None for entry in self._slots)